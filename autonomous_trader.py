@@ -18,19 +18,32 @@ Uniswap V4 swap encoding based on official docs:
 """
 
 import asyncio
+import functools
+import hashlib
 import json
+import multiprocessing
 import os
 import queue
 import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import requests
+import ujson
 from dotenv import load_dotenv
-from eth_abi import encode
+from eth_abi import decode, encode
+from eth_abi.registry import registry as abi_registry
 from eth_account import Account
-from web3 import Web3
+from eth_utils import to_checksum_address
+from numba import njit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebSocketProvider
 
 from config.trading_config import (
     ACTION_SETTLE_ALL,
@@ -41,6 +54,7 @@ from config.trading_config import (
     DEFAULT_STOP_LOSS,
     DEFAULT_TAKE_PROFIT,
     GAS_RESERVE_ETH,
+    MULTICALL3,
     PERMIT2,
     SELL_ALL_FLAG,
     STATE_FILE,
@@ -58,6 +72,35 @@ load_dotenv(Path("/home/sauly/hummingbot/mcp/.env"))
 PRIVATE_KEY = os.getenv("ETHEREUM_PRIVATE_KEY")
 API_SERVER = "http://localhost:4000"
 
+# Etherscan-family APIs, fallback transfer feed for non-Alchemy RPCs
+ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY")
+ETHERSCAN_URLS = {
+    1: "https://api.etherscan.io/api",
+    5: "https://api-goerli.etherscan.io/api",
+    11155111: "https://api-sepolia.etherscan.io/api",
+    10: "https://api-optimistic.etherscan.io/api",
+    420: "https://api-goerli-optimistic.etherscan.io/api",
+    11155420: "https://api-sepolia-optimistic.etherscan.io/api",
+    56: "https://api.bscscan.com/api",
+    97: "https://api-testnet.bscscan.com/api",
+    137: "https://api.polygonscan.com/api",
+    80001: "https://api-testnet.polygonscan.com/api",
+    42161: "https://api.arbiscan.io/api",
+    421613: "https://api-goerli.arbiscan.io/api",
+    421614: "https://api-sepolia.arbiscan.io/api",
+    8453: "https://api.basescan.org/api",
+    84531: "https://api-goerli.basescan.org/api",
+    84532: "https://api-sepolia.basescan.org/api",
+}
+# tokentx query minus address/apikey: newest 100 ERC20 transfers
+ETHERSCAN_TOKENTX_PARAMS = {
+    "module": "account",
+    "action": "tokentx",
+    "sort": "desc",
+    "page": 1,
+    "offset": 100,
+}
+
 # Mainnet pricing (always Ethereum mainnet QuoterV2)
 MAINNET_RPC = os.getenv("MAINNET_RPC_URL")
 MAINNET_QUOTER_V2 = "0x61fFE014bA17989E743c5F6cB21bF9697530B21e"
@@ -71,23 +114,56 @@ TESTNET_CHAINS = {84532, 421614, 11155111}
 # Testnet → Mainnet chain mapping for pricing
 TESTNET_TO_MAINNET = {84532: 8453, 421614: 42161, 11155111: 1}
 
-# V3 Factory ABI — getPool(tokenA, tokenB, fee)
-V3_FACTORY_ABI = [
-    {
-        "inputs": [
-            {"name": "tokenA", "type": "address"},
-            {"name": "tokenB", "type": "address"},
-            {"name": "fee", "type": "uint24"},
-        ],
-        "name": "getPool",
-        "outputs": [{"name": "pool", "type": "address"}],
-        "stateMutability": "view",
-        "type": "function",
-    }
-]
-
 V3_FEE_TIERS = [500, 3000, 10000]
 
+
+def _selector(signature):
+    """4-byte function selector for a canonical Solidity signature."""
+    return bytes(Web3.keccak(text=signature)[:4])
+
+
+# Hot-path view calls are issued as raw eth_calls with these selectors,
+# skipping ContractFunction's per-call ABI resolution and validation.
+# V3 Factory: getPool(tokenA, tokenB, fee) -> address
+GET_POOL_SELECTOR = _selector("getPool(address,address,uint24)")
+# ERC20: balanceOf(owner) -> uint256, decimals() -> uint8, symbol() -> string
+BALANCE_OF_SELECTOR = _selector("balanceOf(address)")
+DECIMALS_SELECTOR = _selector("decimals()")
+SYMBOL_SELECTOR = _selector("symbol()")
+# PoolManager: getSlot0(PoolId) -> (sqrtPriceX96, tick, protocolFee, lpFee)
+# Source: https://docs.uniswap.org/contracts/v4/concepts/pool-manager
+GET_SLOT0_SELECTOR = _selector("getSlot0(bytes32)")
+# UniversalRouter: execute(commands, inputs, deadline)
+# Source: https://docs.uniswap.org/contracts/universal-router/technical-reference
+EXECUTE_SELECTOR = _selector("execute(bytes,bytes[],uint256)")
+
+# V3 Pool: slot0() -> (sqrtPriceX96, tick, ...), token0() -> address.
+# Read together in one Multicall3 aggregate3 call.
+SLOT0_SELECTOR = _selector("slot0()")
+TOKEN0_SELECTOR = _selector("token0()")
+# Multicall3: getBlockNumber() -> uint256, rides along in fused reads
+GET_BLOCK_NUMBER_SELECTOR = _selector("getBlockNumber()")
+
+# V4_SWAP is always SWAP_EXACT_IN_SINGLE + SETTLE_ALL + TAKE_ALL
+V4_COMMANDS_BYTES = bytes([V4_SWAP_COMMAND])
+V4_ACTIONS_BYTES = bytes(
+    [ACTION_SWAP_EXACT_IN_SINGLE, ACTION_SETTLE_ALL, ACTION_TAKE_ALL]
+)
+
+# Swap encoders resolved once; encode([...]) re-parses its type strings
+# on every call. Each takes a tuple of values.
+# ExactInputSingleParams: (PoolKey, zeroForOne, amountIn, amountOutMinimum,
+# hookData), PoolKey: (currency0, currency1, fee, tickSpacing, hooks)
+_SWAP_PARAMS_ENC = abi_registry.get_encoder(
+    "((address,address,uint24,int24,address),bool,uint128,uint128,bytes)"
+)
+# SETTLE_ALL / TAKE_ALL: (currency, amount)
+_CURRENCY_AMOUNT_ENC = abi_registry.get_encoder("(address,uint128)")
+# V4_SWAP input: (actions, params[])
+_V4_INPUT_ENC = abi_registry.get_encoder("(bytes,bytes[])")
+# execute(commands, inputs, deadline) arguments
+_EXECUTE_ARGS_ENC = abi_registry.get_encoder("(bytes,bytes[],uint256)")
+
 QUOTER_ABI = [
     {
         "inputs": [
@@ -184,64 +260,325 @@ PERMIT2_ABI = [
     },
 ]
 
-# UniversalRouter ABI — execute(commands, inputs, deadline)
-# Source: https://docs.uniswap.org/contracts/universal-router/technical-reference
-UNIVERSAL_ROUTER_ABI = [
+# Multicall3 ABI — aggregate3(Call3[]) batches view calls into one eth_call
+# Source: https://github.com/mds1/multicall
+MULTICALL3_ABI = [
     {
         "inputs": [
-            {"name": "commands", "type": "bytes"},
-            {"name": "inputs", "type": "bytes[]"},
-            {"name": "deadline", "type": "uint256"},
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
         ],
-        "name": "execute",
-        "outputs": [],
-        "stateMutability": "payable",
-        "type": "function",
-    }
-]
-
-# PoolManager ABI — getSlot0(PoolId) for on-chain token pricing
-# Source: https://docs.uniswap.org/contracts/v4/concepts/pool-manager
-POOL_MANAGER_ABI = [
-    {
-        "inputs": [{"name": "id", "type": "bytes32"}],
-        "name": "getSlot0",
+        "name": "aggregate3",
         "outputs": [
-            {"name": "sqrtPriceX96", "type": "uint160"},
-            {"name": "tick", "type": "int24"},
-            {"name": "protocolFee", "type": "uint24"},
-            {"name": "lpFee", "type": "uint24"},
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
         ],
-        "stateMutability": "view",
+        "stateMutability": "payable",
         "type": "function",
     }
 ]
 
 # Price cache TTL — how often to re-query pool price per token
 PRICE_CACHE_TTL = 15
+# ...but never beyond this many blocks of the pricing chain: a price can't
+# change within a block, so a bucket of a few blocks is never stale by more
+PRICE_CACHE_BLOCKS = 4
+PRICE_CACHE_MAX = 1024  # entries kept in the per-token price LRU
+
+# Gas params are reused for this many blocks; maxFeePerGas = 2x base fee
+# stays valid through ~6 blocks of maximum (12.5%) base fee increases
+GAS_CACHE_BLOCKS = 5
+
+# Rolling volatility per token, updated from every fresh price read:
+# exponentially weighted mean/variance of percent changes (alpha ~ 1/T)
+VOL_EWMA_ALPHA = 0.25
+VOL_MIN_SAMPLES = 5  # below this, entry falls back to block-history sampling
+# Blocks of price history behind that fallback. A short window tracks
+# regime changes in TP/SL bands better than a long smoothed one.
+VOL_SAMPLE_BLOCKS = 5
+
+# How long a STOP/SELL_ALL flag-file check is reused before re-stat'ing
+FLAG_CHECK_TTL = 1.0
+
+# Position changes are journaled to STATE_JOURNAL_FILE as they happen;
+# the full STATE_FILE snapshot is rewritten at most this often
+STATE_JOURNAL_FILE = f"{STATE_FILE}.log"
+STATE_SNAPSHOT_INTERVAL = 5  # seconds
+STATE_SNAPSHOT_OPS = 50
+# State and wallet files are polled by the API server; write them compact
+# unless PRETTY_STATE_JSON is set for hand inspection
+STATE_JSON_INDENT = 2 if os.getenv("PRETTY_STATE_JSON") else 0
+
+
+Q192 = 1 << 192
+
+
+def _sqrt_price_to_quote(sqrt_price_x96, token_is_0, token_decimals, quote_decimals):
+    """Token price in quote-token units from a pool's sqrtPriceX96.
+
+    price(token1 per token0) = sqrtPriceX96**2 / 2**192 * 10**(d0 - d1).
+    The square stays in int so the 160-bit value keeps full precision;
+    the one true division at the end rounds to float.
+    """
+    num = sqrt_price_x96 * sqrt_price_x96
+    if token_is_0:
+        return num * 10**token_decimals / (Q192 * 10**quote_decimals)
+    return Q192 * 10**token_decimals / (num * 10**quote_decimals)
+
+
+def _sqrt_to_usd(
+    sqrt_price_x96, token_is_0, token_decimals, quote_decimals, usd_per_quote
+):
+    """USD price per token from sqrtPriceX96, given the USD value of one
+    quote token. Pure numeric kernel with no RPC or registry access."""
+    return (
+        _sqrt_price_to_quote(sqrt_price_x96, token_is_0, token_decimals, quote_decimals)
+        * usd_per_quote
+    )
+
+
+def _addr_lt(a, b):
+    """Numeric address order, compared as raw 20-byte strings."""
+    return bytes.fromhex(a[2:]) < bytes.fromhex(b[2:])
+
+
+@functools.lru_cache(maxsize=1024)
+def _v4_swap_pool_key(token_in, token_out, fee_tier, tick_spacing=None, hooks=None):
+    """PoolKey and direction for a V4 swap; only amounts vary per swap.
+    Returns ((currency0, currency1, fee, tickSpacing, hooks), zero_for_one,
+    checksummed token_in, checksummed token_out)."""
+    addr_in = _cs(token_in)
+    addr_out = _cs(token_out)
+
+    # PoolKey requires currency0 < currency1 (sorted by address)
+    if _addr_lt(addr_in, addr_out):
+        currency0 = addr_in
+        currency1 = addr_out
+        zero_for_one = True
+    else:
+        currency0 = addr_out
+        currency1 = addr_in
+        zero_for_one = False
+
+    if tick_spacing is None:
+        # Default tick spacing by fee tier
+        tick_spacing_map = {100: 1, 500: 10, 3000: 60, 10000: 200}
+        tick_spacing = tick_spacing_map.get(fee_tier, 60)
+
+    hooks_addr = hooks or "0x0000000000000000000000000000000000000000"
+    pool_key = (currency0, currency1, fee_tier, tick_spacing, hooks_addr)
+    return pool_key, zero_for_one, addr_in, addr_out
+
+
+@functools.lru_cache(maxsize=None)
+def _price_ttl(chain_id):
+    """Seconds a token price stays cached: PRICE_CACHE_BLOCKS blocks of the
+    chain its pool is read on, capped at PRICE_CACHE_TTL."""
+    price_chain = CHAINS.get(TESTNET_TO_MAINNET.get(chain_id, chain_id), {})
+    return min(PRICE_CACHE_TTL, PRICE_CACHE_BLOCKS * price_chain.get("block_time", 2))
+
+
+@njit(cache=True)
+def _vol_kernel(prices):
+    """Sample stdev of consecutive percent changes (abs value if only one),
+    single pass via running sum and sum of squares. NaN if no change can
+    be computed."""
+    n = 0
+    total = 0.0
+    total_sq = 0.0
+    for i in range(1, prices.shape[0]):
+        prev = prices[i - 1]
+        if prev > 0:
+            pct = (prices[i] - prev) / prev * 100.0
+            n += 1
+            total += pct
+            total_sq += pct * pct
+    if n == 0:
+        return np.nan
+    if n == 1:
+        return abs(total)
+    var = (total_sq - total * total / n) / (n - 1)
+    return np.sqrt(max(var, 0.0))
+
+
+def _unit_quote_usd():
+    """USD per quote token for stable (and unknown) quotes."""
+    return 1.0
+
+
+# Signing worker processes hold their own Account (see _sign_raw)
+_signer = None
+
+
+def _init_signer(private_key):
+    global _signer
+    _signer = Account.from_key(private_key)
+
+
+def _sign_raw(tx):
+    """Sign tx in a signer process. Returns the raw transaction bytes."""
+    return bytes(_signer.sign_transaction(tx).raw_transaction)
+
+
+def _encode_key(key):
+    """(chain_id, token_addr) -> "chain_id:token_addr" for JSON files."""
+    return f"{key[0]}:{key[1]}"
+
+
+def _decode_key(key):
+    """"chain_id:token_addr" from JSON files -> (chain_id, token_addr)."""
+    chain_id, token_addr = key.split(":", 1)
+    return int(chain_id), token_addr
+
+
+@functools.lru_cache(maxsize=8192)
+def _cs(addr):
+    """EIP-55 checksum an address, memoized (each call is a keccak)."""
+    return to_checksum_address(addr)
 
 
 class ChainContext:
     """Holds per-chain Web3 + contracts for executing swaps."""
 
-    def __init__(self, chain_id, w3, account):
+    def __init__(self, chain_id, w3, account, rpc_url=None, ws_url=None):
         self.chain_id = chain_id
         self.config = CHAINS[chain_id]
+        self.name = self.config["name"]
+        self.is_testnet = chain_id in TESTNET_CHAINS
+        # Chain whose pools price this one (itself unless a testnet)
+        self.mainnet_id = TESTNET_TO_MAINNET.get(chain_id, chain_id)
+        self.weth_decimals = self.config.get("weth_decimals", 18)
+        self.usdc_decimals = self.config.get("usdc_decimals", 6)
+        self.block_time = self.config.get("block_time", 2)
         self.w3 = w3
         self.account = account
-        self.router = w3.eth.contract(
-            address=Web3.to_checksum_address(self.config["universal_router"]),
-            abi=UNIVERSAL_ROUTER_ABI,
-        )
-        self.permit2 = w3.eth.contract(
-            address=Web3.to_checksum_address(PERMIT2), abi=PERMIT2_ABI
+        # Optional websocket endpoint; when set the trading loop wakes on
+        # this chain's newHeads instead of only on its 1s timer
+        self.ws_url = ws_url
+        # Async twin of w3 for concurrent read fan-out from the event loop
+        self.aio_w3 = (
+            AsyncWeb3(AsyncHTTPProvider(rpc_url, request_kwargs={"timeout": 15}))
+            if rpc_url
+            else None
         )
-        self.pool_manager = w3.eth.contract(
-            address=Web3.to_checksum_address(self.config["pool_manager"]),
-            abi=POOL_MANAGER_ABI,
+
+        # Checksummed addresses, computed once per chain
+        self.router_cs = _cs(self.config["universal_router"])
+        self.permit2_cs = _cs(PERMIT2)
+        self.pool_manager_cs = _cs(self.config["pool_manager"])
+        self.weth_cs = _cs(self.config["weth"])
+        self.usdc_cs = _cs(self.config["usdc"])
+        factory = self.config.get("v3_factory")
+        self.factory_cs = _cs(factory) if factory else None
+        # Quote tokens that transfer scans never treat as new tokens
+        self.base_tokens = frozenset((self.usdc_cs.lower(), self.weth_cs.lower()))
+
+        self.permit2 = w3.eth.contract(address=self.permit2_cs, abi=PERMIT2_ABI)
+        self.multicall_cs = _cs(MULTICALL3)
+        self.multicall = w3.eth.contract(address=self.multicall_cs, abi=MULTICALL3_ABI)
+        self.aio_multicall = (
+            self.aio_w3.eth.contract(address=_cs(MULTICALL3), abi=MULTICALL3_ABI)
+            if self.aio_w3
+            else None
         )
+        # Memoized per-address contract objects
+        self._erc20 = {}
         self._gas_cache = None
         self._gas_cache_time = 0
+        self.gas_cache_ttl = GAS_CACHE_BLOCKS * self.block_time
+        # Local nonce counter, see AutonomousTrader.get_nonce()
+        self._nonce = None
+        self._nonce_lock = threading.Lock()
+
+    def eth_call(self, target, data):
+        """Raw eth_call with pre-encoded calldata. Returns the result bytes."""
+        return bytes(self.w3.eth.call({"to": target, "data": data}))
+
+    async def aeth_call(self, target, data):
+        """eth_call over aio_w3. Returns the result bytes."""
+        return bytes(await self.aio_w3.eth.call({"to": target, "data": data}))
+
+    def aggregate(self, calls):
+        """Run [(target, calldata), ...] as a single Multicall3 eth_call.
+        Returns [(success, return_bytes), ...] in the same order. Falls back
+        to one eth_call per entry if Multicall3 is unavailable.
+
+        Calls go on the wire sorted by (target, calldata), so the same set
+        of reads always produces the same request body for provider-side
+        caches."""
+        if not calls:
+            return []
+        order = sorted(range(len(calls)), key=calls.__getitem__)
+        try:
+            rets = self.multicall.functions.aggregate3(
+                [(calls[i][0], True, calls[i][1]) for i in order]
+            ).call()
+            return self._unsort(order, rets)
+        except Exception:
+            pass
+
+        results = []
+        for target, data in calls:
+            try:
+                results.append((True, self.eth_call(target, data)))
+            except Exception:
+                results.append((False, b""))
+        return results
+
+    async def aaggregate(self, calls):
+        """aggregate() over aio_w3, for use from the event loop. Runs the
+        sync version in a worker thread if this chain has no async
+        provider."""
+        if not calls:
+            return []
+        if self.aio_w3 is None:
+            return await asyncio.to_thread(self.aggregate, calls)
+        order = sorted(range(len(calls)), key=calls.__getitem__)
+        try:
+            rets = await self.aio_multicall.functions.aggregate3(
+                [(calls[i][0], True, calls[i][1]) for i in order]
+            ).call()
+            return self._unsort(order, rets)
+        except Exception:
+            pass
+
+        async def one(target, data):
+            try:
+                return True, await self.aeth_call(target, data)
+            except Exception:
+                return False, b""
+
+        return list(await asyncio.gather(*(one(t, d) for t, d in calls)))
+
+    @staticmethod
+    def _unsort(order, rets):
+        """Map results of calls sent in `order` back to caller order."""
+        results = [None] * len(order)
+        for i, ret in zip(order, rets):
+            results[i] = ret
+        return results
+
+    def erc20(self, addr):
+        """ERC20 contract for addr, built once per token."""
+        key = addr.lower()
+        contract = self._erc20.get(key)
+        if contract is None:
+            contract = self.w3.eth.contract(address=_cs(addr), abi=ERC20_ABI)
+            self._erc20[key] = contract
+        return contract
 
 
 class AutonomousTrader:
@@ -256,11 +593,18 @@ class AutonomousTrader:
         self.mainnet_quoter = self.w3_mainnet.eth.contract(
             address=MAINNET_QUOTER_V2, abi=QUOTER_ABI
         )
+        # Pricing-only context for when mainnet isn't an execution chain
+        self._mainnet_ctx = ChainContext(
+            1, self.w3_mainnet, self.account, rpc_url=MAINNET_RPC
+        )
 
         # Shared subsystems
         self.registry = TokenRegistry()
         self.whitelist = WhitelistManager()
         self.event_queue = queue.Queue()
+        # Gas (ETH) of exits reconciled after the fact, applied to
+        # total_pnl on the trading loop's thread
+        self._gas_adjustments = queue.Queue()
 
         # Chain connections
         self.chain_ctx = {}
@@ -281,17 +625,93 @@ class AutonomousTrader:
             mon.add_watch(cfg["weth"])
             self.monitors[chain_id] = mon
 
-        # Trading state — positions keyed by (chain_id, token_addr)
-        self.positions = {}  # {"chain_id:token_addr": [pos, ...]}
+        # Trading state — positions keyed by (chain_id, token_addr); the
+        # "chain_id:token_addr" string form only exists in STATE_FILE
+        self.positions = {}  # {(chain_id, token_addr): [pos, ...]}
         self.total_pnl = 0.0
         self.trade_count = 0
         self.take_profit = DEFAULT_TAKE_PROFIT
         self.stop_loss = DEFAULT_STOP_LOSS
 
-        # Active token configs: {"chain_id:addr": {pool_config, ...}}
+        # Active token configs: {(chain_id, addr): {pool_config, ...}}
         self._active_tokens = {}
-        self._price_cache = {}  # {(chain_id, addr): (timestamp, price)}
+        # {(chain_id, addr): (expires_at, price)}, least recently used first
+        self._price_cache = OrderedDict()
+        # Bumped on every position change; keys the cached TP/SL columns
+        self._positions_version = 0
+        self._pos_index = None
+        self._open_keys = frozenset()
+        # {chain_id: latest block seen}, updated by every fused read
+        self.last_blocks = {}
+        # {(chain_id, addr): [count, mean, var, last_price]}, see _update_vol
+        self._vol_state = {}
+        # {flag_path: (exists, monotonic time checked)}
+        self._flag_cache = {}
+        self._eth_usd_cache = None  # (timestamp, price) for the default quote
+        # V4 PoolIds: {(token, quote, fee_tier): (pool_id, token_is_0)}
+        self._pool_id_cache = {}
+        # {(chain_id, token, dex, fee, quote): (ctx, target, calldata, token_is_0)}
+        self._price_sources = {}
+        # {(chain_id, token): permit2 expiration} for confirmed approvals
+        self._approval_state = {}
+        # Serializes registry/whitelist writes and token activation when
+        # chains are scanned from worker threads
+        self._registry_lock = threading.RLock()
+        # In-memory copies of the token/pool JSON files, loaded on first save
+        self._token_addresses = None
+        self._discovered_pools = None
+        self._json_digests = {}  # {path: blake2b of last bytes written}
+        # {chain_id: newest block whose whitelist transfers were processed}
+        self._last_scan_block = {}
+
+        # Keep-alive HTTP session shared by the API server and Etherscan
+        # calls; idempotent requests retry on connection errors and 5xx
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)
+            ),
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        # Trading-loop log lines, written by a daemon thread (see _log)
+        self._log_q = queue.Queue(maxsize=1024)
+        threading.Thread(target=self._log_writer, name="log", daemon=True).start()
+        # Blocking RPC work awaited from run(), see _off_loop()
+        self._rpc_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="rpc")
+        # record_trade() posts run here so the swap path never waits on them
+        self._trade_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="trade-log"
+        )
+        # ECDSA signing runs in worker processes, off the GIL, so sell-all's
+        # per-token threads sign in parallel. Started on first use.
+        self._signer_pool = None
+        self._signer_lock = threading.Lock()
+        # Swaps broadcast with wait=False: {tx_hash: {chain_id, label, ...}}
+        self._pending_receipts = {}
+        self._pending_lock = threading.Lock()
+        threading.Thread(
+            target=self._receipt_worker, name="receipts", daemon=True
+        ).start()
+        # balanceOf(self) calldata is identical for every token
+        self._balance_of_calldata = BALANCE_OF_SELECTOR + encode(
+            ["address"], [self.account.address]
+        )
+        # ERC20 decimals never change — {(chain_id, addr_lower): decimals}
+        self._decimals_cache = {}
+        for chain_id in self.chain_ctx:
+            cfg = CHAINS[chain_id]
+            self._decimals_cache[(chain_id, cfg["weth"].lower())] = cfg.get(
+                "weth_decimals", 18
+            )
+            self._decimals_cache[(chain_id, cfg["usdc"].lower())] = cfg.get(
+                "usdc_decimals", 6
+            )
 
+        self._journal_ops = 0
+        self._last_snapshot = 0
         self._load_state()
 
         chains_str = ", ".join(CHAINS[c]["name"] for c in self.chain_ctx)
@@ -313,21 +733,32 @@ class AutonomousTrader:
             "POLYGON_RPC_URL": 137,
         }
 
+        def probe(rpc_url):
+            # A successful eth_chainId doubles as the liveness check, so
+            # there is no separate is_connected() round-trip
+            w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 15}))
+            return w3, w3.eth.chain_id
+
+        # Probe every configured RPC at once; boot time is the slowest
+        # endpoint, not the sum of all of them
+        endpoints = [(k, os.getenv(k)) for k in rpc_env_map if os.getenv(k)]
+        futures = []
+        if endpoints:
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+                futures = [pool.submit(probe, url) for _, url in endpoints]
+
         seen_chain_ids = set()
 
-        for env_key, expected_chain_id in rpc_env_map.items():
-            rpc_url = os.getenv(env_key)
-            if not rpc_url:
+        # Results are applied in rpc_env_map order so duplicates resolve
+        # the same way as before
+        for (env_key, rpc_url), future in zip(endpoints, futures):
+            try:
+                w3, actual_chain_id = future.result()
+            except Exception as e:
+                print(f"  [Chain Init] {env_key}: Connection failed ({e})")
                 continue
 
             try:
-                w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 15}))
-                if not w3.is_connected():
-                    print(f"  [Chain Init] {env_key}: Connection failed")
-                    continue
-
-                actual_chain_id = w3.eth.chain_id
-
                 # Skip if we already have this chain
                 if actual_chain_id in seen_chain_ids:
                     continue
@@ -341,8 +772,10 @@ class AutonomousTrader:
                     continue
 
                 name = CHAINS[actual_chain_id]["name"]
+                # e.g. BASE_RPC_URL -> BASE_WS_URL
+                ws_url = os.getenv(env_key.replace("_RPC_URL", "_WS_URL"))
                 self.chain_ctx[actual_chain_id] = ChainContext(
-                    actual_chain_id, w3, self.account
+                    actual_chain_id, w3, self.account, rpc_url=rpc_url, ws_url=ws_url
                 )
                 seen_chain_ids.add(actual_chain_id)
 
@@ -355,60 +788,210 @@ class AutonomousTrader:
     # -- State persistence --
 
     def _load_state(self):
-        """Load positions from state file."""
+        """Load positions from the state snapshot, then replay the journal
+        of changes made since that snapshot was written."""
         try:
             with open(STATE_FILE) as f:
                 state = json.load(f)
-            self.positions = state.get("positions", {})
+            self.positions = {
+                _decode_key(k): v for k, v in state.get("positions", {}).items()
+            }
             self.total_pnl = state.get("total_pnl", 0.0)
             self.trade_count = state.get("trade_count", 0)
-            if self.positions:
-                count = sum(len(v) for v in self.positions.values())
-                print(
-                    f"  Restored {count} positions across {len(self.positions)} tokens"
-                )
         except (FileNotFoundError, json.JSONDecodeError):
             pass
 
-    def _save_state(self):
-        """Persist positions to disk."""
+        try:
+            with open(STATE_JOURNAL_FILE) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn final write
+                    self._apply_journal_entry(entry)
+                    self._journal_ops += 1
+        except FileNotFoundError:
+            pass
+
+        # Positions saved before thresholds were stored at entry
+        for pos_list in self.positions.values():
+            for pos in pos_list:
+                self._fill_thresholds(pos)
+
+        if self.positions:
+            count = sum(len(v) for v in self.positions.values())
+            print(f"  Restored {count} positions across {len(self.positions)} tokens")
+
+    def _threshold_index(self):
+        """TP/SL thresholds of every open position as flat columns, rebuilt
+        only when positions change. Returns (keys, row_key, row_pos, tp, sl):
+        row r is self.positions[keys[row_key[r]]][row_pos[r]]. Positions
+        without thresholds get NaN, which never compares true."""
+        index = self._pos_index
+        if index is not None and index[0] == self._positions_version:
+            return index[1]
+
+        keys, row_key, row_pos, tp, sl = [], [], [], [], []
+        for key, pos_list in self.positions.items():
+            if not pos_list:
+                continue
+            k = len(keys)
+            keys.append(key)
+            for i, pos in enumerate(pos_list):
+                take_profit_price = pos.get("take_profit_price")
+                row_key.append(k)
+                row_pos.append(i)
+                if take_profit_price is None:
+                    tp.append(np.nan)
+                    sl.append(np.nan)
+                else:
+                    tp.append(take_profit_price)
+                    sl.append(pos["stop_loss_price"])
+
+        columns = (
+            keys,
+            np.asarray(row_key, dtype=np.intp),
+            row_pos,
+            np.asarray(tp, dtype=np.float64),
+            np.asarray(sl, dtype=np.float64),
+        )
+        self._pos_index = (self._positions_version, columns)
+        self._open_keys = frozenset(keys)
+        return columns
+
+    def _open_position_keys(self):
+        """(chain_id, token) keys with at least one open position; cached
+        with the threshold columns, so only rebuilt after a change."""
+        self._threshold_index()
+        return self._open_keys
+
+    def _fill_thresholds(self, pos):
+        """Give a position absolute take_profit_price / stop_loss_price from
+        the default TP/SL ratios if it has none, so exits are two float
+        comparisons. Positions without a positive entry price get none and
+        are never exited by TP/SL."""
+        if pos.get("take_profit_price") is not None:
+            return
+        entry_price = pos.get("entry_price_usd", 0)
+        if entry_price > 0:
+            pos["take_profit_price"] = entry_price * self.take_profit
+            pos["stop_loss_price"] = entry_price * self.stop_loss
+
+    def _apply_journal_entry(self, entry):
+        if entry["op"] == "clear":
+            self.positions = {}
+        elif entry["key"] is None:
+            pass  # "totals": only total_pnl / trade_count changed
+        elif entry["positions"]:
+            self.positions[_decode_key(entry["key"])] = entry["positions"]
+        else:
+            self.positions.pop(_decode_key(entry["key"]), None)
+        self.total_pnl = entry["total_pnl"]
+        self.trade_count = entry["trade_count"]
+
+    def _journal(self, op, key=None):
+        """Append one state change to the journal. Entries carry the full
+        position list for the key plus absolute totals, so replaying an
+        entry twice is harmless."""
+        # Every position change is journaled, so this also invalidates
+        # the TP/SL threshold columns
+        self._positions_version += 1
+        entry = {
+            "op": op,
+            "key": _encode_key(key) if key else None,
+            "positions": self.positions.get(key, []) if key else [],
+            "total_pnl": self.total_pnl,
+            "trade_count": self.trade_count,
+        }
+        with open(STATE_JOURNAL_FILE, "a") as f:
+            f.write(ujson.dumps(entry, escape_forward_slashes=False) + "\n")
+        self._journal_ops += 1
+
+    def _save_state(self, force=False):
+        """Snapshot positions to disk and truncate the journal.
+        Runs every loop tick but only writes when the journal is due
+        (STATE_SNAPSHOT_INTERVAL seconds or STATE_SNAPSHOT_OPS changes)."""
+        if not force:
+            if not self._journal_ops:
+                return
+            if (
+                self._journal_ops < STATE_SNAPSHOT_OPS
+                and time.time() - self._last_snapshot < STATE_SNAPSHOT_INTERVAL
+            ):
+                return
+
         state = {
-            "positions": self.positions,
+            "positions": {_encode_key(k): v for k, v in self.positions.items()},
             "total_pnl": self.total_pnl,
             "trade_count": self.trade_count,
             "updated": datetime.now().isoformat(),
         }
-        with open(STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        payload = ujson.dumps(
+            state, indent=STATE_JSON_INDENT, escape_forward_slashes=False
+        )
+        tmp = f"{STATE_FILE}.tmp"
+        with open(tmp, "w") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, STATE_FILE)
+        open(STATE_JOURNAL_FILE, "w").close()
+        self._journal_ops = 0
+        self._last_snapshot = time.time()
+
+    def _fetch_wallet_balances(self, chain_id):
+        """Native ETH, WETH and USDC balances plus the block number for one
+        chain, as (eth, weth, usdc, block).
+        All four reads go out as a single JSON-RPC batch; falls back to
+        individual calls if the provider rejects batching."""
+        ctx = self.chain_ctx[chain_id]
+        owner = self.account.address
+        try:
+            weth = ctx.erc20(ctx.weth_cs)
+            usdc = ctx.erc20(ctx.usdc_cs)
+            with ctx.w3.batch_requests() as batch:
+                batch.add(ctx.w3.eth.get_balance(owner))
+                batch.add(weth.functions.balanceOf(owner))
+                batch.add(usdc.functions.balanceOf(owner))
+                batch.add(ctx.w3.eth.get_block_number())
+                eth_raw, weth_raw, usdc_raw, block = batch.execute()
+            return (
+                eth_raw / 1e18,
+                weth_raw / (10**ctx.weth_decimals),
+                usdc_raw / (10**ctx.usdc_decimals),
+                block,
+            )
+        except Exception:
+            pass
+
+        eth_bal = 0.0
+        try:
+            eth_bal = ctx.w3.eth.get_balance(owner) / 1e18
+        except Exception:
+            pass
+        weth_bal, _, _ = self.get_balance(ctx.weth_cs, chain_id)
+        usdc_bal, _, _ = self.get_balance(ctx.usdc_cs, chain_id)
+        block = None
+        try:
+            block = ctx.w3.eth.block_number
+        except Exception:
+            pass
+        return eth_bal, weth_bal, usdc_bal, block
 
     def _save_wallet(self):
         """Update wallet stats for dashboard."""
-        # Sum balances across all chains
-        total_eth = 0.0
-        total_weth = 0.0
-        total_usdc = 0.0
-
-        # We need to fetch balances if not recently fetched.
-        # Check specific chains (Mainnet + L2s)
-        for chain_id in [1, 8453, 42161, 10, 137]:
-            if chain_id in self.chain_ctx:
-                cfg = CHAINS[chain_id]
-                # Native ETH
-                try:
-                    eth_bal = self.chain_ctx[chain_id].w3.eth.get_balance(
-                        self.account.address
-                    )
-                    total_eth += float(Web3.from_wei(eth_bal, "ether"))
-                except Exception:
-                    pass
-
-                # WETH
-                b, _, _ = self.get_balance(cfg["weth"], chain_id)
-                total_weth += b
-
-                # USDC
-                b, _, _ = self.get_balance(cfg["usdc"], chain_id)
-                total_usdc += b
+        # Sum balances across Mainnet + L2s. Chains are fetched
+        # concurrently so wall time is the slowest RPC, not the sum.
+        chain_ids = [c for c in (1, 8453, 42161, 10, 137) if c in self.chain_ctx]
+        balances = []
+        if chain_ids:
+            with ThreadPoolExecutor(max_workers=len(chain_ids)) as pool:
+                balances = list(pool.map(self._fetch_wallet_balances, chain_ids))
+
+        # rows = chains, columns = (eth, weth, usdc); one column-wise sum
+        rows = [b[:3] for b in balances]
+        totals = np.asarray(rows, dtype=np.float64).reshape(-1, 3).sum(axis=0)
+        total_eth, total_weth, total_usdc = (float(t) for t in totals)
 
         eth_price = self.get_mainnet_price()  # get real mainnet price
 
@@ -424,8 +1007,7 @@ class AutonomousTrader:
             "chains": [CHAINS[c]["name"] for c in self.chain_ctx],
         }
         try:
-            with open(WALLET_FILE, "w") as f:
-                json.dump(data, f)
+            self._write_json(WALLET_FILE, data)
         except Exception as e:
             print(f"  Wallet save error: {e}")
 
@@ -436,7 +1018,15 @@ class AutonomousTrader:
     def get_mainnet_price(
         self, token_in=None, token_out=None, amount=1.0, decimals_in=18
     ):
-        """Get price from Mainnet QuoterV2. Defaults to WETH/USDC."""
+        """Get price from Mainnet QuoterV2. Defaults to WETH/USDC.
+        The default 1 WETH → USDC quote is cached for PRICE_CACHE_TTL."""
+        is_default = (
+            token_in is None and token_out is None and amount == 1.0 and decimals_in == 18
+        )
+        if is_default and self._eth_usd_cache:
+            ts, price = self._eth_usd_cache
+            if time.time() - ts < PRICE_CACHE_TTL:
+                return price
         try:
             t_in = token_in or MAINNET_WETH
             t_out = token_out or MAINNET_USDC
@@ -450,7 +1040,10 @@ class AutonomousTrader:
                     "sqrtPriceLimitX96": 0,
                 }
             ).call()
-            return result[0] / 1e6 / amount
+            price = result[0] / 1e6 / amount
+            if is_default:
+                self._eth_usd_cache = (time.time(), price)
+            return price
         except Exception as e:
             print(f"  Price error: {e}")
             return None
@@ -458,14 +1051,16 @@ class AutonomousTrader:
     # -- Gas helpers --
 
     def get_gas_params(self, chain_id):
-        """Get gas parameters for a specific chain, cached for 10 seconds."""
+        """Get gas parameters for a specific chain, cached for
+        GAS_CACHE_BLOCKS blocks of that chain."""
         ctx = self.chain_ctx[chain_id]
         now = time.time()
-        if ctx._gas_cache and now - ctx._gas_cache_time < 10:
+        if ctx._gas_cache and now - ctx._gas_cache_time < ctx.gas_cache_ttl:
             return ctx._gas_cache
 
         try:
             latest = ctx.w3.eth.get_block("latest")
+            self.last_blocks[chain_id] = latest["number"]
             base_fee = latest.get("baseFeePerGas", ctx.w3.eth.gas_price)
             max_priority = ctx.w3.to_wei(1, "gwei")
             max_fee = base_fee * 2 + max_priority
@@ -479,8 +1074,57 @@ class AutonomousTrader:
         return ctx._gas_cache
 
     def get_nonce(self, chain_id):
+        """Next nonce from the chain's local counter. Seeded once from the
+        pending transaction count, then incremented per transaction."""
         ctx = self.chain_ctx[chain_id]
-        return ctx.w3.eth.get_transaction_count(self.account.address, "pending")
+        with ctx._nonce_lock:
+            if ctx._nonce is None:
+                ctx._nonce = ctx.w3.eth.get_transaction_count(
+                    self.account.address, "pending"
+                )
+            nonce = ctx._nonce
+            ctx._nonce += 1
+            return nonce
+
+    def _reset_nonce(self, chain_id):
+        """Drop the local nonce counter; the next get_nonce() reseeds it."""
+        ctx = self.chain_ctx[chain_id]
+        with ctx._nonce_lock:
+            ctx._nonce = None
+
+    def _send_tx(self, chain_id, tx):
+        """Assign the next local nonce, sign and broadcast tx. Returns the
+        tx hash. A nonce rejection resyncs the counter and retries once;
+        any other failure also resyncs so the unused nonce is not skipped."""
+        ctx = self.chain_ctx[chain_id]
+        for attempt in range(2):
+            tx["nonce"] = self.get_nonce(chain_id)
+            try:
+                return ctx.w3.eth.send_raw_transaction(self._sign(tx))
+            except Exception as e:
+                self._reset_nonce(chain_id)
+                if attempt or "nonce" not in str(e).lower():
+                    raise
+
+    def _sign(self, tx):
+        """Raw signed bytes for tx, signed in the signer pool. Falls back
+        to signing in-process if the pool can't be used."""
+        try:
+            with self._signer_lock:
+                if self._signer_pool is None:
+                    self._signer_pool = ProcessPoolExecutor(
+                        max_workers=min(4, os.cpu_count() or 1),
+                        # spawn: forking with the receipt/trade threads
+                        # running could copy a held lock into the child
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_signer,
+                        initargs=(PRIVATE_KEY,),
+                    )
+                pool = self._signer_pool
+            return pool.submit(_sign_raw, tx).result(timeout=30)
+        except Exception as e:
+            print(f"  Signer pool unavailable ({e}), signing inline")
+            return self.account.sign_transaction(tx).raw_transaction
 
     def gas_cost_usd(self, gas_eth, eth_price):
         return gas_eth * eth_price
@@ -489,12 +1133,11 @@ class AutonomousTrader:
         """Estimate gas cost in USD for a 600k-gas swap on a chain.
         Used to pre-check whether a TP exit would be net-positive."""
         try:
-            ctx = self.chain_ctx[chain_id]
             gas_params = self.get_gas_params(chain_id)
             # Use maxFeePerGas if EIP-1559, else gasPrice
             gas_price = gas_params.get("maxFeePerGas", gas_params.get("gasPrice", 0))
             gas_cost_wei = 600000 * gas_price
-            gas_cost_eth = float(ctx.w3.from_wei(gas_cost_wei, "ether"))
+            gas_cost_eth = gas_cost_wei / 1e18
             return gas_cost_eth * eth_price, gas_cost_eth
         except Exception:
             return 0, 0
@@ -504,14 +1147,70 @@ class AutonomousTrader:
     def get_balance(self, token_addr, chain_id):
         try:
             ctx = self.chain_ctx[chain_id]
-            addr = Web3.to_checksum_address(token_addr)
-            contract = ctx.w3.eth.contract(address=addr, abi=ERC20_ABI)
-            decimals = contract.functions.decimals().call()
-            balance = contract.functions.balanceOf(self.account.address).call()
+            token = _cs(token_addr)
+            cache_key = (chain_id, token_addr.lower())
+            decimals = self._decimals_cache.get(cache_key)
+            if decimals is None:
+                ret = ctx.eth_call(token, DECIMALS_SELECTOR)
+                decimals = decode(["uint8"], ret)[0]
+                self._decimals_cache[cache_key] = decimals
+            ret = ctx.eth_call(token, self._balance_of_calldata)
+            balance = decode(["uint256"], ret)[0]
             return balance / (10**decimals), balance, decimals
         except Exception:
             return 0.0, 0, 18
 
+    def get_balances_bulk(self, token_addrs, chain_id):
+        """Wallet balances for many tokens on one chain in a single
+        Multicall3 call (decimals are fetched in the same call when not
+        cached). Returns {addr_lower: (human, raw, decimals)}; unreadable
+        tokens map to (0.0, 0, 18) like get_balance()."""
+        ctx = self.chain_ctx[chain_id]
+        addrs = sorted({a.lower() for a in token_addrs})
+        calls, tags = [], []
+        for addr in addrs:
+            if (chain_id, addr) not in self._decimals_cache:
+                calls.append((_cs(addr), DECIMALS_SELECTOR))
+                tags.append(("decimals", addr))
+            calls.append((_cs(addr), self._balance_of_calldata))
+            tags.append(("balance", addr))
+
+        balances = {addr: (0.0, 0, 18) for addr in addrs}
+        # Tags are in call order, so decimals land before their balance
+        for (kind, addr), (ok, ret) in zip(tags, ctx.aggregate(calls)):
+            if not ok:
+                continue
+            try:
+                if kind == "decimals":
+                    self._decimals_cache[(chain_id, addr)] = decode(["uint8"], ret)[0]
+                    continue
+                decimals = self._decimals_cache.get((chain_id, addr))
+                if decimals is None:
+                    continue
+                raw = decode(["uint256"], ret)[0]
+                balances[addr] = (raw / (10**decimals), raw, decimals)
+            except Exception:
+                continue
+        return balances
+
+    def get_symbols_bulk(self, token_addrs, chain_id):
+        """ERC20 symbols for many tokens on one chain in a single Multicall3
+        call. Returns {addr_lower: symbol or None}. Handles both string and
+        legacy bytes32 symbol() returns."""
+        ctx = self.chain_ctx[chain_id]
+        addrs = sorted({a.lower() for a in token_addrs})
+        results = ctx.aggregate([(_cs(a), SYMBOL_SELECTOR) for a in addrs])
+        symbols = {}
+        for addr, (ok, ret) in zip(addrs, results):
+            symbol = None
+            if ok and ret:
+                try:
+                    symbol = decode(["string"], ret)[0]
+                except Exception:
+                    symbol = ret[:32].rstrip(b"\x00").decode("utf-8", "ignore")
+            symbols[addr] = symbol or None
+        return symbols
+
     # -- Token pricing from pool --
 
     def get_token_price(self, token_addr, chain_id, pool=None, token_decimals=18):
@@ -519,29 +1218,74 @@ class AutonomousTrader:
         Returns float USD price per token unit, or None.
         """
         addr = token_addr.lower()
-        chain_key = str(chain_id)
 
-        # Check cache
         cache_key = (chain_id, addr)
-        now = time.time()
-        if cache_key in self._price_cache:
-            ts, price = self._price_cache[cache_key]
-            if now - ts < PRICE_CACHE_TTL:
-                return price
+        price = self._cached_price(cache_key)
+        if price is not None:
+            return price
 
         if pool is None:
-            pool = self.registry.get_best_pool(addr, chain_key)
+            pool = self.registry.get_best_pool(addr, str(chain_id))
         if not pool:
             return None
 
         price = self._get_v4_pool_price(addr, chain_id, pool, token_decimals)
 
         if price is not None and price > 0:
-            self._price_cache[cache_key] = (now, price)
+            self._store_price(cache_key, price)
             return price
 
         return None
 
+    def _cached_price(self, cache_key):
+        """Fresh cached price for (chain_id, addr), or None."""
+        cached = self._price_cache.get(cache_key)
+        if cached is None:
+            return None
+        if time.time() >= cached[0]:
+            self._price_cache.pop(cache_key, None)
+            return None
+        try:
+            self._price_cache.move_to_end(cache_key)
+        except KeyError:
+            pass  # evicted by a concurrent pricing thread
+        return cached[1]
+
+    def _store_price(self, cache_key, price):
+        expires_at = time.time() + _price_ttl(cache_key[0])
+        self._price_cache[cache_key] = (expires_at, price)
+        self._price_cache.move_to_end(cache_key)
+        while len(self._price_cache) > PRICE_CACHE_MAX:
+            self._price_cache.popitem(last=False)
+        self._update_vol(cache_key, price)
+
+    def _update_vol(self, key, price):
+        """Fold a fresh price into the token's rolling volatility state:
+        incremental (Welford-style) exponentially weighted mean and variance
+        of the percent change between consecutive reads."""
+        state = self._vol_state.get(key)
+        if state is None:
+            self._vol_state[key] = [0, 0.0, 0.0, price]
+            return
+        last = state[3]
+        state[3] = price
+        if last <= 0:
+            return
+        pct = (price - last) / last * 100.0
+        state[0] += 1
+        diff = pct - state[1]
+        incr = VOL_EWMA_ALPHA * diff
+        state[1] += incr
+        state[2] = (1 - VOL_EWMA_ALPHA) * (state[2] + diff * incr)
+
+    def _rolling_volatility(self, chain_id, token_addr):
+        """Rolling volatility (% stdev) for a token, or None until it has
+        VOL_MIN_SAMPLES price changes."""
+        state = self._vol_state.get((chain_id, token_addr.lower()))
+        if state is None or state[0] < VOL_MIN_SAMPLES:
+            return None
+        return state[2] ** 0.5
+
     def _get_v4_pool_price(self, token_addr, chain_id, pool, token_decimals=18):
         """Read token price from the on-chain pool's slot0.
 
@@ -549,160 +1293,297 @@ class AutonomousTrader:
         Computes price from sqrtPriceX96.
         Always reads from mainnet — testnet pools are not used for pricing.
         """
+        src = self._price_source(token_addr, chain_id, pool)
+        if src is None:
+            return None
+        ctx, target, calldata, token_is_0 = src
+        try:
+            ret = ctx.eth_call(target, calldata)
+        except Exception as e:
+            print(f"  Pool price error: {e}")
+            return None
+        return self._price_from_slot0(ret, token_is_0, pool, token_decimals)
+
+    def _price_from_slot0(self, ret, token_is_0, pool, token_decimals):
+        """USD price from raw V3 slot0() / V4 getSlot0() return data. Both
+        lead with sqrtPriceX96 in the first word."""
+        sqrt_price_x96 = decode(["uint160"], ret[:32])[0]
+        if sqrt_price_x96 == 0:
+            return None
+        if "_usd_per_quote" not in pool:
+            self._specialize_pool(pool)
+        return _sqrt_to_usd(
+            sqrt_price_x96,
+            token_is_0,
+            token_decimals,
+            pool["_quote_decimals"],
+            pool["_usd_per_quote"](),
+        )
+
+    @staticmethod
+    def _price_source_key(token_addr, chain_id, pool):
+        """_price_sources key for a token's pool, or None if the pool has no
+        quote token (and so no price source)."""
+        quote_addr = pool.get("quote_token_address")
+        if not quote_addr:
+            return None
+        dex = (pool.get("dex") or "").lower()
+        fee_tier = pool.get("fee_tier", 3000)
+        return (chain_id, token_addr.lower(), dex, fee_tier, quote_addr.lower())
+
+    def _price_source(self, token_addr, chain_id, pool):
+        """Where a token's sqrtPriceX96 is read from, as
+        (ctx, target, calldata, token_is_0), or None if it has no pool.
+
+        The V3 pool address, V4 PoolId and token ordering never change, so
+        they are resolved once and every later price read is a single slot0
+        call that can also be batched into a Multicall3 aggregate."""
+        cache_key = self._price_source_key(token_addr, chain_id, pool)
+        if cache_key is None:
+            return None
+        src = self._price_sources.get(cache_key)
+        if src is not None:
+            return src
+        _, _, dex, fee_tier, _ = cache_key
+        quote_addr = pool["quote_token_address"]
+
         # For testnets, use the corresponding mainnet for pricing
         price_chain_id = TESTNET_TO_MAINNET.get(chain_id, chain_id)
         ctx = self.chain_ctx.get(price_chain_id)
         if not ctx:
-            # Fallback: if mainnet chain not in chain_ctx, use w3_mainnet directly
+            # Fallback: if mainnet chain not in chain_ctx, use the w3_mainnet context
             if price_chain_id == 1:
-                w3 = self.w3_mainnet
+                ctx = self._mainnet_ctx
             else:
                 return None
-        else:
-            w3 = ctx.w3
-
-        dex = (pool.get("dex") or "").lower()
-        quote_type = (pool.get("quote_token") or "").upper()
-        if quote_type in ("USDC", "USDT"):
-            quote_decimals = 6
-        else:
-            quote_decimals = 18
 
         # For testnets, map token/quote to mainnet equivalents
         price_token_addr = token_addr
-        quote_addr = pool.get("quote_token_address")
         if chain_id in TESTNET_CHAINS:
             mainnet_id = TESTNET_TO_MAINNET[chain_id]
             mainnet_cfg = CHAINS[mainnet_id]
             testnet_cfg = CHAINS[chain_id]
             # Map testnet WETH/USDC to mainnet
-            if quote_addr and quote_addr.lower() == testnet_cfg["weth"].lower():
+            if quote_addr.lower() == testnet_cfg["weth"].lower():
                 quote_addr = mainnet_cfg["weth"]
-            elif quote_addr and quote_addr.lower() == testnet_cfg["usdc"].lower():
+            elif quote_addr.lower() == testnet_cfg["usdc"].lower():
                 quote_addr = mainnet_cfg["usdc"]
             # Token itself — if same symbol exists on mainnet with same address, use it
             # (UNI is same address on mainnet and testnets)
 
-        sqrt_price_x96 = None
-        token_is_0 = None
-
         # For V3 pools: find the mainnet pool via Factory, then read slot0
-        fee_tier = pool.get("fee_tier", 3000)
-        if "v3" in dex and quote_addr:
+        if "v3" in dex:
             try:
                 # Find the pool on the pricing chain via V3 Factory
-                price_cfg = CHAINS[price_chain_id]
-                factory_addr = price_cfg.get("v3_factory")
-                if not factory_addr:
+                if ctx.factory_cs is None:
                     return None
-                factory = w3.eth.contract(
-                    address=Web3.to_checksum_address(factory_addr), abi=V3_FACTORY_ABI
+                calldata = GET_POOL_SELECTOR + encode(
+                    ["address", "address", "uint24"],
+                    [_cs(price_token_addr), _cs(quote_addr), fee_tier],
                 )
-                mainnet_pool = factory.functions.getPool(
-                    Web3.to_checksum_address(price_token_addr),
-                    Web3.to_checksum_address(quote_addr),
-                    fee_tier,
-                ).call()
+                ret = ctx.eth_call(ctx.factory_cs, calldata)
+                mainnet_pool = decode(["address"], ret)[0]
                 zero = "0x0000000000000000000000000000000000000000"
                 if mainnet_pool == zero:
                     return None
-
-                v3_slot0_abi = [
-                    {
-                        "inputs": [],
-                        "name": "slot0",
-                        "outputs": [
-                            {"name": "sqrtPriceX96", "type": "uint160"},
-                            {"name": "tick", "type": "int24"},
-                            {"name": "observationIndex", "type": "uint16"},
-                            {"name": "observationCardinality", "type": "uint16"},
-                            {"name": "observationCardinalityNext", "type": "uint16"},
-                            {"name": "feeProtocol", "type": "uint8"},
-                            {"name": "unlocked", "type": "bool"},
-                        ],
-                        "stateMutability": "view",
-                        "type": "function",
-                    },
-                    {
-                        "inputs": [],
-                        "name": "token0",
-                        "outputs": [{"name": "", "type": "address"}],
-                        "stateMutability": "view",
-                        "type": "function",
-                    },
-                ]
-                pool_contract = w3.eth.contract(
-                    address=Web3.to_checksum_address(mainnet_pool), abi=v3_slot0_abi
-                )
-                slot0 = pool_contract.functions.slot0().call()
-                sqrt_price_x96 = slot0[0]
-                token0 = pool_contract.functions.token0().call()
+                ret = ctx.eth_call(mainnet_pool, TOKEN0_SELECTOR)
+                token0 = decode(["address"], ret)[0]
                 token_is_0 = price_token_addr.lower() == token0.lower()
             except Exception as e:
                 print(f"  V3 pool price error: {e}")
+                return None
+            src = (ctx, mainnet_pool, SLOT0_SELECTOR, token_is_0)
 
         # --- V4: read from PoolManager ---
-        elif quote_addr:
-            tick_spacing_map = {100: 1, 500: 10, 3000: 60, 10000: 200}
-            tick_spacing = tick_spacing_map.get(fee_tier, 60)
-
-            addr_in = Web3.to_checksum_address(price_token_addr)
-            addr_quote = Web3.to_checksum_address(quote_addr)
-
-            if int(addr_in, 16) < int(addr_quote, 16):
-                currency0, currency1 = addr_in, addr_quote
-                token_is_0 = True
-            else:
-                currency0, currency1 = addr_quote, addr_in
-                token_is_0 = False
-
-            hooks = "0x0000000000000000000000000000000000000000"
-            pool_key_encoded = encode(
-                ["address", "address", "uint24", "int24", "address"],
-                [currency0, currency1, fee_tier, tick_spacing, hooks],
+        else:
+            price_ctx = self.chain_ctx.get(price_chain_id)
+            if not price_ctx:
+                return None
+            pool_id, token_is_0 = self._v4_pool_id(
+                price_token_addr, quote_addr, fee_tier
+            )
+            src = (
+                price_ctx,
+                price_ctx.pool_manager_cs,
+                GET_SLOT0_SELECTOR + pool_id,
+                token_is_0,
             )
-            pool_id = Web3.keccak(pool_key_encoded)
 
-            try:
-                price_ctx = self.chain_ctx.get(price_chain_id)
-                if not price_ctx:
-                    return None
-                slot0 = price_ctx.pool_manager.functions.getSlot0(pool_id).call()
-                sqrt_price_x96 = slot0[0]
-            except Exception as e:
-                print(f"  V4 pool price error: {e}")
+        self._price_sources[cache_key] = src
+        return src
+
+    async def _afused_reads(self, items, with_balance=False):
+        """Prices (and optionally wallet balances) for many active tokens in
+        one Multicall3 round-trip per chain.
+
+        items: [(key, config)] with active-token configs. Every slot0 read
+        and balanceOf/decimals read bound for the same chain goes into that
+        chain's aggregate3 call; chains are awaited concurrently over aio_w3.
+        Returns {key: (price, (human, raw, decimals))}; the balance slot is
+        None unless with_balance is set. The blocking calls behind it
+        (resolving a new price source, refreshing the ETH/USD quote used to
+        decode WETH-quoted prices) run on the rpc pool instead of the loop."""
+        unresolved = []
+        for _, config in items:
+            token, chain_id, pool = config["token"], config["chain_id"], config["pool"]
+            if self._cached_price((chain_id, token)) is not None:
+                continue
+            src_key = self._price_source_key(token, chain_id, pool)
+            if src_key is not None and src_key not in self._price_sources:
+                unresolved.append((token, chain_id, pool))
+        if unresolved:
+            errors = await asyncio.gather(
+                *(self._off_loop(self._price_source, *args) for args in unresolved),
+                return_exceptions=True,
+            )
+            for e in errors:
+                if isinstance(e, Exception):
+                    print(f"  Pool price error: {e}")
+
+        # Sources that failed to resolve are retried on the next call
+        plan = self._plan_fused_reads(items, with_balance)
+        batches = list(plan[0].values())
+        reads = [ctx.aaggregate(calls) for ctx, calls, _ in batches]
+        eth_usd = self._eth_usd_cache
+        if (not eth_usd or time.time() - eth_usd[0] >= PRICE_CACHE_TTL) and any(
+            tag[0] == "slot0" for _, _, tags in batches for tag in tags
+        ):
+            reads.append(self._off_loop(self.get_mainnet_price))
+        rets = await asyncio.gather(*reads)
+        results = [(tags, ret) for (_, _, tags), ret in zip(batches, rets)]
+        return self._collect_fused_reads(items, with_balance, plan, results)
+
+    def _plan_fused_reads(self, items, with_balance):
+        """Group the reads behind _afused_reads() into per-chain batches.
+        Returns (batches, prices, balances); prices already holds cache
+        hits. Tokens whose price source isn't resolved yet are left out."""
+        batches = {}  # id(ctx) -> (ctx, calls, tags)
+        prices = {}
+        balances = {}
+
+        def add(ctx, target, data, tag):
+            batch = batches.get(id(ctx))
+            if batch is None:
+                # Every chain read also reports the block it was served at
+                batch = batches[id(ctx)] = (
+                    ctx,
+                    [(ctx.multicall_cs, GET_BLOCK_NUMBER_SELECTOR)],
+                    [("block", ctx.chain_id, None)],
+                )
+            batch[1].append((target, data))
+            batch[2].append(tag)
+
+        for key, config in items:
+            chain_id = config["chain_id"]
+            token = config["token"]
+            if with_balance:
+                balances[key] = (0.0, 0, 18)
+                ctx = self.chain_ctx[chain_id]
+                dec_key = (chain_id, token)
+                if dec_key not in self._decimals_cache:
+                    add(ctx, _cs(token), DECIMALS_SELECTOR, ("decimals", key, dec_key))
+                add(
+                    ctx, _cs(token), self._balance_of_calldata, ("balance", key, dec_key)
+                )
 
-        if sqrt_price_x96 is None or sqrt_price_x96 == 0:
-            return None
-        if token_is_0 is None:
-            return None
+            cached = self._cached_price((chain_id, token))
+            if cached is not None:
+                prices[key] = cached
+                continue
+            src = self._price_sources.get(
+                self._price_source_key(token, chain_id, config["pool"])
+            )
+            if src is not None:
+                price_ctx, target, calldata, token_is_0 = src
+                add(price_ctx, target, calldata, ("slot0", key, (config, token_is_0)))
+
+        return batches, prices, balances
+
+    def _collect_fused_reads(self, items, with_balance, plan, results):
+        """Decode [(tags, aggregate results)] from a fused-read plan into
+        _afused_reads()'s return value."""
+        _, prices, balances = plan
+        for tags, rets in results:
+            # Tags are in call order, so a token's decimals always land
+            # before its balance
+            for (kind, key, arg), (ok, ret) in zip(tags, rets):
+                if not ok:
+                    continue
+                try:
+                    if kind == "block":
+                        self.last_blocks[key] = decode(["uint256"], ret)[0]
+                    elif kind == "decimals":
+                        self._decimals_cache[arg] = decode(["uint8"], ret)[0]
+                    elif kind == "balance":
+                        decimals = self._decimals_cache.get(arg)
+                        if decimals is None:
+                            continue
+                        raw = decode(["uint256"], ret)[0]
+                        balances[key] = (raw / (10**decimals), raw, decimals)
+                    else:
+                        config, token_is_0 = arg
+                        price = self._price_from_slot0(
+                            ret, token_is_0, config["pool"], config["decimals"]
+                        )
+                        if price is not None and price > 0:
+                            cache_key = (config["chain_id"], config["token"])
+                            self._store_price(cache_key, price)
+                            prices[key] = price
+                except Exception:
+                    continue
 
-        # sqrtPriceX96 → human price
-        price_raw = (sqrt_price_x96 / (2**96)) ** 2
+        return {
+            key: (prices.get(key), balances.get(key) if with_balance else None)
+            for key, _ in items
+        }
 
-        if token_is_0:
-            d0, d1 = token_decimals, quote_decimals
+    def _specialize_pool(self, pool):
+        """Resolve a pool's quote handling once instead of per price read.
+        Sets _quote_decimals and _usd_per_quote (USD value of one quote
+        token): stables are 1.0, WETH uses the mainnet ETH price, anything
+        else is reported in quote units."""
+        quote_type = (pool.get("quote_token") or "").upper()
+        pool["_quote_decimals"] = 6 if quote_type in ("USDC", "USDT") else 18
+        if quote_type in ("WETH", "ETH"):
+            pool["_usd_per_quote"] = self._eth_quote_usd
         else:
-            d0, d1 = quote_decimals, token_decimals
-
-        price_human = price_raw * (10 ** (d0 - d1))
-
-        if token_is_0:
-            token_price_in_quote = price_human
+            pool["_usd_per_quote"] = _unit_quote_usd
+        return pool
+
+    def _eth_quote_usd(self):
+        return self.get_mainnet_price() or 1.0
+
+    def _v4_pool_id(self, token_addr, quote_addr, fee_tier):
+        """PoolId (keccak of the ABI-encoded PoolKey) for a token/quote pair.
+        Returns (pool_id, token_is_0). Pure function of its inputs, so the
+        sort + encode + keccak only runs once per pair."""
+        cache_key = (token_addr.lower(), quote_addr.lower(), fee_tier)
+        cached = self._pool_id_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        tick_spacing_map = {100: 1, 500: 10, 3000: 60, 10000: 200}
+        tick_spacing = tick_spacing_map.get(fee_tier, 60)
+
+        addr_in = _cs(token_addr)
+        addr_quote = _cs(quote_addr)
+
+        if _addr_lt(addr_in, addr_quote):
+            currency0, currency1 = addr_in, addr_quote
+            token_is_0 = True
         else:
-            if price_human <= 0:
-                return None
-            token_price_in_quote = 1.0 / price_human
+            currency0, currency1 = addr_quote, addr_in
+            token_is_0 = False
 
-        # Convert to USD
-        if quote_type in ("USDC", "USDT", "DAI"):
-            return token_price_in_quote
-        elif quote_type in ("WETH", "ETH"):
-            eth_price = self.get_mainnet_price()
-            if eth_price:
-                return token_price_in_quote * eth_price
+        hooks = "0x0000000000000000000000000000000000000000"
+        pool_key_encoded = encode(
+            ["address", "address", "uint24", "int24", "address"],
+            [currency0, currency1, fee_tier, tick_spacing, hooks],
+        )
+        pool_id = Web3.keccak(pool_key_encoded)
 
-        return token_price_in_quote
+        self._pool_id_cache[cache_key] = (pool_id, token_is_0)
+        return pool_id, token_is_0
 
     # -- On-chain pool discovery via V3 Factory --
 
@@ -714,62 +1595,64 @@ class AutonomousTrader:
         ctx = self.chain_ctx.get(chain_id)
         if not ctx:
             return None
-        cfg = CHAINS[chain_id]
-        factory_addr = cfg.get("v3_factory")
-        if not factory_addr:
+        if not ctx.factory_cs:
             return None
 
-        factory = ctx.w3.eth.contract(
-            address=Web3.to_checksum_address(factory_addr), abi=V3_FACTORY_ABI
-        )
-        token_cs = Web3.to_checksum_address(token_addr)
+        token_cs = _cs(token_addr)
         zero = "0x0000000000000000000000000000000000000000"
 
         # Try WETH then USDC as quote
         quote_options = [
-            (cfg["weth"], "WETH", cfg.get("weth_decimals", 18)),
-            (cfg["usdc"], "USDC", cfg.get("usdc_decimals", 6)),
+            (ctx.weth_cs, "WETH", ctx.weth_decimals),
+            (ctx.usdc_cs, "USDC", ctx.usdc_decimals),
         ]
 
-        best = None
+        # Every (quote, fee) getPool lookup resolves in one Multicall3 call
+        queries = []
         for quote_addr, quote_sym, q_dec in quote_options:
-            quote_cs = Web3.to_checksum_address(quote_addr)
-            if token_cs.lower() == quote_cs.lower():
+            if token_cs == quote_addr:
                 continue
             for fee in V3_FEE_TIERS:
-                try:
-                    pool_addr = factory.functions.getPool(
-                        token_cs, quote_cs, fee
-                    ).call()
-                    if pool_addr == zero:
-                        continue
-                    # Pool exists — register it
-                    chain_name = cfg["name"]
-                    chain_key = str(chain_id)
-                    self.registry.add_pool(
-                        token_address=token_addr.lower(),
-                        pool_address=pool_addr.lower(),
-                        chain=chain_key,
-                        dex="uniswap_v3",
-                        fee_tier=fee,
-                        quote_token=quote_sym,
-                        quote_token_address=quote_addr.lower(),
-                    )
-                    print(
-                        f"  [V3] Found {quote_sym} pool on "
-                        f"{chain_name} fee={fee} "
-                        f"({pool_addr[:10]}...)"
-                    )
-                    if best is None:
-                        best = {
-                            "pool_address": pool_addr.lower(),
-                            "dex": "uniswap_v3",
-                            "fee_tier": fee,
-                            "quote_token": quote_sym,
-                            "quote_token_address": quote_addr.lower(),
-                        }
-                except Exception:
-                    continue
+                calldata = GET_POOL_SELECTOR + encode(
+                    ["address", "address", "uint24"], [token_cs, quote_addr, fee]
+                )
+                queries.append((quote_addr, quote_sym, fee, calldata))
+
+        results = ctx.aggregate([(ctx.factory_cs, q[3]) for q in queries])
+
+        best = None
+        for (quote_addr, quote_sym, fee, _), (ok, ret) in zip(queries, results):
+            if not ok or len(ret) < 32:
+                continue
+            pool_addr = decode(["address"], ret)[0].lower()
+            if pool_addr == zero:
+                continue
+            # Pool exists — register it
+            chain_name = ctx.name
+            chain_key = str(chain_id)
+            with self._registry_lock:
+                self.registry.add_pool(
+                    token_address=token_addr.lower(),
+                    pool_address=pool_addr,
+                    chain=chain_key,
+                    dex="uniswap_v3",
+                    fee_tier=fee,
+                    quote_token=quote_sym,
+                    quote_token_address=quote_addr.lower(),
+                )
+            print(
+                f"  [V3] Found {quote_sym} pool on "
+                f"{chain_name} fee={fee} "
+                f"({pool_addr[:10]}...)"
+            )
+            if best is None:
+                best = {
+                    "pool_address": pool_addr,
+                    "dex": "uniswap_v3",
+                    "fee_tier": fee,
+                    "quote_token": quote_sym,
+                    "quote_token_address": quote_addr.lower(),
+                }
         return best
 
     # -- Approval: ERC20 → Permit2 → UniversalRouter --
@@ -781,12 +1664,21 @@ class AutonomousTrader:
         2. Permit2.approve(token, UniversalRouter, max, expiration)
 
         Source: https://docs.uniswap.org/contracts/v4/quickstart/swap
+
+        Once both steps are confirmed the Permit2 expiration is remembered,
+        and later calls skip the allowance reads until it is within an hour
+        of expiring.
         """
+        approval_key = (chain_id, token_addr.lower())
+        known_expiration = self._approval_state.get(approval_key, 0)
+        if known_expiration >= time.time() + 3600:
+            return True
+
         ctx = self.chain_ctx[chain_id]
-        addr = Web3.to_checksum_address(token_addr)
-        router_addr = Web3.to_checksum_address(ctx.config["universal_router"])
-        permit2_addr = Web3.to_checksum_address(PERMIT2)
-        token = ctx.w3.eth.contract(address=addr, abi=ERC20_ABI)
+        addr = _cs(token_addr)
+        router_addr = ctx.router_cs
+        permit2_addr = ctx.permit2_cs
+        token = ctx.erc20(addr)
 
         # Step 1: ERC20 → Permit2
         erc20_allowance = token.functions.allowance(
@@ -800,14 +1692,14 @@ class AutonomousTrader:
                 ).build_transaction(
                     {
                         "from": self.account.address,
-                        "nonce": self.get_nonce(chain_id),
                         "gas": 100000,
                         **gas_params,
                     }
                 )
-                signed = self.account.sign_transaction(tx)
-                tx_hash = ctx.w3.eth.send_raw_transaction(signed.raw_transaction)
-                receipt = ctx.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                tx_hash = self._send_tx(chain_id, tx)
+                receipt = ctx.w3.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=120, poll_latency=ctx.block_time
+                )
                 if receipt["status"] != 1:
                     print(f"  ERC20→Permit2 approval failed for {addr}")
                     return False
@@ -823,6 +1715,7 @@ class AutonomousTrader:
         p2_amount = p2_allowance[0]
         p2_expiration = p2_allowance[1]
         now_ts = int(time.time())
+        approved_until = p2_expiration
 
         if p2_amount < 2**128 or p2_expiration < now_ts + 3600:
             try:
@@ -834,22 +1727,24 @@ class AutonomousTrader:
                 ).build_transaction(
                     {
                         "from": self.account.address,
-                        "nonce": self.get_nonce(chain_id),
                         "gas": 100000,
                         **gas_params,
                     }
                 )
-                signed = self.account.sign_transaction(tx)
-                tx_hash = ctx.w3.eth.send_raw_transaction(signed.raw_transaction)
-                receipt = ctx.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                tx_hash = self._send_tx(chain_id, tx)
+                receipt = ctx.w3.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=120, poll_latency=ctx.block_time
+                )
                 if receipt["status"] != 1:
                     print(f"  Permit2→Router approval failed for {addr}")
                     return False
                 print(f"  Permit2→Router approved: {tx_hash.hex()[:16]}...")
+                approved_until = expiration
             except Exception as e:
                 print(f"  Permit2→Router approval error: {e}")
                 return False
 
+        self._approval_state[approval_key] = approved_until
         return True
 
     # -- V4 Swap Encoding --
@@ -876,73 +1771,26 @@ class AutonomousTrader:
 
         Source: https://docs.uniswap.org/contracts/v4/quickstart/swap
         """
-        addr_in = Web3.to_checksum_address(token_in)
-        addr_out = Web3.to_checksum_address(token_out)
-
-        # PoolKey requires currency0 < currency1 (sorted by address)
-        if int(addr_in, 16) < int(addr_out, 16):
-            currency0 = addr_in
-            currency1 = addr_out
-            zero_for_one = True
-        else:
-            currency0 = addr_out
-            currency1 = addr_in
-            zero_for_one = False
-
-        if tick_spacing is None:
-            # Default tick spacing by fee tier
-            tick_spacing_map = {100: 1, 500: 10, 3000: 60, 10000: 200}
-            tick_spacing = tick_spacing_map.get(fee_tier, 60)
-
-        hooks_addr = hooks or "0x0000000000000000000000000000000000000000"
-
-        # Commands: single byte for V4_SWAP
-        commands = bytes([V4_SWAP_COMMAND])
-
-        # Actions: packed bytes
-        actions = bytes(
-            [
-                ACTION_SWAP_EXACT_IN_SINGLE,
-                ACTION_SETTLE_ALL,
-                ACTION_TAKE_ALL,
-            ]
+        pool_key, zero_for_one, addr_in, addr_out = _v4_swap_pool_key(
+            token_in, token_out, fee_tier, tick_spacing, hooks
         )
 
-        # Encode ExactInputSingleParams
-        # Struct: (PoolKey, bool zeroForOne, uint128 amountIn,
-        #          uint128 amountOutMinimum, bytes hookData)
-        # PoolKey: (address currency0, address currency1, uint24 fee,
-        #           int24 tickSpacing, address hooks)
-        swap_params = encode(
-            [
-                "(address,address,uint24,int24,address)",  # PoolKey
-                "bool",  # zeroForOne
-                "uint128",  # amountIn
-                "uint128",  # amountOutMinimum
-                "bytes",
-            ],  # hookData
-            [
-                (currency0, currency1, fee_tier, tick_spacing, hooks_addr),
-                zero_for_one,
-                amount_in,
-                min_amount_out,
-                b"",  # empty hookData
-            ],
+        # Encode ExactInputSingleParams (empty hookData)
+        swap_params = _SWAP_PARAMS_ENC(
+            (pool_key, zero_for_one, amount_in, min_amount_out, b"")
         )
 
         # Settle params: (currency, maxAmount)
-        settle_currency = addr_in
-        settle_params = encode(["address", "uint128"], [settle_currency, amount_in])
+        settle_params = _CURRENCY_AMOUNT_ENC((addr_in, amount_in))
 
         # Take params: (currency, minAmount)
-        take_currency = addr_out
-        take_params = encode(["address", "uint128"], [take_currency, min_amount_out])
+        take_params = _CURRENCY_AMOUNT_ENC((addr_out, min_amount_out))
 
         # Encode the V4_SWAP input: (bytes actions, bytes[] params)
-        params_array = [swap_params, settle_params, take_params]
-        v4_input = encode(["bytes", "bytes[]"], [actions, params_array])
+        params_array = (swap_params, settle_params, take_params)
+        v4_input = _V4_INPUT_ENC((V4_ACTIONS_BYTES, params_array))
 
-        return commands, [v4_input]
+        return V4_COMMANDS_BYTES, [v4_input]
 
     # -- Swap execution --
 
@@ -950,7 +1798,7 @@ class AutonomousTrader:
         """Return True if chain has >= GAS_RESERVE_ETH native balance."""
         ctx = self.chain_ctx[chain_id]
         bal_wei = ctx.w3.eth.get_balance(self.account.address)
-        bal_eth = float(ctx.w3.from_wei(bal_wei, "ether"))
+        bal_eth = bal_wei / 1e18
         if bal_eth < GAS_RESERVE_ETH:
             chain_name = CHAINS[chain_id]["name"]
             print(
@@ -961,9 +1809,22 @@ class AutonomousTrader:
         return True
 
     def _execute_swap(
-        self, token_in, token_out, amount_in_wei, fee_tier, label, chain_id, min_out=0
+        self,
+        token_in,
+        token_out,
+        amount_in_wei,
+        fee_tier,
+        label,
+        chain_id,
+        min_out=0,
+        wait=True,
+        on_receipt=None,
     ):
-        """Execute a V4 swap via UniversalRouter. Returns (tx_hash, gas_eth)."""
+        """Execute a V4 swap via UniversalRouter. Returns (tx_hash, gas_eth).
+
+        With wait=False the call returns (tx_hash, 0) right after broadcast;
+        the receipt is reconciled by the background receipt worker, which
+        calls on_receipt(gas_eth, ok) once the swap is mined."""
         # Hard gas reserve check — NEVER go below 0.01 ETH
         if not self._check_gas_reserve(chain_id):
             return None, 0
@@ -985,45 +1846,99 @@ class AutonomousTrader:
             deadline = int(time.time()) + 300  # 5 min deadline
             gas_params = self.get_gas_params(chain_id)
 
-            tx = ctx.router.functions.execute(
-                commands, inputs, deadline
-            ).build_transaction(
-                {
-                    "from": self.account.address,
-                    "nonce": self.get_nonce(chain_id),
-                    "gas": 600000,
-                    "value": 0,
-                    **gas_params,
-                }
-            )
+            # Calldata is encoded directly; the tx dict is what
+            # build_transaction() would produce with these fixed fields
+            data = EXECUTE_SELECTOR + _EXECUTE_ARGS_ENC((commands, inputs, deadline))
+            tx = {
+                "to": ctx.router_cs,
+                "data": data,
+                "from": self.account.address,
+                "gas": 600000,
+                "value": 0,
+                "chainId": chain_id,
+                **gas_params,
+            }
 
-            signed = self.account.sign_transaction(tx)
-            tx_hash = ctx.w3.eth.send_raw_transaction(signed.raw_transaction)
-            chain_name = CHAINS[chain_id]["name"]
-            print(f"  {label} [{chain_name}] tx: {tx_hash.hex()[:16]}...")
+            tx_hash = self._send_tx(chain_id, tx)
+            print(f"  {label} [{ctx.name}] tx: {tx_hash.hex()[:16]}...")
+
+            if not wait:
+                with self._pending_lock:
+                    self._pending_receipts[tx_hash] = {
+                        "chain_id": chain_id,
+                        "label": label,
+                        "ts": time.time(),
+                        "next_poll": time.time() + ctx.block_time,
+                        "on_receipt": on_receipt,
+                    }
+                return tx_hash.hex(), 0
 
-            receipt = ctx.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-            if receipt["status"] == 1:
-                gas_cost_wei = receipt["gasUsed"] * receipt["effectiveGasPrice"]
-                gas_cost_eth = float(ctx.w3.from_wei(gas_cost_wei, "ether"))
-                print(
-                    f"  {label} confirmed "
-                    f"(gas: {receipt['gasUsed']} units, "
-                    f"{gas_cost_eth:.6f} ETH)"
-                )
+            receipt = ctx.w3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=120, poll_latency=ctx.block_time
+            )
+            gas_cost_eth = self._reconcile_receipt(label, receipt)
+            if gas_cost_eth is not None:
                 return tx_hash.hex(), gas_cost_eth
-
-            print(f"  {label} reverted on-chain")
             return None, 0
 
         except Exception as e:
             print(f"  {label} error: {e}")
             return None, 0
 
+    def _reconcile_receipt(self, label, receipt):
+        """Log a swap receipt. Returns gas paid in ETH, or None if the swap
+        reverted."""
+        if receipt["status"] == 1:
+            gas_cost_wei = receipt["gasUsed"] * receipt["effectiveGasPrice"]
+            gas_cost_eth = gas_cost_wei / 1e18
+            print(
+                f"  {label} confirmed "
+                f"(gas: {receipt['gasUsed']} units, "
+                f"{gas_cost_eth:.6f} ETH)"
+            )
+            return gas_cost_eth
+
+        print(f"  {label} reverted on-chain")
+        return None
+
+    def _receipt_worker(self):
+        """Daemon loop reconciling swaps sent with wait=False. Each pending
+        tx is polled at its chain's block time and dropped after 10 min."""
+        while True:
+            time.sleep(0.5)
+            now = time.time()
+            with self._pending_lock:
+                due = [
+                    (h, e) for h, e in self._pending_receipts.items()
+                    if e["next_poll"] <= now
+                ]
+            for tx_hash, entry in due:
+                ctx = self.chain_ctx[entry["chain_id"]]
+                try:
+                    receipt = ctx.w3.eth.get_transaction_receipt(tx_hash)
+                except Exception:
+                    # Not mined yet (or RPC hiccup)
+                    if now - entry["ts"] > 600:
+                        print(f"  {entry['label']} receipt timed out")
+                        with self._pending_lock:
+                            self._pending_receipts.pop(tx_hash, None)
+                    else:
+                        entry["next_poll"] = now + ctx.block_time
+                    continue
+
+                with self._pending_lock:
+                    self._pending_receipts.pop(tx_hash, None)
+                gas_eth = self._reconcile_receipt(entry["label"], receipt)
+                if entry["on_receipt"]:
+                    try:
+                        entry["on_receipt"](gas_eth or 0, gas_eth is not None)
+                    except Exception as e:
+                        print(f"  {entry['label']} receipt callback error: {e}")
+
     def swap_token_to_usdc(self, token_addr, amount, decimals, fee_tier, chain_id):
         """Sell token for USDC on a specific chain."""
         amount_wei = int(amount * (10**decimals))
-        usdc = CHAINS[chain_id]["usdc"]
+        usdc = self.chain_ctx[chain_id].usdc_cs
         return self._execute_swap(
             token_addr, usdc, amount_wei, fee_tier, f"{token_addr[:8]}→USDC", chain_id
         )
@@ -1031,7 +1946,7 @@ class AutonomousTrader:
     def swap_usdc_to_token(self, token_addr, usdc_amount, fee_tier, chain_id):
         """Buy token with USDC on a specific chain."""
         amount_wei = int(usdc_amount * 1e6)
-        usdc = CHAINS[chain_id]["usdc"]
+        usdc = self.chain_ctx[chain_id].usdc_cs
         return self._execute_swap(
             usdc, token_addr, amount_wei, fee_tier, f"USDC→{token_addr[:8]}", chain_id
         )
@@ -1050,7 +1965,11 @@ class AutonomousTrader:
         chain_id=None,
         gas_eth=0,
         gas_usd=0,
+        timestamp=None,
     ):
+        """Report a trade to the API server. The payload is built here; the
+        POST runs on the trade-log pool and is not waited on. timestamp is
+        an ISO string; defaults to now."""
         try:
             chain_name = CHAINS[chain_id]["name"] if chain_id else "Unknown"
             payload = {
@@ -1066,9 +1985,15 @@ class AutonomousTrader:
                 "chain_id": chain_id,
                 "execution_network": chain_name,
                 "pricing_source": "mainnet",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
             }
-            requests.post(f"{API_SERVER}/api/trade", json=payload, timeout=5)
+            self._trade_pool.submit(self._post_trade, payload)
+        except Exception:
+            pass
+
+    def _post_trade(self, payload):
+        try:
+            self._http.post(f"{API_SERVER}/api/trade", json=payload, timeout=5)
         except Exception:
             pass
 
@@ -1079,26 +2004,22 @@ class AutonomousTrader:
             per_chain = {}
             new_tokens_detected = []
 
-            for chain_id, ctx in self.chain_ctx.items():
-                cfg = CHAINS[chain_id]
-                eth_bal = float(
-                    ctx.w3.from_wei(
-                        ctx.w3.eth.get_balance(self.account.address), "ether"
-                    )
-                )
-                weth_bal, _, _ = self.get_balance(cfg["weth"], chain_id)
-                usdc_bal, _, _ = self.get_balance(cfg["usdc"], chain_id)
-                block = ctx.w3.eth.block_number
+            # Chains are synced concurrently; total time is the slowest chain
+            chain_ids = list(self.chain_ctx)
+            results = []
+            if chain_ids:
+                with ThreadPoolExecutor(max_workers=len(chain_ids)) as pool:
+                    results = list(pool.map(self._sync_one_chain, chain_ids))
+
+            for chain_id, (balances, new_tokens) in zip(chain_ids, results):
+                eth_bal, weth_bal, usdc_bal, block = balances
                 per_chain[str(chain_id)] = {
-                    "name": cfg["name"],
+                    "name": self.chain_ctx[chain_id].name,
                     "eth": round(eth_bal, 6),
                     "weth": round(weth_bal, 6),
                     "usdc": round(usdc_bal, 6),
                     "block": block,
                 }
-
-                # Check for new tokens from whitelisted addresses using Etherscan API
-                new_tokens = self._check_new_tokens_from_whitelist(chain_id, ctx)
                 new_tokens_detected.extend(new_tokens)
 
             # Aggregate totals
@@ -1116,33 +2037,56 @@ class AutonomousTrader:
                 "pricing_source": "Mainnet",
                 "mainnet_price": (round(eth_price, 2) if eth_price else None),
                 "total_pnl": round(self.total_pnl, 4),
-                "positions": {k: len(v) for k, v in self.positions.items() if v},
+                "positions": {
+                    _encode_key(k): len(v) for k, v in self.positions.items() if v
+                },
                 "updated": datetime.now().isoformat(),
             }
-            with open("/tmp/bot_wallet.json", "w") as f:
-                json.dump(wallet_data, f, indent=2)
+            self._write_json(
+                "/tmp/bot_wallet.json", wallet_data, indent=STATE_JSON_INDENT
+            )
 
             # Automatically enter new tokens with trading strategies
-            for token_info in new_tokens_detected:
-                self._enter_token_with_strategy(token_info)
+            self._enter_tokens_with_strategy(new_tokens_detected)
 
             return total_eth, total_weth, total_usdc
         except Exception as e:
             print(f"  Wallet sync error: {e}")
             return None, None, None
 
+    def _sync_one_chain(self, chain_id):
+        """Balances for one chain (one JSON-RPC batch) plus any new tokens
+        from whitelisted senders. Returns ((eth, weth, usdc, block), new_tokens)."""
+        balances = self._fetch_wallet_balances(chain_id)
+        # Check for new tokens from whitelisted addresses using Etherscan API
+        new_tokens = self._check_new_tokens_from_whitelist(
+            chain_id, self.chain_ctx[chain_id]
+        )
+        return balances, new_tokens
+
     # -- Emergency controls --
 
+    def _flag_set(self, path):
+        """os.path.exists(path), reused for FLAG_CHECK_TTL seconds."""
+        now = time.monotonic()
+        cached = self._flag_cache.get(path)
+        if cached is not None and now - cached[1] < FLAG_CHECK_TTL:
+            return cached[0]
+        exists = os.path.exists(path)
+        self._flag_cache[path] = (exists, now)
+        return exists
+
     def check_stop(self):
         """Check if emergency stop flag is set."""
-        return os.path.exists(STOP_FLAG)
+        return self._flag_set(STOP_FLAG)
 
     def check_sell_all(self):
         """Check if sell-all flag is set."""
-        return os.path.exists(SELL_ALL_FLAG)
+        return self._flag_set(SELL_ALL_FLAG)
 
     def clear_sell_all(self):
         """Remove sell-all flag after processing."""
+        self._flag_cache.pop(SELL_ALL_FLAG, None)
         try:
             os.remove(SELL_ALL_FLAG)
         except FileNotFoundError:
@@ -1150,82 +2094,73 @@ class AutonomousTrader:
 
     def sell_all_to_usdc(self, eth_price):
         """Liquidate all positions across all chains to USDC.
-        Respects GAS_RESERVE_ETH — skips chains below reserve."""
+        Respects GAS_RESERVE_ETH — skips chains below reserve.
+
+        Every token swap is broadcast at once (chains in parallel, same-chain
+        txs on the local nonce counter). WETH left by WETH-quoted pools is
+        then swept to USDC once per chain."""
         print("  EMERGENCY: Selling all positions to USDC")
 
-        for pos_key, pos_list in list(self.positions.items()):
+        jobs = []
+        for (chain_id, token_addr), pos_list in list(self.positions.items()):
             if not pos_list:
                 continue
 
-            # pos_key = "chain_id:token_addr"
-            parts = pos_key.split(":", 1)
-            if len(parts) != 2:
-                continue
-            chain_id = int(parts[0])
-            token_addr = parts[1]
-
             if chain_id not in self.chain_ctx:
                 print(f"  No context for chain {chain_id}, skipping")
                 continue
 
-            chain_config = CHAINS[chain_id]
-            usdc_addr = chain_config["usdc"]
-            weth_addr = chain_config["weth"]
-
-            pool = self.registry.get_best_pool(token_addr, str(chain_id))
-            if not pool:
-                print(f"  No pool for {token_addr} on {chain_config['name']}, skipping")
-                continue
-
-            human_bal, raw_bal, decimals = self.get_balance(token_addr, chain_id)
-            if human_bal < 0.000001:
-                continue
-
-            fee_tier = pool.get("fee_tier", 3000)
+            jobs.append((chain_id, token_addr, pos_list))
 
-            total_gas_eth = 0
-            if pool.get("quote_token") == "WETH":
-                tx, gas = self._execute_swap(
-                    token_addr,
-                    weth_addr,
-                    raw_bal,
-                    fee_tier,
-                    f"LIQUIDATE {token_addr[:8]}→WETH",
-                    chain_id,
+        results = []
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(len(jobs), 16)) as pool:
+                results = list(
+                    pool.map(
+                        self._liquidate_token,
+                        [job[0] for job in jobs],
+                        [job[1] for job in jobs],
+                    )
                 )
-                total_gas_eth += gas
-                if tx:
-                    weth_bal, weth_raw, _ = self.get_balance(weth_addr, chain_id)
-                    if weth_raw > 0:
-                        _, gas2 = self._execute_swap(
-                            weth_addr,
-                            usdc_addr,
-                            weth_raw,
-                            500,
-                            "LIQUIDATE WETH→USDC",
-                            chain_id,
-                        )
-                        total_gas_eth += gas2
-            else:
-                tx, gas = self._execute_swap(
-                    token_addr,
-                    usdc_addr,
-                    raw_bal,
-                    fee_tier,
-                    f"LIQUIDATE {token_addr[:8]}→USDC",
-                    chain_id,
+
+        # WETH → USDC, once per chain that received WETH
+        weth_sells = {}  # {chain_id: landed WETH-quoted sells}
+        for (chain_id, _, _), res in zip(jobs, results):
+            if res and res[0] and res[2]:
+                weth_sells[chain_id] = weth_sells.get(chain_id, 0) + 1
+        sweep_gas = {}
+        if weth_sells:
+            weth_chains = list(weth_sells)
+            with ThreadPoolExecutor(max_workers=len(weth_chains)) as pool:
+                sweep_gas = dict(
+                    zip(weth_chains, pool.map(self._sweep_weth_to_usdc, weth_chains))
                 )
-                total_gas_eth += gas
 
-            gas_usd = self.gas_cost_usd(total_gas_eth, eth_price)
-            for pos in pos_list:
-                entry_price = pos.get("entry_price_usd", pos.get("entry_price", 0))
-                gross_pnl = (eth_price - entry_price) * pos["amount"]
-                share = total_gas_eth / len(pos_list)
-                share_usd = gas_usd / len(pos_list)
-                net_pnl = gross_pnl - share_usd
-                self.total_pnl += net_pnl
-                self.trade_count += 1
+        # Bookkeeping runs here on the caller's thread, so totals need no lock
+        for (chain_id, token_addr, pos_list), res in zip(jobs, results):
+            if res is None:
+                continue
+            tx, total_gas_eth, via_weth = res
+            if tx and via_weth:
+                # The sweep's gas is shared by the chain's WETH-quoted sells
+                total_gas_eth += sweep_gas.get(chain_id, 0) / weth_sells[chain_id]
+
+            n = len(pos_list)
+            share = total_gas_eth / n
+            share_usd = self.gas_cost_usd(total_gas_eth, eth_price) / n
+            entries = np.fromiter(
+                (p.get("entry_price_usd", p.get("entry_price", 0)) for p in pos_list),
+                dtype=np.float64,
+                count=n,
+            )
+            amounts = np.fromiter(
+                (p["amount"] for p in pos_list), dtype=np.float64, count=n
+            )
+            nets = (eth_price - entries) * amounts - share_usd
+            self.total_pnl += float(nets.sum())
+            self.trade_count += n
+
+            for pos, net_pnl in zip(pos_list, nets.tolist()):
                 self.record_trade(
                     "SELL",
                     token_addr,
@@ -1240,16 +2175,71 @@ class AutonomousTrader:
                 )
 
         self.positions = {}
-        self._save_state()
+        self._journal("clear")
+        self._save_state(force=True)
         self.clear_sell_all()
         print("  EMERGENCY: All positions liquidated")
 
+    def _liquidate_token(self, chain_id, token_addr):
+        """Swap the full balance of one token to its pool's quote token.
+        Returns (tx_hash, gas_eth, via_weth), or None if there is nothing
+        to sell."""
+        ctx = self.chain_ctx[chain_id]
+
+        pool = self.registry.get_best_pool(token_addr, str(chain_id))
+        if not pool:
+            print(f"  No pool for {token_addr} on {ctx.name}, skipping")
+            return None
+
+        human_bal, raw_bal, decimals = self.get_balance(token_addr, chain_id)
+        if human_bal < 0.000001:
+            return None
+
+        fee_tier = pool.get("fee_tier", 3000)
+
+        if pool.get("quote_token") == "WETH":
+            tx, gas = self._execute_swap(
+                token_addr,
+                ctx.weth_cs,
+                raw_bal,
+                fee_tier,
+                f"LIQUIDATE {token_addr[:8]}→WETH",
+                chain_id,
+            )
+            return tx, gas, True
+
+        tx, gas = self._execute_swap(
+            token_addr,
+            ctx.usdc_cs,
+            raw_bal,
+            fee_tier,
+            f"LIQUIDATE {token_addr[:8]}→USDC",
+            chain_id,
+        )
+        return tx, gas, False
+
+    def _sweep_weth_to_usdc(self, chain_id):
+        """Swap the chain's whole WETH balance to USDC. Returns gas in ETH."""
+        ctx = self.chain_ctx[chain_id]
+        weth_bal, weth_raw, _ = self.get_balance(ctx.weth_cs, chain_id)
+        if weth_raw <= 0:
+            return 0
+        _, gas = self._execute_swap(
+            ctx.weth_cs,
+            ctx.usdc_cs,
+            weth_raw,
+            500,
+            "LIQUIDATE WETH→USDC",
+            chain_id,
+        )
+        return gas
+
     # -- Token activation --
 
     def activate_token(self, token_address, chain_id, symbol=None, decimals=18):
         """After pool discovery, activate token for trading."""
         addr = token_address.lower()
-        pos_key = f"{chain_id}:{addr}"
+        pos_key = (chain_id, addr)
         pool = self.registry.get_best_pool(addr, str(chain_id))
 
         # If no pool or missing quote_token_address, discover
@@ -1262,10 +2252,11 @@ class AutonomousTrader:
                 return
 
         self._active_tokens[pos_key] = {
+            "token": addr,
             "symbol": symbol or "???",
             "decimals": decimals,
             "chain_id": chain_id,
-            "pool": pool,
+            "pool": self._specialize_pool(pool),
         }
         chain_name = CHAINS[chain_id]["name"]
         self.whitelist.set_token_status(addr, chain_id, "active")
@@ -1285,18 +2276,18 @@ class AutonomousTrader:
         """Persist activated token and pool to JSON files.
         - tokens/erc20/addresses.json — token contracts
         - tokens/pools/discovered.json — pool contracts
+        Both files are read once and then kept in memory; a file is only
+        rewritten when its contents change.
         """
         cid = str(chain_id)
 
         # Save token to erc20/addresses.json
         try:
-            if self.TOKEN_ADDRESSES_FILE.exists():
-                data = json.loads(self.TOKEN_ADDRESSES_FILE.read_text())
-            else:
-                data = {}
-            chain_tokens = data.setdefault(cid, {})
+            if self._token_addresses is None:
+                self._token_addresses = self._read_json_file(self.TOKEN_ADDRESSES_FILE)
+            chain_tokens = self._token_addresses.setdefault(cid, {})
             chain_tokens[symbol.lower()] = addr
-            self.TOKEN_ADDRESSES_FILE.write_text(json.dumps(data, indent=2) + "\n")
+            self._write_json(self.TOKEN_ADDRESSES_FILE, self._token_addresses, indent=2)
         except Exception as e:
             print(f"  [Warn] Could not save token: {e}")
 
@@ -1304,11 +2295,9 @@ class AutonomousTrader:
         pool = self.registry.get_best_pool(addr, cid)
         if pool:
             try:
-                if self.POOLS_FILE.exists():
-                    pdata = json.loads(self.POOLS_FILE.read_text())
-                else:
-                    pdata = {}
-                chain_pools = pdata.setdefault(cid, {})
+                if self._discovered_pools is None:
+                    self._discovered_pools = self._read_json_file(self.POOLS_FILE)
+                chain_pools = self._discovered_pools.setdefault(cid, {})
                 chain_pools[symbol.lower()] = {
                     "token": addr,
                     "pool": pool.get("pool_address"),
@@ -1318,10 +2307,35 @@ class AutonomousTrader:
                     "quote_address": pool.get("quote_token_address"),
                 }
                 self.POOLS_FILE.parent.mkdir(parents=True, exist_ok=True)
-                self.POOLS_FILE.write_text(json.dumps(pdata, indent=2) + "\n")
+                self._write_json(self.POOLS_FILE, self._discovered_pools, indent=2)
             except Exception as e:
                 print(f"  [Warn] Could not save pool: {e}")
 
+    @staticmethod
+    def _read_json_file(path):
+        if not path.exists():
+            return {}
+        return ujson.loads(path.read_text())
+
+    def _write_json(self, path, data, indent=0):
+        """Write data as JSON via a temp file + os.replace, so readers never
+        see a partial file. Skips the write if the bytes are unchanged since
+        the last write to path. Returns True if the file was written."""
+        payload = ujson.dumps(data, indent=indent, escape_forward_slashes=False)
+        if indent:
+            payload += "\n"
+        payload = payload.encode()
+        key = str(path)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._json_digests.get(key) == digest:
+            return False
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        self._json_digests[key] = digest
+        return True
+
     # -- Wallet scan for existing tokens --
 
     def _load_static_addresses(self):
@@ -1351,13 +2365,16 @@ class AutonomousTrader:
             "polygon": 137,
         }
 
+        # Sorted so the registry sees the same insert order every run
         count = 0
-        for net_key, tokens in contracts.items():
+        for net_key in sorted(contracts):
+            tokens = contracts[net_key]
             chain_id = key_map.get(net_key.lower())
             if not chain_id:
                 continue
 
-            for symbol, addr in tokens.items():
+            for symbol in sorted(tokens):
+                addr = tokens[symbol]
                 if not addr:
                     continue
                 # Add to registry if missing
@@ -1393,62 +2410,78 @@ class AutonomousTrader:
             return
 
         sender_set = {s["address"].lower() for s in senders}
+
+        # Each pass fans out across chains; activation is serialized by
+        # _registry_lock
         found = 0
+        chain_ids = sorted(self.chain_ctx)
+        if chain_ids:
+            with ThreadPoolExecutor(max_workers=len(chain_ids)) as pool:
+                found += sum(
+                    pool.map(
+                        lambda cid: self._scan_chain_transfers(cid, sender_set),
+                        chain_ids,
+                    )
+                )
+                # Second pass: activate any tokens in registry (from
+                # monitor or addresses.json) that have pools and balances
+                found += sum(pool.map(self._scan_chain_registry, chain_ids))
 
-        for chain_id, ctx in self.chain_ctx.items():
-            cfg = CHAINS[chain_id]
-            chain_name = cfg["name"]
-            skip = {cfg["usdc"].lower(), cfg["weth"].lower()}
+        if found:
+            print(f"  Scan complete: {found} tokens activated")
+        else:
+            print("  Scan complete: no new tokens found")
 
-            try:
-                # Alchemy getAssetTransfers: find ERC20 transfers
-                # TO our wallet
-                resp = ctx.w3.provider.make_request(
-                    "alchemy_getAssetTransfers",
-                    [
-                        {
-                            "toAddress": self.account.address,
-                            "category": ["erc20"],
-                            "order": "desc",
-                            "maxCount": "0x64",  # last 100
-                            "withMetadata": True,
-                        }
-                    ],
-                )
-                transfers = resp.get("result", {}).get("transfers", [])
+    def _scan_chain_transfers(self, chain_id, sender_set):
+        """First scan pass for one chain: whitelisted ERC20 transfers into
+        the wallet. Returns the number of tokens activated."""
+        ctx = self.chain_ctx[chain_id]
+        chain_name = ctx.name
+        skip = ctx.base_tokens
+        found = 0
 
-                for tx in transfers:
-                    sender = (tx.get("from") or "").lower()
-                    if sender not in sender_set:
-                        continue
+        try:
+            transfers = self._alchemy_transfers(chain_id)
+            if transfers is None:
+                return 0
 
-                    addr = (tx.get("rawContract", {}).get("address") or "").lower()
-                    if not addr or addr in skip:
-                        continue
+            # Newest whitelisted transfer per token not already active
+            candidates = {}
+            for tx in transfers:
+                sender = (tx.get("from") or "").lower()
+                if sender not in sender_set:
+                    continue
 
-                    pos_key = f"{chain_id}:{addr}"
-                    if pos_key in self._active_tokens:
-                        continue
+                addr = (tx.get("rawContract", {}).get("address") or "").lower()
+                if not addr or addr in skip:
+                    continue
 
-                    # Check if we still hold a balance
-                    human_bal, raw_bal, decimals = self.get_balance(addr, chain_id)
-                    if human_bal <= 0:
-                        continue
+                if (chain_id, addr) in self._active_tokens:
+                    continue
 
-                    # Read symbol
-                    try:
-                        cs = Web3.to_checksum_address(addr)
-                        token_c = ctx.w3.eth.contract(address=cs, abi=ERC20_ABI)
-                        symbol = token_c.functions.symbol().call()
-                    except Exception:
-                        symbol = tx.get("asset") or "???"
+                candidates.setdefault(addr, (sender, tx))
 
-                    print(
-                        f"  [Scan] {symbol} on {chain_name} "
-                        f"from {sender[:10]}... "
-                        f"(bal: {human_bal:.6f})"
-                    )
+            # Balances and symbols for every candidate, one multicall each
+            balances = self.get_balances_bulk(candidates, chain_id)
+            symbols = self.get_symbols_bulk(
+                [a for a in candidates if balances[a][0] > 0], chain_id
+            )
+
+            for addr, (sender, tx) in candidates.items():
+                # Check if we still hold a balance
+                human_bal, raw_bal, decimals = balances[addr]
+                if human_bal <= 0:
+                    continue
+
+                symbol = symbols.get(addr) or tx.get("asset") or "???"
 
+                print(
+                    f"  [Scan] {symbol} on {chain_name} "
+                    f"from {sender[:10]}... "
+                    f"(bal: {human_bal:.6f})"
+                )
+
+                with self._registry_lock:
                     # Auto-whitelist token
                     self.whitelist.whitelist_token(
                         token_address=addr,
@@ -1468,31 +2501,37 @@ class AutonomousTrader:
                     else:
                         print(f"  [Scan] No pool for {symbol} on {chain_name}")
 
-            except Exception as e:
-                err = str(e)
-                if "alchemy" not in err.lower():
-                    print(f"  [Scan] {chain_name}: {err[:80]}")
+        except Exception as e:
+            err = str(e)
+            if "alchemy" not in err.lower():
+                print(f"  [Scan] {chain_name}: {err[:80]}")
 
-        # Second pass: activate any tokens in registry (from
-        # monitor or addresses.json) that have pools and balances
-        for chain_id, ctx in self.chain_ctx.items():
-            cfg = CHAINS[chain_id]
-            chain_name = cfg["name"]
-            skip = {cfg["usdc"].lower(), cfg["weth"].lower()}
+        return found
 
-            db_tokens = self.registry.get_all_tokens(chain=str(chain_id))
-            for t in db_tokens:
-                addr = t["address"].lower()
-                if addr in skip:
-                    continue
-                pos_key = f"{chain_id}:{addr}"
-                if pos_key in self._active_tokens:
-                    continue
+    def _scan_chain_registry(self, chain_id):
+        """Second scan pass for one chain: registry tokens with a pool and
+        a balance. Returns the number of tokens activated."""
+        ctx = self.chain_ctx[chain_id]
+        chain_name = ctx.name
+        skip = ctx.base_tokens
+        found = 0
 
-                human_bal, raw_bal, decimals = self.get_balance(addr, chain_id)
-                if human_bal <= 0:
-                    continue
+        with self._registry_lock:
+            db_tokens = self.registry.get_all_tokens(chain=str(chain_id))
+        db_tokens = [
+            t
+            for t in db_tokens
+            if t["address"].lower() not in skip
+            and (chain_id, t["address"].lower()) not in self._active_tokens
+        ]
+        balances = self.get_balances_bulk([t["address"] for t in db_tokens], chain_id)
+        for t in db_tokens:
+            addr = t["address"].lower()
+            human_bal, raw_bal, decimals = balances[addr]
+            if human_bal <= 0:
+                continue
 
+            with self._registry_lock:
                 pool = self.registry.get_best_pool(addr, str(chain_id))
                 if not pool:
                     pool = self.discover_v3_pool(addr, chain_id)
@@ -1506,116 +2545,180 @@ class AutonomousTrader:
                     )
                     found += 1
 
-        if found:
-            print(f"  Scan complete: {found} tokens activated")
-        else:
-            print("  Scan complete: no new tokens found")
+        return found
 
-    def _check_new_tokens_from_whitelist(self, chain_id, ctx):
-        """Check for new tokens from whitelisted addresses using Etherscan API."""
-        new_tokens = []
-        try:
-            # Get Etherscan API key
-            etherscan_key = os.getenv("ETHERSCAN_API_KEY")
-            if not etherscan_key:
-                return new_tokens
+    def _alchemy_transfers(self, chain_id, from_block=None):
+        """ERC20 transfers into the wallet via alchemy_getAssetTransfers,
+        newest first. Without from_block, the last 100; with it, every
+        transfer from that block on (paged oldest first, so none are cut
+        off). Returns None if the chain's RPC is not Alchemy (or the call
+        fails)."""
+        ctx = self.chain_ctx[chain_id]
+        query = {
+            "toAddress": self.account.address,
+            "category": ["erc20"],
+            "order": "desc",
+            "maxCount": "0x64",  # last 100
+            "withMetadata": True,
+        }
+        if from_block is not None:
+            query["order"] = "asc"
+            query["fromBlock"] = hex(from_block)
 
-            # Map chain ID to Etherscan API URL
-            etherscan_urls = {
-                1: "https://api.etherscan.io/api",
-                5: "https://api-goerli.etherscan.io/api",
-                11155111: "https://api-sepolia.etherscan.io/api",
-                10: "https://api-optimistic.etherscan.io/api",
-                420: "https://api-goerli-optimistic.etherscan.io/api",
-                11155420: "https://api-sepolia-optimistic.etherscan.io/api",
-                56: "https://api.bscscan.com/api",
-                97: "https://api-testnet.bscscan.com/api",
-                137: "https://api.polygonscan.com/api",
-                80001: "https://api-testnet.polygonscan.com/api",
-                42161: "https://api.arbiscan.io/api",
-                421613: "https://api-goerli.arbiscan.io/api",
-                421614: "https://api-sepolia.arbiscan.io/api",
-                8453: "https://api.basescan.org/api",
-                84531: "https://api-goerli.basescan.org/api",
-                84532: "https://api-sepolia.basescan.org/api",
-            }
+        transfers = []
+        while True:
+            try:
+                resp = ctx.w3.provider.make_request("alchemy_getAssetTransfers", [query])
+            except Exception as e:
+                err = str(e)
+                if "alchemy" not in err.lower():
+                    print(f"  [Scan] {ctx.name}: {err[:80]}")
+                return None
+            if "result" not in resp:
+                return None
+            transfers.extend(resp["result"].get("transfers", []))
+            page_key = resp["result"].get("pageKey")
+            if from_block is None or not page_key:
+                break
+            query["pageKey"] = page_key
+
+        if from_block is not None:
+            transfers.reverse()
+        return transfers
+
+    def _etherscan_transfers(self, chain_id):
+        """ERC20 transfers into the wallet from the chain's Etherscan-family
+        API (last 100), or [] if no API key / unsupported chain."""
+        if not ETHERSCAN_API_KEY:
+            return []
+
+        chain_url = ETHERSCAN_URLS.get(chain_id)
+        if not chain_url:
+            return []
+
+        # Query Etherscan API for ERC20 token transfers to our wallet
+        params = {
+            **ETHERSCAN_TOKENTX_PARAMS,
+            "address": self.account.address,
+            "apikey": ETHERSCAN_API_KEY,
+        }
 
-            chain_url = etherscan_urls.get(chain_id)
-            if not chain_url:
-                return new_tokens
+        response = self._http.get(chain_url, params=params, timeout=10)
+        if response.status_code != 200:
+            return []
+
+        data = response.json()
+        if data.get("status") != "1":
+            return []
 
+        return data.get("result", [])
+
+    def _check_new_tokens_from_whitelist(self, chain_id, ctx):
+        """Check for new tokens from whitelisted addresses. Uses the chain's
+        Alchemy transfer feed when available (incremental since the last
+        scan) and only falls back to the Etherscan API otherwise."""
+        new_tokens = []
+        try:
             # Get whitelisted senders
             senders = self.whitelist.get_all_senders()
             if not senders:
                 return new_tokens
 
             sender_addresses = {s["address"].lower() for s in senders}
+            wallet = self.account.address.lower()
+
+            # Normalize both feeds to
+            # (from, to, token, symbol, name, decimals, raw_amount)
+            # Only transfers after the last fully processed block
+            last_block = self._last_scan_block.get(chain_id)
+            alchemy = self._alchemy_transfers(
+                chain_id, None if last_block is None else last_block + 1
+            )
+            newest_block = None
+            if alchemy is not None:
+                newest_block = max(
+                    (int(tx["blockNum"], 16) for tx in alchemy if tx.get("blockNum")),
+                    default=None,
+                )
+                transfers = [
+                    (
+                        (tx.get("from") or "").lower(),
+                        (tx.get("to") or "").lower(),
+                        (tx.get("rawContract", {}).get("address") or "").lower(),
+                        tx.get("asset") or "???",
+                        tx.get("asset") or "Unknown",
+                        int(tx.get("rawContract", {}).get("decimal") or "0x12", 16),
+                        int(tx.get("rawContract", {}).get("value") or "0x0", 16),
+                    )
+                    for tx in alchemy
+                ]
+            else:
+                transfers = [
+                    (
+                        tx.get("from", "").lower(),
+                        tx.get("to", "").lower(),
+                        tx.get("contractAddress", "").lower(),
+                        tx.get("tokenSymbol", "???"),
+                        tx.get("tokenName", "Unknown"),
+                        int(tx.get("tokenDecimal", 18)),
+                        int(tx.get("value", 0)),
+                    )
+                    for tx in self._etherscan_transfers(chain_id)
+                ]
 
-            # Query Etherscan API for ERC20 token transfers to our wallet
-            params = {
-                "module": "account",
-                "action": "tokentx",
-                "address": self.account.address,
-                "sort": "desc",
-                "apikey": etherscan_key,
-                "page": 1,
-                "offset": 100,  # Last 100 transfers
-            }
-
-            response = requests.get(chain_url, params=params, timeout=10)
-            if response.status_code != 200:
-                return new_tokens
-
-            data = response.json()
-            if data.get("status") != "1":
-                return new_tokens
-
-            transfers = data.get("result", [])
-
-            # Check each transfer
-            for tx in transfers:
-                from_address = tx.get("from", "").lower()
-                to_address = tx.get("to", "").lower()
-                token_address = tx.get("contractAddress", "").lower()
-
+            # Newest qualifying transfer per unregistered token
+            candidates = {}
+            for (
+                from_address,
+                to_address,
+                token_address,
+                symbol,
+                name,
+                decimals,
+                amount,
+            ) in transfers:
                 # Only interested in transfers TO our wallet FROM whitelisted addresses
-                if (
-                    to_address != self.account.address.lower()
-                    or from_address not in sender_addresses
-                ):
+                if to_address != wallet or from_address not in sender_addresses:
+                    continue
+                if not token_address or token_address in ctx.base_tokens:
+                    continue
+                if token_address in candidates:
                     continue
 
                 # Check if we already have this token registered
-                existing_token = self.registry.get_token(token_address, str(chain_id))
+                with self._registry_lock:
+                    existing_token = self.registry.get_token(
+                        token_address, str(chain_id)
+                    )
                 if existing_token:
                     continue  # Already processed this token
 
-                # Get token metadata
-                symbol = tx.get("tokenSymbol", "???")
-                name = tx.get("tokenName", "Unknown")
-                decimals = int(tx.get("tokenDecimal", 18))
-                amount = int(tx.get("value", 0))
                 human_amount = amount / (10**decimals)
 
                 # Skip dust
                 if human_amount < 0.000001:
                     continue
 
-                # Check current balance to confirm we still hold it
-                current_balance, raw_balance, _ = self.get_balance(
-                    token_address, chain_id
-                )
+                candidates[token_address] = (from_address, symbol, name, decimals)
+
+            # Confirm we still hold each candidate, one multicall for all
+            balances = self.get_balances_bulk(candidates, chain_id)
+
+            for token_address, info in candidates.items():
+                from_address, symbol, name, decimals = info
+                current_balance = balances[token_address][0]
                 if current_balance <= 0:
                     continue
 
                 # Register the token
-                self.registry.add_token(
-                    address=token_address,
-                    chain=str(chain_id),
-                    symbol=symbol,
-                    name=name,
-                    decimals=decimals,
-                )
+                with self._registry_lock:
+                    self.registry.add_token(
+                        address=token_address,
+                        chain=str(chain_id),
+                        symbol=symbol,
+                        name=name,
+                        decimals=decimals,
+                    )
 
                 token_info = {
                     "address": token_address,
@@ -1634,62 +2737,134 @@ class AutonomousTrader:
                     f"bal: {current_balance:.6f}"
                 )
 
+            # Advance only once every candidate is confirmed and registered,
+            # so a failed balance read or registry write is retried
+            if newest_block is not None and newest_block > (last_block or -1):
+                self._last_scan_block[chain_id] = newest_block
+
         except Exception as e:
-            print(f"  Etherscan token check error: {e}")
+            print(f"  Whitelist token check error: {e}")
 
         return new_tokens
 
+    def _price_history(self, token_address, chain_id, pool, blocks):
+        """Pool price at each of the last `blocks` blocks, oldest first.
+
+        Every sample is the same slot0 read pinned to a different block, so
+        they all go out in one JSON-RPC batch (falling back to concurrent
+        eth_calls) instead of polling the live price over time. Blocks
+        whose state the node no longer serves are skipped."""
+        if pool is None:
+            pool = self.registry.get_best_pool(token_address.lower(), str(chain_id))
+        src = self._price_source(token_address, chain_id, pool) if pool else None
+        if src is None:
+            return []
+        ctx, target, calldata, token_is_0 = src
+        call = {"to": target, "data": calldata}
+
+        head = ctx.w3.eth.block_number
+        block_ids = list(range(max(head - blocks + 1, 0), head + 1))
+        try:
+            with ctx.w3.batch_requests() as batch:
+                for block in block_ids:
+                    batch.add(ctx.w3.eth.call(call, block))
+                rets = batch.execute()
+        except Exception:
+
+            def at_block(block):
+                try:
+                    return ctx.w3.eth.call(call, block)
+                except Exception:
+                    return None
+
+            with ThreadPoolExecutor(max_workers=min(len(block_ids), 16)) as ex:
+                rets = list(ex.map(at_block, block_ids))
+
+        prices = []
+        for ret in rets:
+            # Batch entries for pruned blocks come back as error objects
+            if not isinstance(ret, (bytes, bytearray)):
+                continue
+            try:
+                # Percent changes don't depend on token decimals
+                price = self._price_from_slot0(bytes(ret), token_is_0, pool, 18)
+            except Exception:
+                continue
+            if price:
+                prices.append(price)
+        return prices
+
     def _calculate_token_volatility(
-        self, token_address, chain_id, pool=None, sample_periods=20
+        self, token_address, chain_id, pool=None, sample_periods=VOL_SAMPLE_BLOCKS
     ):
         """Calculate token price volatility over recent periods.
         Returns volatility as a percentage (standard deviation of price changes)."""
         try:
-            # Get recent price samples
-            prices = []
-            for i in range(sample_periods):
-                price = self.get_token_price(token_address, chain_id, pool)
-                if price is not None:
-                    prices.append(price)
-                    if i < sample_periods - 1:  # Don't sleep after the last sample
-                        time.sleep(0.1)  # Small delay between samples
+            prices = self._price_history(token_address, chain_id, pool, sample_periods)
 
             if len(prices) < 2:
                 return None
 
-            # Calculate percentage changes
-            pct_changes = []
-            for i in range(1, len(prices)):
-                if prices[i - 1] > 0:
-                    pct_change = (prices[i] - prices[i - 1]) / prices[i - 1] * 100
-                    pct_changes.append(pct_change)
+            volatility = _vol_kernel(np.asarray(prices, dtype=np.float64))
+            return None if np.isnan(volatility) else float(volatility)
 
-            if not pct_changes:
-                return None
+        except Exception as e:
+            print(f"  Volatility calculation error: {e}")
+            return None
 
-            # Calculate standard deviation of percentage changes (volatility)
-            import statistics
+    def _enter_tokens_with_strategy(self, token_infos):
+        """Enter new tokens with automatic trading strategy. Every token is
+        priced and gets its volatility first; TP/SL prices for the whole
+        batch are then computed in one vectorized step."""
+        entries = []
+        for token_info in token_infos:
+            entry = self._prepare_strategy_entry(token_info)
+            if entry is not None:
+                entries.append(entry)
+        if not entries:
+            return
 
-            volatility = (
-                statistics.stdev(pct_changes)
-                if len(pct_changes) > 1
-                else abs(pct_changes[0])
-            )
+        # Set TP/SL as multiples of volatility (e.g., 1.5x and 1x volatility)
+        take_profit_multiplier = 1.5  # 1.5x volatility above entry
+        stop_loss_multiplier = 1.0  # 1x volatility below entry
 
-            return volatility
+        entry_prices = np.array([e[1] for e in entries], dtype=np.float64)
+        vols = np.array(
+            [np.nan if e[2] is None else e[2] for e in entries], dtype=np.float64
+        )
+        # Use volatility for dynamic TP/SL, fallback to default fixed ratios
+        with np.errstate(invalid="ignore"):
+            use_vol = vols > 0
+        vol_frac = np.where(use_vol, vols, 0.0) / 100
+        tp = np.where(
+            use_vol,
+            entry_prices * (1 + vol_frac * take_profit_multiplier),
+            entry_prices * self.take_profit,
+        )
+        sl = np.where(
+            use_vol,
+            entry_prices * (1 - vol_frac * stop_loss_multiplier),
+            entry_prices * self.stop_loss,
+        )
 
-        except Exception as e:
-            print(f"  Volatility calculation error: {e}")
-            return None
+        for entry, tp_price, sl_price, vol_based in zip(
+            entries, tp.tolist(), sl.tolist(), use_vol.tolist()
+        ):
+            try:
+                self._open_strategy_position(*entry, tp_price, sl_price, vol_based)
+            except Exception as e:
+                symbol = entry[0].get("symbol", "???")
+                print(f"  Strategy entry error for {symbol}: {e}")
 
-    def _enter_token_with_strategy(self, token_info):
-        """Enter a new token with automatic trading strategy."""
+    def _prepare_strategy_entry(self, token_info):
+        """Pool, activation, entry price and volatility for a new token.
+        Returns (token_info, entry_price, volatility or None), or None if
+        the token can't be entered."""
         try:
             token_address = token_info["address"]
             chain_id = token_info["chain_id"]
             symbol = token_info["symbol"]
             decimals = token_info["decimals"]
-            balance = token_info["balance"]
 
             # Discover pool on-chain via V3 Factory
             pool = self.discover_v3_pool(token_address, chain_id)
@@ -1697,7 +2872,7 @@ class AutonomousTrader:
                 print(
                     f"  [STRATEGY] No pool found for {symbol}, skipping strategy entry"
                 )
-                return
+                return None
 
             # Activate token for trading
             self.activate_token(
@@ -1710,72 +2885,136 @@ class AutonomousTrader:
                 print(
                     f"  [STRATEGY] Cannot get price for {symbol}, skipping strategy entry"
                 )
-                return
-
-            # Calculate volatility-based TP/SL levels
-            volatility = self._calculate_token_volatility(token_address, chain_id, pool)
-
-            # Use volatility for dynamic TP/SL, fallback to defaults
-            if volatility is not None and volatility > 0:
-                # Set TP/SL as multiples of volatility (e.g., 1.5x and 1x volatility)
-                take_profit_multiplier = 1.5  # 1.5x volatility above entry
-                stop_loss_multiplier = 1.0  # 1x volatility below entry
-
-                # Convert volatility percentage to price amounts
-                take_profit_price = entry_price * (
-                    1 + (volatility * take_profit_multiplier / 100)
-                )
-                stop_loss_price = entry_price * (
-                    1 - (volatility * stop_loss_multiplier / 100)
-                )
+                return None
 
-                print(
-                    f"  [VOLATILITY] {symbol}: {volatility:.2f}% → TP: ${take_profit_price:.4f}, SL: ${stop_loss_price:.4f}"
-                )
-            else:
-                # Fallback to default fixed percentages
-                take_profit_price = entry_price * self.take_profit  # Default 2% up
-                stop_loss_price = entry_price * self.stop_loss  # Default 2% down
-                print(
-                    f"  [VOLATILITY] {symbol}: Using defaults → TP: ${take_profit_price:.4f}, SL: ${stop_loss_price:.4f}"
+            # Volatility for the TP/SL levels; the rolling estimate is free,
+            # history sampling costs a batch of RPC reads
+            volatility = self._rolling_volatility(chain_id, token_address)
+            if volatility is None:
+                volatility = self._calculate_token_volatility(
+                    token_address, chain_id, pool
                 )
+            return token_info, entry_price, volatility
 
-            # Use full balance for the position
-            token_amount = balance
-
-            # Store position with TP/SL goals for automatic execution
-            pos_key = f"{chain_id}:{token_address}"
-            if pos_key not in self.positions:
-                self.positions[pos_key] = []
-
-            position = {
-                "amount": token_amount,
-                "amount_raw": int(token_amount * (10**decimals)),
-                "entry_price_usd": entry_price,
-                "take_profit_price": take_profit_price,
-                "stop_loss_price": stop_loss_price,
-                "volatility_percent": volatility,
-                "symbol": symbol,
-                "timestamp": datetime.now().isoformat(),
-                "status": "active",  # Ready for price monitoring
-            }
-
-            self.positions[pos_key].append(position)
+        except Exception as e:
+            print(f"  Strategy entry error for {token_info.get('symbol', '???')}: {e}")
+            return None
 
-            # Pre-approve tokens for trading to avoid delays during execution
-            self.ensure_permit2_approval(token_address, chain_id)
+    def _open_strategy_position(
+        self,
+        token_info,
+        entry_price,
+        volatility,
+        take_profit_price,
+        stop_loss_price,
+        vol_based,
+    ):
+        """Record a strategy position at precomputed TP/SL prices."""
+        token_address = token_info["address"]
+        chain_id = token_info["chain_id"]
+        symbol = token_info["symbol"]
+        decimals = token_info["decimals"]
 
+        if vol_based:
+            print(
+                f"  [VOLATILITY] {symbol}: {volatility:.2f}% → TP: ${take_profit_price:.4f}, SL: ${stop_loss_price:.4f}"
+            )
+        else:
             print(
-                f"  [STRATEGY] Entered {symbol} with volatility-based TP/SL strategy "
-                f"@ ${entry_price:.4f} (TP: ${take_profit_price:.4f}, SL: ${stop_loss_price:.4f}), "
-                f"amount: {token_amount:.6f}"
+                f"  [VOLATILITY] {symbol}: Using defaults → TP: ${take_profit_price:.4f}, SL: ${stop_loss_price:.4f}"
             )
 
-        except Exception as e:
-            print(f"  Strategy entry error for {token_info.get('symbol', '???')}: {e}")
+        # Use full balance for the position
+        token_amount = token_info["balance"]
+
+        # Store position with TP/SL goals for automatic execution
+        pos_key = (chain_id, token_address.lower())
+        if pos_key not in self.positions:
+            self.positions[pos_key] = []
+
+        position = {
+            "amount": token_amount,
+            "amount_raw": int(token_amount * (10**decimals)),
+            "entry_price_usd": entry_price,
+            "take_profit_price": take_profit_price,
+            "stop_loss_price": stop_loss_price,
+            "volatility_percent": volatility,
+            "symbol": symbol,
+            "timestamp": datetime.now().isoformat(),
+            "status": "active",  # Ready for price monitoring
+        }
+
+        self.positions[pos_key].append(position)
+        self._journal("set", pos_key)
+
+        # Pre-approve tokens for trading to avoid delays during execution
+        self.ensure_permit2_approval(token_address, chain_id)
+
+        print(
+            f"  [STRATEGY] Entered {symbol} with volatility-based TP/SL strategy "
+            f"@ ${entry_price:.4f} (TP: ${take_profit_price:.4f}, SL: ${stop_loss_price:.4f}), "
+            f"amount: {token_amount:.6f}"
+        )
 
     # -- Main loop --
 
+    def _log(self, msg):
+        """Queue a trading-loop log line for the writer thread instead of
+        writing stdout inline. Lines are dropped if the queue is full."""
+        try:
+            self._log_q.put_nowait(msg)
+        except queue.Full:
+            pass
+
+    def _log_writer(self):
+        """Daemon loop writing queued log lines to stdout in batches."""
+        while True:
+            batch = [self._log_q.get()]
+            while True:
+                try:
+                    batch.append(self._log_q.get_nowait())
+                except queue.Empty:
+                    break
+            sys.stdout.write("\n".join(batch) + "\n")
+            sys.stdout.flush()
+
+    async def _off_loop(self, fn, *args, **kwargs):
+        """Run a blocking (RPC) call on the rpc pool so the event loop, and
+        the newHeads watchers on it, keep running meanwhile."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._rpc_pool, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def _watch_heads(self, ctx):
+        """Follow a chain's newHeads over its websocket: keep last_blocks
+        current and wake the trading loop on every block. Reconnects with
+        backoff; the loop's 1s timer covers any gap."""
+        delay = 1
+        while True:
+            try:
+                async with AsyncWeb3(WebSocketProvider(ctx.ws_url)) as w3:
+                    await w3.eth.subscribe("newHeads")
+                    delay = 1
+                    async for msg in w3.socket.process_subscriptions():
+                        self.last_blocks[ctx.chain_id] = int(msg["result"]["number"])
+                        self._new_head.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"  [Heads] {ctx.name}: {str(e)[:80]}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+
+    async def _wait_for_head(self, timeout):
+        """Sleep until any watched chain has a new block, at most timeout
+        seconds (a plain sleep when no chain has a websocket)."""
+        try:
+            await asyncio.wait_for(self._new_head.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._new_head.clear()
+
     async def run(self):
         # Initial wallet fetch (saves to WALLET_FILE for dashboard)
         eth_bal, weth_bal, usdc_bal, eth_price = self._save_wallet()
@@ -1808,13 +3047,20 @@ class AutonomousTrader:
         # Scan wallet for existing tokens across all chains
         self._scan_existing_tokens()
 
-        # Per-chain block tracking
-        last_blocks = {}
+        # Per-chain block tracking; fused reads keep it current
         for cid, ctx in self.chain_ctx.items():
             try:
-                last_blocks[cid] = ctx.w3.eth.block_number
+                self.last_blocks[cid] = ctx.w3.eth.block_number
             except Exception:
-                last_blocks[cid] = 0
+                self.last_blocks[cid] = 0
+
+        # Chains with a websocket drive the loop per block
+        self._new_head = asyncio.Event()
+        head_watchers = [
+            asyncio.create_task(self._watch_heads(ctx))
+            for ctx in self.chain_ctx.values()
+            if ctx.ws_url
+        ]
 
         blocks_since_signal = 0
         last_status_time = 0
@@ -1823,29 +3069,40 @@ class AutonomousTrader:
 
         while True:
             try:
+                # One clock read per tick, shared by logs, entries and trades
+                tick_now = time.time()
+                tick_dt = datetime.fromtimestamp(tick_now)
+                tick_iso = tick_dt.isoformat()
+
                 # Emergency stop check
                 if self.check_stop():
                     print("EMERGENCY STOP — flag detected, exiting")
-                    self._save_state()
+                    self._save_state(force=True)
+                    # Queued trade posts still finish; just don't block on them
+                    self._trade_pool.shutdown(wait=False)
+                    if self._signer_pool is not None:
+                        self._signer_pool.shutdown(wait=False)
+                    for task in head_watchers:
+                        task.cancel()
                     break
 
                 # Sell all check
                 if self.check_sell_all():
-                    eth_price = self.get_mainnet_price() or eth_price
-                    self.sell_all_to_usdc(eth_price)
+                    mainnet_price = await self._off_loop(self.get_mainnet_price)
+                    eth_price = mainnet_price or eth_price
+                    await self._off_loop(self.sell_all_to_usdc, eth_price)
 
                 # Status log every 15 seconds
-                now = time.time()
-                if now - last_status_time >= 15:
-                    last_status_time = now
+                if tick_now - last_status_time >= 15:
+                    last_status_time = tick_now
                     pos_count = sum(len(v) for v in self.positions.values())
                     active = len(self._active_tokens)
                     blocks_str = " | ".join(
-                        f"{CHAINS[c]['name'][:3]}:{last_blocks.get(c, 0)}"
+                        f"{CHAINS[c]['name'][:3]}:{self.last_blocks.get(c, 0)}"
                         for c in self.chain_ctx
                     )
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] "
+                    self._log(
+                        f"[{tick_dt.strftime('%H:%M:%S')}] "
                         f"${eth_price:.2f} | "
                         f"Tokens: {active} | "
                         f"Pos: {pos_count} | "
@@ -1854,18 +3111,48 @@ class AutonomousTrader:
                     )
 
                 # -- Check TP/SL exits for all positions --
-                # Token prices come from the pool ONLY, not ETH
+                # Token prices come from the pool ONLY, not ETH.
+                # Every priced position is fetched concurrently up front.
+                priced = {}
+                for pos_key, pos_list in self.positions.items():
+                    config = self._active_tokens.get(pos_key)
+                    if pos_list and config and config["chain_id"] in self.chain_ctx:
+                        priced[pos_key] = config
+                # One Multicall3 round-trip per chain prices every position
+                # and snapshots its wallet balance for the exit path
+                reads = await self._afused_reads(list(priced.items()), True)
+                tick_prices = {k: price for k, (price, _) in reads.items()}
+                tick_balances = {k: bal for k, (_, bal) in reads.items()}
+                # Swap gas estimate per chain, fetched at most once per tick
+                # and shared by the exit and entry gas checks
+                tick_gas = {}
+
+                # TP/SL test for every position at once over the threshold
+                # columns; only positions that hit are visited below
+                keys, row_key, row_pos, tp_col, sl_col = self._threshold_index()
+                key_prices = np.fromiter(
+                    (tick_prices.get(k) or np.nan for k in keys),
+                    dtype=np.float64,
+                    count=len(keys),
+                )
+                cur = key_prices[row_key]
+                with np.errstate(invalid="ignore"):  # NaN rows never hit
+                    hit = (cur >= tp_col) | (cur <= sl_col)
+                hits = {}
+                for r in np.nonzero(hit)[0].tolist():
+                    hits.setdefault(keys[row_key[r]], []).append(row_pos[r])
+
                 closed_tokens = []
                 for pos_key, pos_list in list(self.positions.items()):
                     if not pos_list:
                         closed_tokens.append(pos_key)
                         continue
 
-                    parts = pos_key.split(":", 1)
-                    if len(parts) != 2:
+                    hit_rows = hits.get(pos_key)
+                    if not hit_rows:
                         continue
-                    pos_chain_id = int(parts[0])
-                    token_addr = parts[1]
+
+                    pos_chain_id, token_addr = pos_key
 
                     if pos_chain_id not in self.chain_ctx:
                         continue
@@ -1879,54 +3166,36 @@ class AutonomousTrader:
                     decimals = config["decimals"]
                     fee_tier = pool.get("fee_tier", 3000)
 
-                    # Get CURRENT token price from pool
-                    current_price = self.get_token_price(
-                        token_addr, pos_chain_id, pool, token_decimals=decimals
-                    )
+                    # CURRENT token price from the concurrent fetch above
+                    current_price = tick_prices.get(pos_key)
                     if current_price is None:
                         continue  # Can't price, skip check
 
-                    pos_chain_config = CHAINS[pos_chain_id]
+                    pos_ctx = self.chain_ctx[pos_chain_id]
                     closed_indices = []
 
-                    for i, pos in enumerate(pos_list):
-                        entry_price = pos.get("entry_price_usd", 0)
-                        if entry_price <= 0:
-                            continue
-
-                        # Check price-based TP/SL (new approach)
-                        take_profit_price = pos.get("take_profit_price")
-                        stop_loss_price = pos.get("stop_loss_price")
-
-                        is_tp = is_sl = False
-                        change = current_price / entry_price if entry_price > 0 else 1.0
+                    for i in hit_rows:
+                        pos = pos_list[i]
+                        # A hit that isn't a TP is an SL
+                        is_tp = current_price >= pos["take_profit_price"]
 
-                        if (
-                            take_profit_price is not None
-                            and stop_loss_price is not None
-                        ):
-                            # Use price-based TP/SL
-                            is_tp = current_price >= take_profit_price
-                            is_sl = current_price <= stop_loss_price
-                        else:
-                            # Fallback to ratio-based TP/SL (original approach)
-                            is_tp = change >= self.take_profit
-                            is_sl = change <= self.stop_loss
-
-                        if not (is_tp or is_sl):
-                            continue
+                        entry_price = pos["entry_price_usd"]
 
                         gross_pnl = (current_price - entry_price) * pos["amount"]
 
                         # Gas pre-check (use ETH price for gas
                         # estimation only) — skip on testnets
-                        if pos_chain_id not in TESTNET_CHAINS:
-                            est_exit_usd, est_exit_eth = self.estimate_swap_gas_usd(
-                                pos_chain_id, eth_price or 2000
-                            )
+                        if not pos_ctx.is_testnet:
+                            if pos_chain_id not in tick_gas:
+                                tick_gas[pos_chain_id] = await self._off_loop(
+                                    self.estimate_swap_gas_usd,
+                                    pos_chain_id,
+                                    eth_price or 2000,
+                                )
+                            est_exit_usd, est_exit_eth = tick_gas[pos_chain_id]
                             if is_tp and gross_pnl <= est_exit_usd:
                                 symbol = pos.get("symbol", token_addr[:8])
-                                print(
+                                self._log(
                                     f"  SKIP TP {symbol}: "
                                     f"gross ${gross_pnl:.4f} "
                                     f"<= gas ${est_exit_usd:.4f}"
@@ -1936,10 +3205,16 @@ class AutonomousTrader:
                         # SL always executes to limit loss
                         tag = "TP" if is_tp else "SL"
 
-                        # Execute sell: token → quote token
-                        human_bal, raw_bal, _ = self.get_balance(
-                            token_addr, pos_chain_id
-                        )
+                        # Execute sell: token → quote token. The tick snapshot
+                        # is good for the token's first exit only; later
+                        # exits of the same token re-read after that sell
+                        snap = tick_balances.pop(pos_key, None)
+                        if snap is not None:
+                            human_bal, raw_bal, _ = snap
+                        else:
+                            human_bal, raw_bal, _ = await self._off_loop(
+                                self.get_balance, token_addr, pos_chain_id
+                            )
                         tx, gas_eth = None, 0
 
                         if raw_bal > 0:
@@ -1950,8 +3225,9 @@ class AutonomousTrader:
                             # Sell to USDC (direct or via WETH)
                             quote_type = (pool.get("quote_token") or "").upper()
                             if quote_type == "WETH":
-                                weth = pos_chain_config["weth"]
-                                tx, gas_eth = self._execute_swap(
+                                weth = pos_ctx.weth_cs
+                                tx, gas_eth = await self._off_loop(
+                                    self._execute_swap,
                                     token_addr,
                                     weth,
                                     sell_amount,
@@ -1960,11 +3236,14 @@ class AutonomousTrader:
                                     pos_chain_id,
                                 )
                                 if tx:
-                                    wb, wr, _ = self.get_balance(weth, pos_chain_id)
+                                    wb, wr, _ = await self._off_loop(
+                                        self.get_balance, weth, pos_chain_id
+                                    )
                                     if wr > 0:
-                                        _, g2 = self._execute_swap(
+                                        _, g2 = await self._off_loop(
+                                            self._execute_swap,
                                             weth,
-                                            pos_chain_config["usdc"],
+                                            pos_ctx.usdc_cs,
                                             wr,
                                             500,
                                             "WETH→USDC",
@@ -1972,23 +3251,31 @@ class AutonomousTrader:
                                         )
                                         gas_eth += g2
                             else:
-                                usdc = pos_chain_config["usdc"]
-                                tx, gas_eth = self._execute_swap(
+                                # Nothing follows this swap, so don't block
+                                # the loop on its receipt; its gas is taken
+                                # off total_pnl once it is mined
+                                usdc = pos_ctx.usdc_cs
+                                tx, gas_eth = await self._off_loop(
+                                    self._execute_swap,
                                     token_addr,
                                     usdc,
                                     sell_amount,
                                     fee_tier,
                                     f"{tag} {pos.get('symbol', '?')}→USDC",
                                     pos_chain_id,
+                                    wait=False,
+                                    on_receipt=lambda gas, ok: (
+                                        self._gas_adjustments.put(gas)
+                                    ),
                                 )
 
                         gas_usd = self.gas_cost_usd(gas_eth, eth_price or 2000)
                         net_pnl = gross_pnl - gas_usd
 
                         symbol = pos.get("symbol", token_addr[:8])
-                        chain_name = pos_chain_config["name"]
-                        pct = (change - 1) * 100
-                        print(
+                        chain_name = pos_ctx.name
+                        pct = (current_price / entry_price - 1) * 100
+                        self._log(
                             f"  {tag} {symbol} [{chain_name}] "
                             f"${current_price:.6f} "
                             f"(entry ${entry_price:.6f}, "
@@ -2015,11 +3302,14 @@ class AutonomousTrader:
 
                     for i in reversed(closed_indices):
                         pos_list.pop(i)
+                    if closed_indices:
+                        self._journal("set", pos_key)
 
                 # Clean empty position lists
                 for t in closed_tokens:
                     if not self.positions.get(t):
                         self.positions.pop(t, None)
+                        self._journal("set", t)
 
                 # -- Check entries for active tokens --
                 # Entry = HOLD the token, record position with
@@ -2027,45 +3317,49 @@ class AutonomousTrader:
                 blocks_since_signal += 1
                 if blocks_since_signal >= DEFAULT_SIGNAL_INTERVAL:
                     blocks_since_signal = 0
-                    for pos_key, config in self._active_tokens.items():
+                    # Tokens without an open position
+                    open_keys = self._open_position_keys()
+                    candidates = [
+                        (pos_key, config)
+                        for pos_key, config in self._active_tokens.items()
+                        if pos_key not in open_keys
+                        and config.get("chain_id") in self.chain_ctx
+                    ]
+                    # Balance + price for every candidate, fused into one
+                    # Multicall3 round-trip per chain
+                    reads = await self._afused_reads(candidates, True)
+                    for pos_key, config in candidates:
+                        token_price, (human_bal, raw_bal, _) = reads[pos_key]
                         pool = config["pool"]
                         symbol = config["symbol"]
                         decimals = config["decimals"]
-                        entry_chain_id = config.get("chain_id")
-
-                        if not entry_chain_id or entry_chain_id not in self.chain_ctx:
-                            continue
-
-                        # pos_key is "chain_id:token_addr"
-                        token_addr = pos_key.split(":", 1)[1]
+                        entry_chain_id = config["chain_id"]
+                        token_addr = config["token"]
 
-                        human_bal, raw_bal, _ = self.get_balance(
-                            token_addr, entry_chain_id
-                        )
                         if human_bal <= 0:
                             continue
-                        if self.positions.get(pos_key, []):
-                            continue
 
-                        # Get token price from pool
-                        token_price = self.get_token_price(
-                            token_addr, entry_chain_id, pool, token_decimals=decimals
-                        )
                         if token_price is None or token_price <= 0:
-                            print(f"  Cannot price {symbol} from pool, skipping entry")
+                            self._log(
+                                f"  Cannot price {symbol} from pool, skipping entry"
+                            )
                             continue
 
                         # Gas profitability pre-check
                         # (exit gas must be < TP profit)
                         # Skip check on testnets — no real value
                         pos_value = human_bal * token_price
-                        if entry_chain_id not in TESTNET_CHAINS:
-                            est_gas_usd, _ = self.estimate_swap_gas_usd(
-                                entry_chain_id, eth_price or 2000
-                            )
+                        if not self.chain_ctx[entry_chain_id].is_testnet:
+                            if entry_chain_id not in tick_gas:
+                                tick_gas[entry_chain_id] = await self._off_loop(
+                                    self.estimate_swap_gas_usd,
+                                    entry_chain_id,
+                                    eth_price or 2000,
+                                )
+                            est_gas_usd, _ = tick_gas[entry_chain_id]
                             expected_tp = pos_value * (self.take_profit - 1)
                             if est_gas_usd >= expected_tp:
-                                print(
+                                self._log(
                                     f"  SKIP ENTRY {symbol}: "
                                     f"exit gas ${est_gas_usd:.4f} "
                                     f">= TP profit "
@@ -2083,14 +3377,16 @@ class AutonomousTrader:
                             "token": token_addr,
                             "chain_id": entry_chain_id,
                             "fee_tier": pool.get("fee_tier", 3000),
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": tick_iso,
                         }
+                        self._fill_thresholds(pos)
 
                         self.positions.setdefault(pos_key, []).append(pos)
                         self.trade_count += 1
+                        self._journal("set", pos_key)
 
-                        chain_name = CHAINS[entry_chain_id]["name"]
-                        print(
+                        chain_name = self.chain_ctx[entry_chain_id].name
+                        self._log(
                             f"  HOLD {symbol} [{chain_name}]: "
                             f"{human_bal:.6f} @ "
                             f"${token_price:.6f}/unit "
@@ -2106,16 +3402,25 @@ class AutonomousTrader:
                             None,
                             symbol=symbol,
                             chain_id=entry_chain_id,
+                            timestamp=tick_iso,
                         )
 
-                # Save state periodically
+                # Gas of exits whose receipts arrived since the last tick
+                late_gas = 0
+                while not self._gas_adjustments.empty():
+                    late_gas += self._gas_adjustments.get_nowait()
+                if late_gas:
+                    self.total_pnl -= self.gas_cost_usd(late_gas, eth_price or 2000)
+                    self._journal("totals")
+
+                # Snapshot state once the journal is due
                 self._save_state()
 
-                await asyncio.sleep(1)
+                await self._wait_for_head(1)
 
             except KeyboardInterrupt:
                 print("\nKeyboard interrupt received")
-                self._save_state()
+                self._save_state(force=True)
                 pass
 
 
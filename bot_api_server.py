@@ -4,17 +4,30 @@ BOT API SERVER — Multi-token dashboard + emergency controls.
 Serves real bot data to the dashboard, supports STOP and SELL ALL commands.
 """
 
-import json
+import functools
+import hashlib
 import os
+import threading
+import time
+from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
 
+import ujson
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, request
 from flask_cors import CORS
 
-from config.trading_config import CHAINS, SELL_ALL_FLAG, STATE_FILE, STOP_FLAG, TRADES_FILE, WALLET_FILE
+from config.trading_config import (
+    CHAINS,
+    SELL_ALL_FLAG,
+    STATE_FILE,
+    STOP_FLAG,
+    TRADES_FILE,
+    WALLET_FILE,
+)
 from token_registry import TokenRegistry
+from trades_log import migrate_legacy_trades
 from whitelist import WhitelistManager
 
 load_dotenv(Path("/home/sauly/hummingbot/.env.local"))
@@ -25,29 +38,225 @@ CORS(app)
 registry = TokenRegistry()
 whitelist = WhitelistManager()
 
-# Initialize data files
-for fpath, default in [
-    (TRADES_FILE, []),
-    (WALLET_FILE, {
-        "eth": 0, "usdc": 0, "weth": 0,
-        "wallet": os.getenv("ETHEREUM_WALLET_ADDRESS"),
-        "execution_network": "Multichain",
-        "pricing_source": "Pool",
-        "chains": {},
-    }),
-]:
-    p = Path(fpath)
-    if not p.exists():
-        with open(p, "w") as f:
-            json.dump(default, f)
+_CHAIN_NAMES = {cid: c['name'] for cid, c in CHAINS.items()}
+
+
+def _ensure_state_files():
+    """Create empty data files on server start. Not run at import, so
+    helpers importing this module don't write to /tmp; the readers treat a
+    missing file as empty."""
+    migrate_legacy_trades()
+    Path(TRADES_FILE).touch(exist_ok=True)
+    for fpath, default in [
+        (WALLET_FILE, {
+            "eth": 0, "usdc": 0, "weth": 0,
+            "wallet": os.getenv("ETHEREUM_WALLET_ADDRESS"),
+            "execution_network": "Multichain",
+            "pricing_source": "Pool",
+            "chains": {},
+        }),
+    ]:
+        p = Path(fpath)
+        if not p.exists():
+            with open(p, "w") as f:
+                f.write(ujson.dumps(default))
+
+
+def _jsonify(obj, etag=None):
+    """flask.jsonify, encoded with ujson instead of the stdlib encoder."""
+    resp = app.response_class(
+        ujson.dumps(obj, escape_forward_slashes=False),
+        mimetype="application/json")
+    if etag is not None:
+        resp.set_etag(etag)
+    return resp
+
+
+def _etag(*versions):
+    """ETag for a response built only from inputs at these versions."""
+    return hashlib.blake2b(repr(versions).encode(), digest_size=8).hexdigest()
+
+
+def _not_modified(etag):
+    """Bodyless 304 if the client already holds etag, else None. Lets an
+    idle dashboard poll skip building and encoding the payload."""
+    if not request.if_none_match.contains(etag):
+        return None
+    resp = app.response_class(status=304)
+    resp.set_etag(etag)
+    return resp
+
+
+# Parsed JSON files: {path: ((mtime_ns, size), obj)}. Dashboard polls re-read
+# the same files; an unchanged file costs one stat() instead of a full parse.
+# Cached objects are shared between requests, so callers must not mutate them.
+_JSON_CACHE = {}
+# The stat() itself is skipped for FILE_CHECK_TTL seconds after the last one,
+# so back-to-back polls of an unchanged dashboard make no syscalls at all
+FILE_CHECK_TTL = 1.0
+_file_checked = {}  # {path: time.monotonic() of last stat}
+
+# Serializes reads of new TRADES_FILE lines into trades_state
+_TRADES_LOCK = threading.Lock()
+
+
+def _read_cached(path, parse, default):
+    """(version, obj) for path; version is None when the file is missing or
+    unparseable and obj is the default."""
+    key = str(path)
+    now = time.monotonic()
+    cached = _JSON_CACHE.get(key)
+    if cached is not None and now - _file_checked.get(key, 0) < FILE_CHECK_TTL:
+        return cached
+    try:
+        st = os.stat(key)
+        version = (st.st_mtime_ns, st.st_size)
+        _file_checked[key] = now
+        if cached is not None and cached[0] == version:
+            return cached
+        with open(key, "rb") as f:
+            obj = parse(f)
+        _JSON_CACHE[key] = (version, obj)
+        return version, obj
+    except (FileNotFoundError, ValueError):
+        return None, default
+
+
+def _json_entry(path):
+    """(version, parsed JSON) for path, see _read_cached."""
+    return _read_cached(path, lambda f: ujson.loads(f.read()), {})
 
 
 def _read_json(path):
-    try:
-        with open(path) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return [] if "trades" in str(path) else {}
+    return _json_entry(path)[1]
+
+
+class TradesState:
+    """Running dashboard aggregates over executed trades.
+
+    Advanced by _sync_trades() as lines are appended to TRADES_FILE, so the
+    dashboard endpoints read a snapshot instead of re-folding every trade.
+    """
+
+    def __init__(self, trades=()):
+        self._lock = threading.Lock()
+        self.total_profit = 0
+        self.win_count = 0
+        self.total_trades = 0
+        self.buys_count = 0
+        self.sells_count = 0
+        self.pnl_by_token = defaultdict(float)
+        self.recent = deque(maxlen=50)
+        self.completed = deque(maxlen=30)
+        for t in trades:
+            self.add(t)
+
+    def add(self, t):
+        if t.get('status') != 'EXECUTED':
+            return
+        profit = t.get('profit', 0)
+        tok = t.get("token") or t.get("symbol", "unknown")
+        with self._lock:
+            self.total_trades += 1
+            self.total_profit += profit
+            if profit > 0:
+                self.win_count += 1
+            self.pnl_by_token[tok] += profit
+            self.recent.append(t)
+            if t.get('type') == 'BUY':
+                self.buys_count += 1
+            elif t.get('type') == 'SELL':
+                self.sells_count += 1
+                # Completed round-trips (SELL trades with realized PnL)
+                self.completed.append(t)
+
+    def snapshot(self):
+        with self._lock:
+            total = self.total_trades
+            return {
+                # Every recorded trade changes the snapshot
+                "version": total,
+                "total_trades": total,
+                "win_rate": (self.win_count / total * 100) if total > 0 else 0,
+                "total_pnl": self.total_profit,
+                "buys": self.buys_count,
+                "sells": self.sells_count,
+                "pnl_by_token": dict(self.pnl_by_token),
+                "trades": list(self.recent),
+                "completed_trades": list(self.completed),
+            }
+
+
+# Seeded in __main__, after any legacy trades file has been converted
+trades_state = TradesState()
+_trades_offset = 0  # bytes of TRADES_FILE folded into trades_state
+
+
+def _sync_trades(force=False):
+    """Fold trades appended to TRADES_FILE since the last call into
+    trades_state, whoever wrote them (record_trade, run_bot_overnight.py).
+    Only complete lines are folded; a line still being written is picked up
+    next time. The stat() is reused for FILE_CHECK_TTL unless forced."""
+    global trades_state, _trades_offset
+    key = str(TRADES_FILE)
+    now = time.monotonic()
+    if not force and now - _file_checked.get(key, 0) < FILE_CHECK_TTL:
+        return
+    with _TRADES_LOCK:
+        _file_checked[key] = now
+        try:
+            size = os.stat(key).st_size
+        except FileNotFoundError:
+            return
+        if size < _trades_offset:
+            # Truncated or replaced: start over from the top
+            trades_state = TradesState()
+            _trades_offset = 0
+        if size == _trades_offset:
+            return
+        with open(key, "rb") as f:
+            f.seek(_trades_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                _trades_offset += len(line)
+                try:
+                    trades_state.add(ujson.loads(line))
+                except ValueError:
+                    continue  # blank or torn line
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(sec):
+    return datetime.fromtimestamp(sec).isoformat()
+
+
+def _now_iso():
+    """datetime.now().isoformat() (always with microseconds); the
+    date/time part is formatted once per second."""
+    sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+    return f"{_iso_second(sec)}.{us:06d}"
+
+
+# Flag files flip a few times per session at most; polls reuse the answer
+FLAG_CHECK_TTL = 1.0
+_flag_cache = {}
+
+
+def _flag_set(path):
+    """os.path.exists(path), reused for FLAG_CHECK_TTL seconds."""
+    now = time.monotonic()
+    cached = _flag_cache.get(path)
+    if cached is not None and now - cached[1] < FLAG_CHECK_TTL:
+        return cached[0]
+    exists = os.path.exists(path)
+    _flag_cache[path] = (exists, now)
+    return exists
+
+
+def _mark_flag(path, exists):
+    """Record a flag change made by this server so polls see it at once."""
+    _flag_cache[path] = (exists, time.monotonic())
 
 
 # -- Existing endpoints (kept for backward compat) --
@@ -55,50 +264,65 @@ def _read_json(path):
 @app.route('/api/trades', methods=['GET'])
 def get_trades():
     """Get all executed trades."""
-    return jsonify({"trades": _read_json(TRADES_FILE)})
+
+    # Streamed straight from the JSON-lines file, so memory stays flat
+    # however long the trade history gets
+    def chunks():
+        yield b'{"trades":['
+        sep = b""
+        try:
+            with open(TRADES_FILE, "rb") as f:
+                for line in f:
+                    # Blank, or a trailing line still being appended
+                    if not line.endswith(b"\n") or not line.strip():
+                        continue
+                    yield sep + line.rstrip()
+                    sep = b","
+        except FileNotFoundError:
+            pass
+        yield b"]}"
+
+    return app.response_class(chunks(), mimetype="application/json")
 
 
 @app.route('/api/wallet', methods=['GET'])
 def get_wallet():
     """Get wallet balance info."""
-    return jsonify(_read_json(WALLET_FILE))
+    version, wallet = _json_entry(WALLET_FILE)
+    etag = _etag("wallet", version)
+    return _not_modified(etag) or _jsonify(wallet, etag)
 
 
 @app.route('/api/dashboard', methods=['GET'])
 def get_dashboard():
     """Single-token dashboard data (legacy compat)."""
-    trades = _read_json(TRADES_FILE)
-    wallet = _read_json(WALLET_FILE)
-
-    executed = [t for t in trades if t.get('status') == 'EXECUTED']
-    buys = [t for t in executed if t['type'] == 'BUY']
-    sells = [t for t in executed if t['type'] == 'SELL']
-
-    total_profit = sum(t.get('profit', 0) for t in executed)
-    win_count = len([t for t in executed if t.get('profit', 0) > 0])
-    total_trades = len(executed)
-    win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
-
-    return jsonify({
+    _sync_trades()
+    agg = trades_state.snapshot()
+    wallet_version, wallet = _json_entry(WALLET_FILE)
+    etag = _etag("dashboard", agg["version"], wallet_version)
+    cached = _not_modified(etag)
+    if cached is not None:
+        return cached
+
+    return _jsonify({
         "summary": {
-            "total_trades": total_trades,
-            "win_rate": win_rate,
-            "total_pnl": total_profit,
-            "active_positions": len(buys) - len(sells),
+            "total_trades": agg["total_trades"],
+            "win_rate": agg["win_rate"],
+            "total_pnl": agg["total_pnl"],
+            "active_positions": agg["buys"] - agg["sells"],
         },
         "wallet": wallet,
-        "trades": executed[:50],
-    })
+        "trades": agg["trades"],
+    }, etag)
 
 
 @app.route('/api/trade', methods=['POST'])
 def record_trade():
     """Record a new trade (called by trader)."""
     data = request.json
-    trades = _read_json(TRADES_FILE)
 
     trade = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "type": data.get("type"),
         "token": data.get("token"),
         "symbol": data.get("symbol"),
@@ -115,11 +339,17 @@ def record_trade():
     if data.get("usdc_received") is not None:
         trade["usdc_received"] = data["usdc_received"]
 
-    trades.append(trade)
-    with open(TRADES_FILE, "w") as f:
-        json.dump(trades, f, indent=2)
+    # One O_APPEND write per trade (atomic for a line this size); the
+    # running aggregates then fold in just the new line(s).
+    line = ujson.dumps(trade, escape_forward_slashes=False).encode() + b"\n"
+    fd = os.open(TRADES_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    _sync_trades(force=True)
 
-    return jsonify({"success": True, "trade": trade})
+    return _jsonify({"success": True, "trade": trade})
 
 
 # -- New multi-token endpoints --
@@ -129,15 +359,20 @@ def get_tokens():
     """Get all discovered tokens with pool info."""
     chain = request.args.get('chain')
     tokens = registry.get_tokens_with_pools(chain=chain)
-    return jsonify({"tokens": tokens})
+    return _jsonify({"tokens": tokens})
 
 
 @app.route('/api/positions', methods=['GET'])
 def get_positions():
     """Get all open positions across all tokens."""
     # If state file has the full position objects
+    version, raw_positions = _json_entry(STATE_FILE)
+    etag = _etag("positions", version)
+    cached = _not_modified(etag)
+    if cached is not None:
+        return cached
+
     result = []
-    raw_positions = _read_json(STATE_FILE)
     pos_data = raw_positions.get("positions", {})
 
     for token_addr, pos_list in pos_data.items():
@@ -145,9 +380,8 @@ def get_positions():
             for pos in pos_list:
                 chain_id = pos.get('chain_id')
                 if not chain_id and ':' in token_addr:
-                    chain_id = int(token_addr.split(':')[0])
-                chain_name = CHAINS.get(chain_id, {}).get(
-                    'name', '') if chain_id else ''
+                    chain_id = int(token_addr.partition(':')[0])
+                chain_name = _CHAIN_NAMES.get(chain_id, '')
                 result.append({
                     "token": token_addr,
                     "symbol": pos.get("symbol", token_addr[:8]),
@@ -162,22 +396,17 @@ def get_positions():
                     "timestamp": pos.get("timestamp"),
                 })
 
-    return jsonify({"positions": result, "count": len(result)})
+    return _jsonify({"positions": result, "count": len(result)}, etag)
 
 
 @app.route('/api/dashboard-multi', methods=['GET'])
 def get_dashboard_multi():
     """Aggregated multi-token dashboard data."""
-    trades = _read_json(TRADES_FILE)
+    _sync_trades()
+    agg = trades_state.snapshot()
     wallet = _read_json(WALLET_FILE)
     state = _read_json(STATE_FILE)
 
-    executed = [t for t in trades if t.get('status') == 'EXECUTED']
-    total_profit = sum(t.get('profit', 0) for t in executed)
-    win_count = len([t for t in executed if t.get('profit', 0) > 0])
-    total_trades = len(executed)
-    win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
-
     # Positions from state file
     pos_data = state.get("positions", {})
     total_positions = 0
@@ -192,25 +421,17 @@ def get_dashboard_multi():
     # Discovered tokens from registry
     tokens = registry.get_tokens_with_pools()
 
-    # Group trades by token for per-token PnL
-    pnl_by_token = {}
-    for t in executed:
-        tok = t.get("token") or t.get("symbol", "unknown")
-        pnl_by_token.setdefault(tok, 0)
-        pnl_by_token[tok] += t.get("profit", 0)
-
-    # Recent completed round-trips (SELL trades with realized PnL)
-    completed = [t for t in executed if t['type'] == 'SELL']
-
     # Emergency status
-    stop_active = os.path.exists(STOP_FLAG)
-    sell_all_active = os.path.exists(SELL_ALL_FLAG)
+    stop_active = _flag_set(STOP_FLAG)
+    sell_all_active = _flag_set(SELL_ALL_FLAG)
 
-    return jsonify({
+    # Registry tokens have no cheap version to key on, so this ETag hashes
+    # the encoded body: unchanged polls still save the transfer
+    resp = _jsonify({
         "summary": {
-            "total_trades": total_trades,
-            "win_rate": win_rate,
-            "total_pnl": total_profit,
+            "total_trades": agg["total_trades"],
+            "win_rate": agg["win_rate"],
+            "total_pnl": agg["total_pnl"],
             "active_positions": total_positions,
             "active_tokens": len([t for t in tokens if t.get("pool_address")]),
             "discovered_tokens": len(tokens),
@@ -218,14 +439,16 @@ def get_dashboard_multi():
         "wallet": wallet,
         "tokens": tokens,
         "positions": positions_by_token,
-        "pnl_by_token": pnl_by_token,
-        "trades": executed[:50],
-        "completed_trades": completed[:30],
+        "pnl_by_token": agg["pnl_by_token"],
+        "trades": agg["trades"],
+        "completed_trades": agg["completed_trades"],
         "emergency": {
             "stop_active": stop_active,
             "sell_all_active": sell_all_active,
         },
     })
+    resp.add_etag()
+    return resp.make_conditional(request)
 
 
 # -- Emergency controls --
@@ -234,7 +457,8 @@ def get_dashboard_multi():
 def emergency_stop():
     """Write stop flag — trader exits loop on next iteration."""
     Path(STOP_FLAG).touch()
-    return jsonify({
+    _mark_flag(STOP_FLAG, True)
+    return _jsonify({
         "success": True,
         "message": "STOP flag set. Trader will halt on next loop iteration.",
     })
@@ -244,7 +468,8 @@ def emergency_stop():
 def sell_all():
     """Write sell-all flag — trader liquidates all positions to USDC."""
     Path(SELL_ALL_FLAG).touch()
-    return jsonify({
+    _mark_flag(SELL_ALL_FLAG, True)
+    return _jsonify({
         "success": True,
         "message": "SELL ALL flag set. Trader will liquidate all positions.",
     })
@@ -257,17 +482,18 @@ def clear_stop():
         os.remove(STOP_FLAG)
     except FileNotFoundError:
         pass
-    return jsonify({"success": True, "message": "STOP flag cleared."})
+    _mark_flag(STOP_FLAG, False)
+    return _jsonify({"success": True, "message": "STOP flag cleared."})
 
 
 @app.route('/health', methods=['GET'])
 def health():
     """Health check."""
-    return jsonify({
+    return _jsonify({
         "status": "ok",
         "server": "bot-api-multi",
-        "stop_flag": os.path.exists(STOP_FLAG),
-        "sell_all_flag": os.path.exists(SELL_ALL_FLAG),
+        "stop_flag": _flag_set(STOP_FLAG),
+        "sell_all_flag": _flag_set(SELL_ALL_FLAG),
     })
 
 
@@ -277,7 +503,7 @@ def health():
 def get_whitelist_senders():
     """Get all whitelisted sender addresses."""
     senders = whitelist.get_all_senders()
-    return jsonify({"senders": senders})
+    return _jsonify({"senders": senders})
 
 
 @app.route('/api/whitelist/senders', methods=['POST'])
@@ -287,9 +513,9 @@ def add_whitelist_sender():
     addr = data.get('address', '').strip()
     label = data.get('label', '')
     if not addr:
-        return jsonify({"error": "address required"}), 400
+        return _jsonify({"error": "address required"}), 400
     whitelist.add_sender(addr, label=label)
-    return jsonify({"success": True, "address": addr, "label": label})
+    return _jsonify({"success": True, "address": addr, "label": label})
 
 
 @app.route('/api/whitelist/tokens', methods=['GET'])
@@ -302,10 +528,12 @@ def get_whitelist_tokens():
         tokens = whitelist.get_active_tokens()
     else:
         tokens = whitelist.get_all_tokens()
-    return jsonify({"tokens": tokens})
+    return _jsonify({"tokens": tokens})
 
 
 if __name__ == '__main__':
+    _ensure_state_files()
+    _sync_trades(force=True)
     print("""
 ╔════════════════════════════════════════════════════════════╗
 ║      MULTI-TOKEN BOT API SERVER — LOCALHOST:4000          ║
@@ -327,4 +555,12 @@ if __name__ == '__main__':
   Dashboard: http://localhost:4000/api/dashboard-multi
     """)
 
-    app.run(host='0.0.0.0', port=4000, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Werkzeug dev server: no keep-alive, fine for local debugging
+        app.run(host='0.0.0.0', port=4000, debug=False, threaded=True)
+    else:
+        # Handlers mostly wait on file reads, so threads overlap well
+        serve(app, host='0.0.0.0', port=4000, threads=8,
+              connection_limit=200)
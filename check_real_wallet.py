@@ -4,6 +4,7 @@ Check REAL wallet data on Ethereum Sepolia
 Actual blockchain queries, not simulation
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -19,12 +20,39 @@ private_key = os.getenv("ETHEREUM_PRIVATE_KEY")
 print("🔍 Checking REAL Wallet on Ethereum Sepolia...\n")
 
 try:
-    from web3 import Web3
+    from web3 import AsyncHTTPProvider, AsyncWeb3
 
-    # Connect to real RPC
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    UNISWAP_V3_ROUTER = "0xE592427A0AEce92De3Edee1F18E0157C05861564"
 
-    if not w3.is_connected():
+    async def fetch_wallet_data(w3):
+        """(chain_id, latest block, balance, nonce, router code), or None if
+        the RPC is unreachable. The chain_id read doubles as the connection
+        check; everything else goes out as one JSON-RPC batch. The
+        provider's aiohttp session is closed before returning."""
+        try:
+            try:
+                chain_id = await w3.eth.chain_id
+            except Exception:
+                return None
+            # The batch flag lives on the provider, so nothing else may be in
+            # flight on w3 while it is open
+            async with w3.batch_requests() as batch:
+                batch.add(w3.eth.get_block("latest"))
+                batch.add(w3.eth.get_balance(wallet_address))
+                batch.add(w3.eth.get_transaction_count(wallet_address))
+                batch.add(w3.eth.get_code(UNISWAP_V3_ROUTER))
+                rest = await batch.async_execute()
+            return (chain_id, *rest)
+        finally:
+            await w3.provider.disconnect()
+
+    # Connect to real RPC. The provider's aiohttp session pools the
+    # keep-alive connection and already sends Accept-Encoding: gzip,
+    # deflate (and decompresses), so no custom session is needed.
+    w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
+    data = asyncio.run(fetch_wallet_data(w3))
+
+    if data is None:
         print("❌ Cannot connect to RPC")
         sys.exit(1)
 
@@ -32,9 +60,8 @@ try:
     print(f"   RPC: {rpc_url.split('/')[-1]}...")
     print()
 
-    # Get real network info
-    latest_block = w3.eth.block_number
-    chain_id = w3.eth.chain_id
+    chain_id, latest_block_data, balance_wei, tx_count, router_code = data
+    latest_block = latest_block_data['number']
 
     print(f"📊 Network Status:")
     print(f"   Latest Block: {latest_block}")
@@ -42,8 +69,7 @@ try:
     print()
 
     # Get REAL wallet balance
-    balance_wei = w3.eth.get_balance(wallet_address)
-    balance_eth = w3.from_wei(balance_wei, 'ether')
+    balance_eth = AsyncWeb3.from_wei(balance_wei, 'ether')
 
     print(f"👛 Your Wallet: {wallet_address}")
     print(f"   ETH Balance: {balance_eth:.6f} ETH")
@@ -57,13 +83,11 @@ try:
         print(f"✅ Wallet funded: {balance_eth:.6f} ETH")
 
     # Check transaction count (proxy for account activity)
-    tx_count = w3.eth.get_transaction_count(wallet_address)
     print(f"   Transactions: {tx_count}")
     print()
 
     # Try to get recent block data
     print(f"📈 Latest Block Data:")
-    latest_block_data = w3.eth.get_block(latest_block)
     print(f"   Block Hash: {latest_block_data['hash'].hex()}")
     print(f"   Timestamp: {latest_block_data['timestamp']}")
     print(f"   Transactions: {len(latest_block_data['transactions'])}")
@@ -71,12 +95,9 @@ try:
     print()
 
     # Check if we can connect to Uniswap contract
-    UNISWAP_V3_ROUTER = "0xE592427A0AEce92De3Edee1F18E0157C05861564"
-
     print(f"🦄 Uniswap V3 Router Check:")
     print(f"   Address: {UNISWAP_V3_ROUTER}")
 
-    router_code = w3.eth.get_code(UNISWAP_V3_ROUTER)
     if router_code and router_code != b'':
         print(f"   Status: ✅ Contract exists on Sepolia")
         print(f"   Code size: {len(router_code)} bytes")
@@ -4,8 +4,11 @@
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from eth_abi import decode, encode
 from web3 import Web3
 
+from config.trading_config import MULTICALL3
+
 load_dotenv(Path("/home/sauly/hummingbot/.env.local"))
 
 rpc_url = os.getenv("ALCHEMY_RPC_URL")
@@ -17,31 +20,70 @@ w3 = Web3(Web3.HTTPProvider(rpc_url))
 USDC_SEPOLIA = "0x1c7D4B196Cb0C7B01d743Fbc6116a902379C7238"
 WETH_SEPOLIA = "0x7b79995e5f793A07Bc00c21412e50Ecae098E7f9"
 
-# Standard ERC20 ABI for balanceOf
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function"
-    },
+# ERC20 balanceOf(owner) -> uint256, decimals() -> uint8
+BALANCE_OF_SELECTOR = bytes(Web3.keccak(text="balanceOf(address)")[:4])
+DECIMALS_SELECTOR = bytes(Web3.keccak(text="decimals()")[:4])
+
+# Multicall3.aggregate3 — all token reads go out in a single eth_call
+MULTICALL3_ABI = [
     {
-        "constant": True,
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"name": "", "type": "uint8"}],
-        "type": "function"
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
     }
 ]
 
 print("💰 Checking Real Token Balances on Sepolia...\n")
 
-def check_token(address, name, symbol):
+
+def fetch_balances(addresses):
+    """{address: (balance_raw, decimals)} for each token, read with one
+    Multicall3 call. A token whose reads fail maps to None."""
+    multicall = w3.eth.contract(address=MULTICALL3, abi=MULTICALL3_ABI)
+    owner = encode(["address"], [Web3.to_checksum_address(wallet)])
+    calls = []
+    for address in addresses:
+        calls.append((address, True, BALANCE_OF_SELECTOR + owner))
+        calls.append((address, True, DECIMALS_SELECTOR))
+    rets = multicall.functions.aggregate3(calls).call()
+
+    out = {}
+    for i, address in enumerate(addresses):
+        (ok_bal, bal_data), (ok_dec, dec_data) = rets[2 * i], rets[2 * i + 1]
+        if ok_bal and ok_dec and len(bal_data) >= 32 and len(dec_data) >= 32:
+            out[address] = (decode(["uint256"], bal_data)[0],
+                            decode(["uint8"], dec_data)[0])
+        else:
+            out[address] = None
+    return out
+
+
+def check_token(address, name, symbol, reads):
     try:
-        contract = w3.eth.contract(address=address, abi=ERC20_ABI)
-        balance_raw = contract.functions.balanceOf(wallet).call()
-        decimals = contract.functions.decimals().call()
+        if reads is None:
+            raise RuntimeError("balanceOf/decimals call failed")
+        balance_raw, decimals = reads
         balance = balance_raw / (10 ** decimals)
 
         print(f"{name} ({symbol})")
@@ -58,8 +100,15 @@ def check_token(address, name, symbol):
 
 print(f"Wallet: {wallet}\n")
 
-usdc = check_token(USDC_SEPOLIA, "USD Coin", "USDC")
-weth = check_token(WETH_SEPOLIA, "Wrapped Ether", "WETH")
+try:
+    reads = fetch_balances([USDC_SEPOLIA, WETH_SEPOLIA])
+except Exception as e:
+    print(f"Multicall: Error - {e}\n")
+    reads = {}
+
+usdc = check_token(USDC_SEPOLIA, "USD Coin", "USDC", reads.get(USDC_SEPOLIA))
+weth = check_token(WETH_SEPOLIA, "Wrapped Ether", "WETH",
+                   reads.get(WETH_SEPOLIA))
 
 print("═" * 50)
 print("TRADING READINESS")
@@ -5,9 +5,16 @@ All contract addresses sourced from official Uniswap V4 deployment docs:
 https://docs.uniswap.org/contracts/v4/deployments
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # Permit2 is the same address on all chains
 PERMIT2 = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
 
+# Multicall3 is deployed at the same address on all chains
+# Source: https://www.multicall3.com/deployments
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 # Uniswap V3 Factory addresses
 # Source: https://docs.uniswap.org/contracts/v3/reference/deployments/
 V3_FACTORY = "0x1F98431c8aD98523631AE4a59f267346ea31F984"  # Mainnets
@@ -35,6 +42,7 @@ CHAINS = {
         "quoter_v2": "0x61fFE014bA17989E743c5F6cB21bF9697530B21e",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 12,  # seconds, receipt poll interval
     },
     8453: {
         "name": "Base",
@@ -48,6 +56,7 @@ CHAINS = {
         "weth": "0x4200000000000000000000000000000000000006",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 2,
     },
     42161: {
         "name": "Arbitrum",
@@ -61,6 +70,7 @@ CHAINS = {
         "weth": "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 0.25,
     },
     137: {
         "name": "Polygon",
@@ -74,6 +84,7 @@ CHAINS = {
         "weth": "0x7ceB23fD6bC0adD59E62ac25578270cFf1b9f619",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 2,
     },
     10: {
         "name": "Optimism",
@@ -87,6 +98,7 @@ CHAINS = {
         "weth": "0x4200000000000000000000000000000000000006",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 2,
     },
     84532: {
         "name": "Base Sepolia",
@@ -100,6 +112,7 @@ CHAINS = {
         "weth": "0x4200000000000000000000000000000000000006",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 2,
     },
     421614: {
         "name": "Arbitrum Sepolia",
@@ -114,6 +127,7 @@ CHAINS = {
         "weth": "0x980B62Da83eFf3D4576C647993b0c1D7faf17c73",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 0.25,
     },
     11155111: {
         "name": "Ethereum Sepolia",
@@ -127,8 +141,11 @@ CHAINS = {
         "weth": "0xfFf9976782d46CC05630D1f6eBAb18b2324d6B14",
         "usdc_decimals": 6,
         "weth_decimals": 18,
+        "block_time": 12,
     },
 }
+# Read-only: chain config is fixed for the life of the process
+CHAINS = MappingProxyType(CHAINS)
 
 # Gas reserve — NEVER let native ETH drop below this on any chain
 GAS_RESERVE_ETH = 0.01  # 0.01 ETH minimum retained for gas
@@ -145,9 +162,13 @@ STOP_FLAG = "/tmp/trader_stop"
 SELL_ALL_FLAG = "/tmp/trader_sell_all"
 STATE_FILE = "/tmp/multi_positions.json"
 WALLET_FILE = "/tmp/bot_wallet.json"
-TRADES_FILE = "/tmp/bot_trades.json"
+TRADES_FILE = "/tmp/bot_trades.jsonl"  # one JSON trade per line
+# Pre-JSONL trade history (one JSON array); converted into TRADES_FILE on
+# startup by trades_log.migrate_legacy_trades()
+LEGACY_TRADES_FILE = "/tmp/bot_trades.json"
 
 
+@lru_cache(maxsize=32)
 def get_chain_config(chain_id):
     """Get config for a specific chain, raises if not supported."""
     if chain_id not in CHAINS:
@@ -0,0 +1,24 @@
+"""
+Active-executor count shared by the single-pair controllers.
+"""
+
+
+class ActiveExecutorCount:
+    """
+    Mixin for controllers that gate new positions on how many executors are
+    still active.
+
+    The strategy replaces `executors_info` with a fresh list of immutable
+    ExecutorInfo snapshots on every report, so the count only needs
+    recomputing when that list object changes.
+    """
+
+    _counted_infos = None
+    _active_count = 0
+
+    def active_executor_count(self) -> int:
+        infos = self.executors_info
+        if infos is not self._counted_infos:
+            self._counted_infos = infos
+            self._active_count = sum(1 for e in infos if e.is_active)
+        return self._active_count
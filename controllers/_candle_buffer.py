@@ -0,0 +1,77 @@
+"""
+Incremental float64 mirror of a candles feed.
+Keeps close/high/low/volume columns in sync with the feed by converting only
+candles that are new since the previous tick.
+"""
+
+import numpy as np
+
+_CLOSE, _HIGH, _LOW, _VOLUME = range(4)
+
+
+class CandleBuffer:
+    """
+    Float64 close/high/low/volume columns for the candles most recently
+    passed to sync().
+
+    Each sync() walks back from the newest candle to the last timestamp it
+    has already seen, overwrites that slot (the newest candle is usually
+    still forming) and appends anything newer. A feed that jumped past the
+    buffered history, or whose window grew backwards, is rebuilt in full.
+    """
+
+    def __init__(self):
+        self._cols = np.empty((4, 0))
+        self._n = 0
+        self._last_ts = None
+
+    def sync(self, candles):
+        """Update from candles (oldest first) and return (closes, highs, lows,
+        volumes) views covering exactly those candles."""
+        size = len(candles)
+        start = self._resume_index(candles)
+        if start is None or self._n < start or self._cols.shape[1] < size:
+            self._rebuild(candles)
+        else:
+            self._put(self._n - 1, candles[start - 1])
+            for candle in candles[start:]:
+                self._append(candle, size)
+        self._last_ts = candles[-1].timestamp
+
+        window = self._cols[:, self._n - size:self._n]
+        return window[_CLOSE], window[_HIGH], window[_LOW], window[_VOLUME]
+
+    def _resume_index(self, candles):
+        """Index of the first candle newer than the last one synced, or None
+        if the feed no longer contains that candle."""
+        if self._last_ts is None or self._n == 0:
+            return None
+        i = len(candles)
+        while i > 0 and candles[i - 1].timestamp > self._last_ts:
+            i -= 1
+        if i == 0 or candles[i - 1].timestamp != self._last_ts:
+            return None
+        return i
+
+    def _rebuild(self, candles):
+        size = len(candles)
+        self._cols = np.empty((4, max(2 * size, 1)))
+        self._n = 0
+        for candle in candles:
+            self._put(self._n, candle)
+            self._n += 1
+
+    def _append(self, candle, size):
+        if self._n == self._cols.shape[1]:
+            # Slide the live window back to the front instead of growing
+            self._cols[:, :size - 1] = self._cols[:, self._n - size + 1:self._n]
+            self._n = size - 1
+        self._put(self._n, candle)
+        self._n += 1
+
+    def _put(self, i, candle):
+        cols = self._cols
+        cols[_CLOSE, i] = float(candle.close)
+        cols[_HIGH, i] = float(candle.high)
+        cols[_LOW, i] = float(candle.low)
+        cols[_VOLUME, i] = float(candle.volume)
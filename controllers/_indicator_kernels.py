@@ -0,0 +1,83 @@
+"""
+Indicator kernels for the candle-based controllers.
+Numba-compiled loops over float64 candle arrays; callers convert candles to
+arrays once per tick and wrap the scalar results back into Decimal.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def rsi_last(closes, period):
+    """RSI from the simple average gain/loss of the last `period` changes.
+    NaN if there are fewer than period + 1 closes."""
+    n = closes.shape[0]
+    if n < period + 1:
+        return np.nan
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else 50.0
+    rs = gain / loss  # the 1/period factors cancel
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True, fastmath=True)
+def macd_last(closes, fast, slow, signal_period):
+    """(macd, signal, histogram) for the last close, in a single pass: both
+    EMAs and the signal line (EMA of their difference, seeded with the mean
+    of its first `signal_period` values) advance together."""
+    n = closes.shape[0]
+    a_fast = 2.0 / (fast + 1.0)
+    a_slow = 2.0 / (slow + 1.0)
+    a_sig = 2.0 / (signal_period + 1.0)
+    total = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    diff = 0.0
+    diff_total = 0.0
+    signal = 0.0
+    for i in range(n):
+        total += closes[i]
+        if i < fast:
+            ema_fast = total / (i + 1)
+        else:
+            ema_fast = closes[i] * a_fast + ema_fast * (1.0 - a_fast)
+        if i < slow:
+            ema_slow = total / (i + 1)
+        else:
+            ema_slow = closes[i] * a_slow + ema_slow * (1.0 - a_slow)
+        diff = ema_fast - ema_slow
+        if i < signal_period:
+            diff_total += diff
+            signal = diff_total / (i + 1)
+        else:
+            signal = diff * a_sig + signal * (1.0 - a_sig)
+    return diff, signal, diff - signal
+
+
+@njit(cache=True, fastmath=True)
+def std_last(values, period):
+    """Population standard deviation of the last `period` values."""
+    window = values[max(values.shape[0] - period, 0):]
+    if window.shape[0] == 0:
+        return 0.0
+    mean = window.sum() / window.shape[0]
+    var = 0.0
+    for x in window:
+        var += (x - mean) * (x - mean)
+    return np.sqrt(var / window.shape[0])
+
+
+@njit(cache=True, fastmath=True)
+def min_max_last(highs, lows, lookback):
+    """(lowest low, highest high) over the last `lookback` candles."""
+    start = max(highs.shape[0] - lookback, 0)
+    return lows[start:].min(), highs[start:].max()
@@ -6,6 +6,7 @@ Professional-grade strategy using multiple technical indicators and market micro
 from decimal import Decimal
 from typing import List, Optional
 
+import numpy as np
 from pydantic import Field
 
 from hummingbot.core.data_type.common import MarketDict, PriceType, TradeType
@@ -17,6 +18,20 @@ from hummingbot.strategy_v2.executors.position_executor.data_types import (
 )
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
 
+from controllers._active_executors import ActiveExecutorCount
+from controllers._candle_buffer import CandleBuffer
+from controllers._indicator_kernels import (
+    macd_last,
+    min_max_last,
+    rsi_last,
+    std_last,
+)
+
+
+def _dec(x) -> Decimal:
+    """Kernel float result as a Decimal, for the Decimal-typed outputs."""
+    return Decimal(str(float(x)))
+
 
 class AdvancedTradingStrategyConfig(ControllerConfigBase):
     """Professional trading strategy with advanced metrics"""
@@ -122,7 +137,7 @@ class AdvancedTradingStrategyConfig(ControllerConfigBase):
         return markets.add_or_update(self.connector_name, self.trading_pair)
 
 
-class AdvancedTradingStrategy(ControllerBase):
+class AdvancedTradingStrategy(ActiveExecutorCount, ControllerBase):
     """
     Advanced Trading Strategy with Professional Metrics
 
@@ -139,92 +154,43 @@ class AdvancedTradingStrategy(ControllerBase):
         self.config = config
         self.last_trade_timestamp = 0
         self.daily_loss = Decimal("0")
-
-    def _calculate_rsi(self, closes: List[Decimal], period: int) -> Optional[Decimal]:
+        self._candles = CandleBuffer()
+        # TP/SL price multipliers per side; the percentages are fixed for
+        # the life of the config
+        tp = self.config.take_profit_pct / Decimal("100")
+        sl = self.config.stop_loss_pct / Decimal("100")
+        self._tp_mult = {TradeType.BUY: 1 + tp, TradeType.SELL: 1 - tp}
+        self._sl_mult = {TradeType.BUY: 1 - sl, TradeType.SELL: 1 + sl}
+
+    def _calculate_rsi(self, closes: np.ndarray, period: int) -> Optional[Decimal]:
         """Calculate Relative Strength Index"""
         if len(closes) < period + 1:
             return None
-
-        gains = []
-        losses = []
-
-        for i in range(1, len(closes)):
-            change = closes[i] - closes[i - 1]
-            if change > 0:
-                gains.append(change)
-                losses.append(Decimal("0"))
-            else:
-                gains.append(Decimal("0"))
-                losses.append(abs(change))
-
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-
-        if avg_loss == 0:
-            return Decimal("100") if avg_gain > 0 else Decimal("50")
-
-        rs = avg_gain / avg_loss
-        rsi = Decimal("100") - (Decimal("100") / (Decimal("1") + rs))
-        return rsi
+        return _dec(rsi_last(closes, period))
 
     def _calculate_macd(
-        self, closes: List[Decimal]
+        self, closes: np.ndarray
     ) -> tuple[Optional[Decimal], Optional[Decimal], Optional[Decimal]]:
         """Calculate MACD, Signal, and Histogram"""
         if len(closes) < self.config.macd_slow_period:
             return None, None, None
 
-        # EMA calculations
-        ema_fast = self._ema(closes, self.config.macd_fast_period)
-        ema_slow = self._ema(closes, self.config.macd_slow_period)
-
-        macd = ema_fast - ema_slow
-
-        signal_values = [
-            ema_fast - ema_slow for ema_fast, ema_slow in
-            zip(
-                self._ema_series(closes, self.config.macd_fast_period),
-                self._ema_series(closes, self.config.macd_slow_period)
-            )
-        ]
-        signal = self._ema(signal_values, self.config.macd_signal_period)
-        histogram = macd - signal
-
-        return macd, signal, histogram
-
-    def _ema(self, values: List[Decimal], period: int) -> Decimal:
-        """Calculate Exponential Moving Average"""
-        if len(values) < period:
-            return sum(values) / len(values)
-        multiplier = Decimal("2") / (Decimal(period) + Decimal("1"))
-        ema = sum(values[:period]) / period
-        for value in values[period:]:
-            ema = value * multiplier + ema * (Decimal("1") - multiplier)
-        return ema
-
-    def _ema_series(self, values: List[Decimal], period: int) -> List[Decimal]:
-        """Calculate EMA series"""
-        if len(values) < period:
-            return [Decimal("0")] * len(values)
-        result = []
-        multiplier = Decimal("2") / (Decimal(period) + Decimal("1"))
-        ema = sum(values[:period]) / period
-        for i, value in enumerate(values):
-            if i < period:
-                result.append(sum(values[:i+1]) / (i+1))
-            else:
-                ema = value * multiplier + ema * (Decimal("1") - multiplier)
-                result.append(ema)
-        return result
+        macd, signal, histogram = macd_last(
+            closes,
+            self.config.macd_fast_period,
+            self.config.macd_slow_period,
+            self.config.macd_signal_period,
+        )
+        return _dec(macd), _dec(signal), _dec(histogram)
 
     def _find_support_resistance(
-        self, highs: List[Decimal], lows: List[Decimal]
+        self, highs: np.ndarray, lows: np.ndarray
     ) -> tuple[Decimal, Decimal]:
         """Identify support and resistance levels"""
-        lookback = min(self.config.support_resistance_lookback, len(highs))
-        support = min(lows[-lookback:])
-        resistance = max(highs[-lookback:])
-        return support, resistance
+        support, resistance = min_max_last(
+            highs, lows, self.config.support_resistance_lookback
+        )
+        return _dec(support), _dec(resistance)
 
     async def update_processed_data(self):
         """Calculate all technical indicators"""
@@ -238,13 +204,12 @@ class AdvancedTradingStrategy(ControllerBase):
             self.processed_data = {"signal": "NEUTRAL", "can_trade": False}
             return
 
-        closes = [candle.close for candle in candles]
-        highs = [candle.high for candle in candles]
-        lows = [candle.low for candle in candles]
-        volumes = [candle.volume for candle in candles]
+        # float64 views over the candles; only new or updated candles are
+        # converted, indicators run on these arrays
+        closes, highs, lows, volumes = self._candles.sync(candles)
 
-        current_price = closes[-1]
-        current_volume = volumes[-1]
+        current_price = candles[-1].close
+        current_volume = candles[-1].volume
 
         # ========== CALCULATE INDICATORS ==========
 
@@ -252,20 +217,20 @@ class AdvancedTradingStrategy(ControllerBase):
         rsi = self._calculate_rsi(closes, self.config.rsi_period)
 
         # MACD
-        macd, signal, histogram = self._calculate_macd(closes)
+        macd, macd_signal_val, histogram = self._calculate_macd(closes)
 
         # Volume MA
-        volume_ma = sum(volumes[-self.config.volume_ma_period:]) / self.config.volume_ma_period
+        volume_ma = _dec(volumes[-self.config.volume_ma_period:].mean())
         volume_confirmed = current_volume > volume_ma * self.config.min_volume_multiplier
 
         # Support/Resistance
         support, resistance = self._find_support_resistance(highs, lows)
 
         # Price change
-        price_change_pct = ((current_price - closes[-50]) / closes[-50]) * Decimal("100")
+        price_change_pct = _dec((closes[-1] / closes[-50] - 1.0) * 100.0)
 
         # Bollinger Bands
-        bb_ma = sum(closes[-self.config.bb_period:]) / self.config.bb_period
+        bb_ma = _dec(closes[-self.config.bb_period:].sum() / self.config.bb_period)
         bb_std = self._std_dev(closes[-self.config.bb_period:])
         bb_upper = bb_ma + (bb_std * self.config.bb_std_dev)
         bb_lower = bb_ma - (bb_std * self.config.bb_std_dev)
@@ -276,7 +241,7 @@ class AdvancedTradingStrategy(ControllerBase):
         # BUY Signals
         if (
             rsi and rsi < self.config.rsi_lower_threshold and  # Oversold
-            macd and signal and histogram < 0 and  # MACD bearish
+            histogram is not None and histogram < 0 and  # MACD bearish
             volume_confirmed and  # Strong volume
             current_price > support and  # Above support
             price_change_pct.abs() > self.config.price_change_threshold  # Significant move
@@ -286,7 +251,7 @@ class AdvancedTradingStrategy(ControllerBase):
         # SELL Signals
         elif (
             rsi and rsi > self.config.rsi_upper_threshold and  # Overbought
-            macd and signal and histogram > 0 and  # MACD bullish
+            histogram is not None and histogram > 0 and  # MACD bullish
             volume_confirmed and  # Strong volume
             current_price < resistance and  # Below resistance
             price_change_pct.abs() > self.config.price_change_threshold  # Significant move
@@ -299,7 +264,7 @@ class AdvancedTradingStrategy(ControllerBase):
             "current_price": current_price,
             "rsi": rsi,
             "macd": macd,
-            "macd_signal": signal,
+            "macd_signal": macd_signal_val,
             "macd_histogram": histogram,
             "volume_confirmed": volume_confirmed,
             "support": support,
@@ -329,7 +294,7 @@ class AdvancedTradingStrategy(ControllerBase):
             return []
 
         # Count active positions
-        active_positions = len([e for e in self.executors_info if e.is_active])
+        active_positions = self.active_executor_count()
 
         # Only trade if below max positions
         if active_positions < self.config.max_concurrent_positions and signal != "NEUTRAL":
@@ -341,20 +306,8 @@ class AdvancedTradingStrategy(ControllerBase):
             amount = self.config.position_size_quote / current_price
 
             # Calculate stop loss and take profit
-            if side == TradeType.BUY:
-                sl_price = current_price * (
-                    1 - (self.config.stop_loss_pct / Decimal("100"))
-                )
-                tp_price = current_price * (
-                    1 + (self.config.take_profit_pct / Decimal("100"))
-                )
-            else:
-                sl_price = current_price * (
-                    1 + (self.config.stop_loss_pct / Decimal("100"))
-                )
-                tp_price = current_price * (
-                    1 - (self.config.take_profit_pct / Decimal("100"))
-                )
+            sl_price = current_price * self._sl_mult[side]
+            tp_price = current_price * self._tp_mult[side]
 
             # Create executor
             config = PositionExecutorConfig(
@@ -380,10 +333,6 @@ class AdvancedTradingStrategy(ControllerBase):
         return actions
 
     @staticmethod
-    def _std_dev(values: List[Decimal]) -> Decimal:
+    def _std_dev(values: np.ndarray) -> Decimal:
         """Calculate standard deviation"""
-        if not values:
-            return Decimal("0")
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return variance.sqrt()
+        return _dec(std_last(values, len(values)))
@@ -15,6 +15,8 @@ from hummingbot.strategy_v2.controllers import ControllerBase, ControllerConfigB
 from hummingbot.strategy_v2.executors.order_executor.data_types import ExecutionStrategy, OrderExecutorConfig
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
 
+from controllers._active_executors import ActiveExecutorCount
+
 
 class DCAStrategyConfig(ControllerConfigBase):
     """Configuration for DCA Strategy"""
@@ -48,7 +50,7 @@ class DCAStrategyConfig(ControllerConfigBase):
         return markets.add_or_update(self.connector_name, self.trading_pair)
 
 
-class DCAStrategy(ControllerBase):
+class DCAStrategy(ActiveExecutorCount, ControllerBase):
     """
     Dollar Cost Averaging Strategy
 
@@ -70,7 +72,7 @@ class DCAStrategy(ControllerBase):
         )
 
         # Count active orders
-        active_executors = len([e for e in self.executors_info if e.is_active])
+        active_executors = self.active_executor_count()
 
         self.processed_data = {
             "mid_price": price,
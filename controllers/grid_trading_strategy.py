@@ -7,6 +7,7 @@ Ideal for sideways/ranging markets.
 from decimal import Decimal
 from typing import List
 
+import numpy as np
 from pydantic import Field
 
 from hummingbot.core.data_type.common import MarketDict, PriceType, TradeType
@@ -70,7 +71,15 @@ class GridTradingStrategy(ControllerBase):
         super().__init__(config, *args, **kwargs)
         self.config = config
         self.grid_prices = self._calculate_grid_prices()
-        self.placed_orders = set()
+        # Fixed for the life of the controller: sorted float prices for the
+        # side split, per-level amounts, and which levels already have orders
+        self._grid_prices_f = np.linspace(
+            float(self.config.lower_price),
+            float(self.config.upper_price),
+            self.config.grid_levels,
+        )
+        self._grid_amounts = [self.config.grid_amount_quote / p for p in self.grid_prices]
+        self._placed_mask = np.zeros(len(self.grid_prices), dtype=bool)
 
     def _calculate_grid_prices(self) -> List[Decimal]:
         """Calculate evenly spaced price grid"""
@@ -101,35 +110,31 @@ class GridTradingStrategy(ControllerBase):
         - SELL orders above current price
         """
         actions = []
-        current_price = self.processed_data["current_price"]
+        current_price = float(self.processed_data["current_price"])
 
-        for grid_price in self.grid_prices:
-            # Skip if order already placed for this price
-            if grid_price in self.placed_orders:
-                continue
+        # Grid prices ascend: levels before buy_end are below the current
+        # price (BUY), levels from sell_start on are above it (SELL), and
+        # anything in between sits at the current price and is skipped
+        buy_end = np.searchsorted(self._grid_prices_f, current_price, side="left")
+        sell_start = np.searchsorted(self._grid_prices_f, current_price, side="right")
 
-            # Determine order side based on price
-            if grid_price < current_price:
-                # Below current price - BUY
+        # Only levels without an order yet
+        for idx in np.flatnonzero(~self._placed_mask):
+            if idx < buy_end:
                 side = TradeType.BUY
-            elif grid_price > current_price:
-                # Above current price - SELL
+            elif idx >= sell_start:
                 side = TradeType.SELL
             else:
-                # At current price - skip
                 continue
 
-            # Calculate amount
-            amount = self.config.grid_amount_quote / grid_price
-
             # Create position executor
             config = PositionExecutorConfig(
                 timestamp=self.processed_data["time"],
                 connector_name=self.config.connector_name,
                 trading_pair=self.config.trading_pair,
                 side=side,
-                entry_price=grid_price,
-                amount=amount,
+                entry_price=self.grid_prices[idx],
+                amount=self._grid_amounts[idx],
             )
 
             actions.append(CreateExecutorAction(
@@ -138,6 +143,6 @@ class GridTradingStrategy(ControllerBase):
             ))
 
             # Mark as placed
-            self.placed_orders.add(grid_price)
+            self._placed_mask[idx] = True
 
         return actions
@@ -18,6 +18,8 @@ from hummingbot.strategy_v2.executors.position_executor.data_types import (
 )
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
 
+from controllers._active_executors import ActiveExecutorCount
+
 
 class MomentumStrategyConfig(ControllerConfigBase):
     """Configuration for Momentum Trading Strategy"""
@@ -83,7 +85,7 @@ class MomentumStrategyConfig(ControllerConfigBase):
         return markets.add_or_update(self.connector_name, self.trading_pair)
 
 
-class MomentumStrategy(ControllerBase):
+class MomentumStrategy(ActiveExecutorCount, ControllerBase):
     """
     Momentum Trading Strategy
 
@@ -96,6 +98,12 @@ class MomentumStrategy(ControllerBase):
     def __init__(self, config: MomentumStrategyConfig, *args, **kwargs):
         super().__init__(config, *args, **kwargs)
         self.config = config
+        # TP/SL price multipliers per side; the percentages are fixed for
+        # the life of the config
+        tp = self.config.take_profit_pct / Decimal("100")
+        sl = self.config.stop_loss_pct / Decimal("100")
+        self._tp_mult = {TradeType.BUY: 1 + tp, TradeType.SELL: 1 - tp}
+        self._sl_mult = {TradeType.BUY: 1 - sl, TradeType.SELL: 1 + sl}
 
     async def update_processed_data(self):
         """Calculate moving averages and momentum signals"""
@@ -115,8 +123,9 @@ class MomentumStrategy(ControllerBase):
             }
             return
 
-        # Get closing prices
-        closes = [candle.close for candle in candles_data]
+        # Get closing prices (only the MA windows are ever read)
+        window = max(self.config.short_window, self.config.long_window)
+        closes = [candle.close for candle in candles_data[-window:]]
 
         # Calculate simple moving averages
         short_ma = sum(closes[-self.config.short_window:]) / self.config.short_window
@@ -149,7 +158,7 @@ class MomentumStrategy(ControllerBase):
         signal = self.processed_data["signal"]
 
         # Count active positions
-        active_executors = len([e for e in self.executors_info if e.is_active])
+        active_executors = self.active_executor_count()
 
         # Only open new positions if below max
         if active_executors < self.config.max_positions:
@@ -164,17 +173,8 @@ class MomentumStrategy(ControllerBase):
             amount = self.config.position_amount_quote / self.processed_data["price"]
 
             # Create position executor with stop loss and take profit
-            tp_price = self.processed_data["price"] * (
-                1 + (self.config.take_profit_pct / Decimal("100"))
-            ) if side == TradeType.BUY else self.processed_data["price"] * (
-                1 - (self.config.take_profit_pct / Decimal("100"))
-            )
-
-            sl_price = self.processed_data["price"] * (
-                1 - (self.config.stop_loss_pct / Decimal("100"))
-            ) if side == TradeType.BUY else self.processed_data["price"] * (
-                1 + (self.config.stop_loss_pct / Decimal("100"))
-            )
+            tp_price = self.processed_data["price"] * self._tp_mult[side]
+            sl_price = self.processed_data["price"] * self._sl_mult[side]
 
             config = PositionExecutorConfig(
                 timestamp=self.market_data_provider.time(),
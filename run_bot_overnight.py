@@ -14,6 +14,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 from web3 import Web3
 
+from config.trading_config import TRADES_FILE
+
 load_dotenv(Path("/home/sauly/hummingbot/.env.local"))
 load_dotenv(Path("/home/sauly/hummingbot/mcp/.env"))
 
@@ -48,8 +50,8 @@ def log_trade(trade_type, price, amount, status="pending"):
     }
     trades.append(trade)
 
-    with open("/tmp/bot_trades.json", "w") as f:
-        json.dump(trades, f, indent=2)
+    with open(TRADES_FILE, "a") as f:
+        f.write(json.dumps(trade) + "\n")
 
     print(f"  📝 {trade_type.upper()} @ ${price:.4f} | Amount: {amount:.4f} | Status: {status}")
 
@@ -184,7 +186,7 @@ def print_summary():
 
     print(f"""
 ✅ Bot completed overnight session
-   Check /tmp/bot_trades.json for full trade history
+   Check {TRADES_FILE} for full trade history
 """)
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+import unittest
+from collections import namedtuple
+from decimal import Decimal
+
+import numpy as np
+
+from controllers._candle_buffer import CandleBuffer
+
+Candle = namedtuple("Candle", "timestamp close high low volume")
+
+
+def make_candle(ts, close):
+    return Candle(ts, Decimal(str(close)), Decimal(str(close + 1)), Decimal(str(close - 1)), Decimal(10))
+
+
+class CandleBufferTest(unittest.TestCase):
+
+    def assert_matches(self, candles, columns):
+        closes, highs, lows, volumes = columns
+        np.testing.assert_array_equal([float(c.close) for c in candles], closes)
+        np.testing.assert_array_equal([float(c.high) for c in candles], highs)
+        np.testing.assert_array_equal([float(c.low) for c in candles], lows)
+        np.testing.assert_array_equal([float(c.volume) for c in candles], volumes)
+
+    def test_first_sync(self):
+        candles = [make_candle(ts, 100 + ts) for ts in range(5)]
+        self.assert_matches(candles, CandleBuffer().sync(candles))
+
+    def test_rolling_window_updates_forming_candle(self):
+        buffer = CandleBuffer()
+        candles = [make_candle(ts, 100 + ts) for ts in range(5)]
+        buffer.sync(candles)
+
+        # The newest candle is still forming and changes in place
+        candles[-1] = make_candle(4, 99)
+        self.assert_matches(candles, buffer.sync(candles))
+
+        # A fixed-size feed drops its oldest candle for every new one;
+        # enough ticks to slide the window back more than once
+        for ts in range(5, 40):
+            candles = candles[1:] + [make_candle(ts, 100 + ts % 7)]
+            self.assert_matches(candles, buffer.sync(candles))
+
+    def test_growing_feed(self):
+        buffer = CandleBuffer()
+        candles = [make_candle(0, 100)]
+        buffer.sync(candles)
+        for ts in range(1, 20):
+            candles.append(make_candle(ts, 100 + ts))
+            self.assert_matches(candles, buffer.sync(candles))
+
+    def test_feed_past_buffered_history_is_rebuilt(self):
+        buffer = CandleBuffer()
+        buffer.sync([make_candle(ts, 100 + ts) for ts in range(5)])
+
+        candles = [make_candle(ts, 200 + ts) for ts in range(50, 55)]
+        self.assert_matches(candles, buffer.sync(candles))
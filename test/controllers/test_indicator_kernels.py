@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from controllers._indicator_kernels import macd_last, min_max_last, rsi_last, std_last
+
+
+def reference_ema_series(values, period):
+    """Running mean over the first `period` values, EMA after that."""
+    alpha = 2.0 / (period + 1.0)
+    out = []
+    total = 0.0
+    ema = 0.0
+    for i, x in enumerate(values):
+        total += x
+        if i < period:
+            ema = total / (i + 1)
+        else:
+            ema = x * alpha + ema * (1.0 - alpha)
+        out.append(ema)
+    return out
+
+
+class IndicatorKernelsTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 200))
+
+    def test_rsi_last(self):
+        closes = np.array([10.0, 11.0, 10.5, 12.0, 11.0])
+        # Gains 1.0 + 1.5, losses 0.5 + 1.0 over the last four changes
+        self.assertAlmostEqual(100.0 - 100.0 / (1.0 + 2.5 / 1.5), rsi_last(closes, 4))
+
+    def test_rsi_last_edge_cases(self):
+        self.assertTrue(np.isnan(rsi_last(np.array([1.0, 2.0]), 14)))
+        self.assertEqual(100.0, rsi_last(np.arange(20, dtype=np.float64), 14))
+        self.assertEqual(50.0, rsi_last(np.ones(20), 14))
+
+    def test_macd_last(self):
+        closes = list(self.closes)
+        fast = reference_ema_series(closes, 12)
+        slow = reference_ema_series(closes, 26)
+        diff = [f - s for f, s in zip(fast, slow)]
+        signal = reference_ema_series(diff, 9)[-1]
+
+        macd, macd_signal, histogram = macd_last(self.closes, 12, 26, 9)
+
+        self.assertAlmostEqual(diff[-1], macd)
+        self.assertAlmostEqual(signal, macd_signal)
+        self.assertAlmostEqual(diff[-1] - signal, histogram)
+
+    def test_std_last(self):
+        self.assertAlmostEqual(np.std(self.closes[-20:]), std_last(self.closes, 20))
+        self.assertAlmostEqual(np.std(self.closes), std_last(self.closes, 1000))
+        self.assertEqual(0.0, std_last(np.empty(0), 20))
+
+    def test_min_max_last(self):
+        highs = self.closes + 1.0
+        lows = self.closes - 1.0
+        low, high = min_max_last(highs, lows, 30)
+        self.assertEqual(lows[-30:].min(), low)
+        self.assertEqual(highs[-30:].max(), high)
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import autonomous_trader
+from autonomous_trader import AutonomousTrader
+
+
+class AutonomousTraderStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        state_file = os.path.join(self.tmp_dir.name, "state.json")
+        patcher = patch.multiple(
+            autonomous_trader,
+            STATE_FILE=state_file,
+            STATE_JOURNAL_FILE=f"{state_file}.log",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def make_trader():
+        # Skip __init__, which connects to RPC endpoints and loads state
+        trader = AutonomousTrader.__new__(AutonomousTrader)
+        trader.positions = {}
+        trader.total_pnl = 0.0
+        trader.trade_count = 0
+        trader.take_profit = 1.1
+        trader.stop_loss = 0.9
+        trader._positions_version = 0
+        trader._pos_index = None
+        trader._journal_ops = 0
+        trader._last_snapshot = 0
+        return trader
+
+    @staticmethod
+    def position(entry_price):
+        return {
+            "symbol": "TKN",
+            "entry_price_usd": entry_price,
+            "take_profit_price": entry_price * 1.1,
+            "stop_loss_price": entry_price * 0.9,
+        }
+
+    def test_replay_set_clear_and_totals_entries(self):
+        trader = self.make_trader()
+        key_a = (8453, "0xaaa")
+        key_b = (1, "0xbbb")
+
+        trader.positions[key_a] = [self.position(1.0)]
+        trader._journal("set", key_a)
+        trader.positions = {}
+        trader.trade_count = 1
+        trader._journal("clear")
+        trader.positions[key_b] = [self.position(2.0)]
+        trader._journal("set", key_b)
+        trader.total_pnl = -0.25
+        trader.trade_count = 2
+        trader._journal("totals")
+
+        restored = self.make_trader()
+        restored._load_state()
+
+        self.assertEqual({key_b: [self.position(2.0)]}, restored.positions)
+        self.assertEqual(-0.25, restored.total_pnl)
+        self.assertEqual(2, restored.trade_count)
+        self.assertEqual(4, restored._journal_ops)
+
+    def test_replay_set_with_no_positions_drops_key(self):
+        trader = self.make_trader()
+        key = (8453, "0xaaa")
+
+        trader.positions[key] = [self.position(1.0)]
+        trader._journal("set", key)
+        trader.positions[key] = []
+        trader._journal("set", key)
+
+        restored = self.make_trader()
+        restored._load_state()
+
+        self.assertEqual({}, restored.positions)
+
+    def test_snapshot_journal_reload_round_trip(self):
+        trader = self.make_trader()
+        key_a = (8453, "0xaaa")
+        key_b = (1, "0xbbb")
+        trader.positions[key_a] = [self.position(1.0), self.position(1.5)]
+        trader.total_pnl = 3.0
+        trader.trade_count = 4
+        trader._save_state(force=True)
+
+        with open(autonomous_trader.STATE_JOURNAL_FILE) as f:
+            self.assertEqual("", f.read())
+
+        # Changes after the snapshot only reach the journal
+        trader.positions[key_a] = [self.position(1.5)]
+        trader.total_pnl = 3.5
+        trader.trade_count = 5
+        trader._journal("set", key_a)
+        trader.positions[key_b] = [self.position(2.0)]
+        trader._journal("set", key_b)
+
+        restored = self.make_trader()
+        restored._load_state()
+
+        self.assertEqual(trader.positions, restored.positions)
+        self.assertEqual(3.5, restored.total_pnl)
+        self.assertEqual(5, restored.trade_count)
+
+        # A new snapshot folds the journal in and truncates it
+        restored._save_state(force=True)
+        self.assertEqual(0, restored._journal_ops)
+        with open(autonomous_trader.STATE_JOURNAL_FILE) as f:
+            self.assertEqual("", f.read())
+
+        reloaded = self.make_trader()
+        reloaded._load_state()
+
+        self.assertEqual(trader.positions, reloaded.positions)
+        self.assertEqual(3.5, reloaded.total_pnl)
+        self.assertEqual(5, reloaded.trade_count)
+
+    def test_load_fills_missing_thresholds(self):
+        trader = self.make_trader()
+        key = (8453, "0xaaa")
+        trader.positions[key] = [{"symbol": "TKN", "entry_price_usd": 2.0}]
+        trader._save_state(force=True)
+
+        restored = self.make_trader()
+        restored._load_state()
+
+        pos = restored.positions[key][0]
+        self.assertAlmostEqual(2.2, pos["take_profit_price"])
+        self.assertAlmostEqual(1.8, pos["stop_loss_price"])
+
+    def test_torn_final_journal_line_is_ignored(self):
+        trader = self.make_trader()
+        key = (8453, "0xaaa")
+        trader.positions[key] = [self.position(1.0)]
+        trader._journal("set", key)
+        with open(autonomous_trader.STATE_JOURNAL_FILE, "a") as f:
+            f.write('{"op": "set", "key": "1:0x')
+
+        restored = self.make_trader()
+        restored._load_state()
+
+        self.assertEqual({key: [self.position(1.0)]}, restored.positions)
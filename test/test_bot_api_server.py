@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import bot_api_server
+from bot_api_server import TradesState
+
+
+def make_trade(trade_type, token, profit=0, status="EXECUTED"):
+    return {"type": trade_type, "token": token, "profit": profit, "status": status}
+
+
+class TradesStateTest(unittest.TestCase):
+
+    def test_empty_snapshot(self):
+        snapshot = TradesState().snapshot()
+
+        self.assertEqual(0, snapshot["version"])
+        self.assertEqual(0, snapshot["total_trades"])
+        self.assertEqual(0, snapshot["win_rate"])
+        self.assertEqual([], snapshot["trades"])
+        self.assertEqual([], snapshot["completed_trades"])
+
+    def test_seed_and_add_aggregate_the_same(self):
+        trades = [
+            make_trade("BUY", "AAA"),
+            make_trade("SELL", "AAA", profit=2.0),
+            make_trade("BUY", "BBB"),
+            make_trade("SELL", "BBB", profit=-0.5),
+            make_trade("BUY", "AAA", status="FAILED"),
+        ]
+        seeded = TradesState(trades)
+        added = TradesState()
+        for t in trades:
+            added.add(t)
+
+        snapshot = seeded.snapshot()
+        self.assertEqual(snapshot, added.snapshot())
+        self.assertEqual(4, snapshot["total_trades"])
+        self.assertEqual(25.0, snapshot["win_rate"])
+        self.assertEqual(1.5, snapshot["total_pnl"])
+        self.assertEqual(2, snapshot["buys"])
+        self.assertEqual(2, snapshot["sells"])
+        self.assertEqual({"AAA": 2.0, "BBB": -0.5}, snapshot["pnl_by_token"])
+        self.assertEqual([trades[1], trades[3]], snapshot["completed_trades"])
+
+    def test_symbol_used_when_token_missing(self):
+        state = TradesState([{"type": "SELL", "symbol": "CCC", "profit": 1.0, "status": "EXECUTED"}])
+
+        self.assertEqual({"CCC": 1.0}, state.snapshot()["pnl_by_token"])
+
+    def test_recent_and_completed_are_bounded(self):
+        state = TradesState(make_trade("SELL", "AAA", profit=i) for i in range(100))
+        snapshot = state.snapshot()
+
+        self.assertEqual(100, snapshot["version"])
+        self.assertEqual(50, len(snapshot["trades"]))
+        self.assertEqual(30, len(snapshot["completed_trades"]))
+        self.assertEqual(99, snapshot["trades"][-1]["profit"])
+
+
+class SyncTradesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.trades_file = os.path.join(self.tmp_dir.name, "trades.jsonl")
+        patcher = patch.multiple(
+            bot_api_server,
+            TRADES_FILE=self.trades_file,
+            trades_state=TradesState(),
+            _trades_offset=0,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def append(self, text):
+        with open(self.trades_file, "a") as f:
+            f.write(text)
+
+    def total_trades(self):
+        bot_api_server._sync_trades(force=True)
+        return bot_api_server.trades_state.snapshot()["total_trades"]
+
+    def test_missing_file_is_empty(self):
+        self.assertEqual(0, self.total_trades())
+
+    def test_folds_lines_appended_by_other_writers(self):
+        self.append(json.dumps(make_trade("BUY", "AAA")) + "\n")
+        self.assertEqual(1, self.total_trades())
+
+        self.append(json.dumps(make_trade("SELL", "AAA", profit=1.0)) + "\n")
+        self.assertEqual(2, self.total_trades())
+        self.assertEqual(1.0, bot_api_server.trades_state.snapshot()["total_pnl"])
+
+    def test_partial_line_waits_for_its_newline(self):
+        line = json.dumps(make_trade("BUY", "AAA"))
+        self.append(line[:10])
+        self.assertEqual(0, self.total_trades())
+
+        self.append(line[10:] + "\n")
+        self.assertEqual(1, self.total_trades())
+
+    def test_truncated_file_is_refolded(self):
+        self.append(json.dumps(make_trade("BUY", "AAA")) + "\n")
+        self.append(json.dumps(make_trade("BUY", "BBB")) + "\n")
+        self.assertEqual(2, self.total_trades())
+
+        with open(self.trades_file, "w") as f:
+            f.write(json.dumps(make_trade("BUY", "CCC")) + "\n")
+        self.assertEqual(1, self.total_trades())
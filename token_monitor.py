@@ -5,7 +5,9 @@ Polls balanceOf() for tracked addresses, compares against TokenRegistry.
 New tokens trigger the LiquidityScout pipeline.
 """
 
-from web3 import Web3
+import functools
+
+from eth_utils import to_checksum_address
 
 from token_registry import TokenRegistry
 
@@ -44,6 +46,13 @@ ERC20_ABI = [
 MIN_VALUE_USD = 1.0
 
 
+@functools.lru_cache(maxsize=8192)
+def _checksum(addr):
+    """EIP-55 checksum, memoized; scan() re-checksums every registry
+    token on each pass."""
+    return to_checksum_address(addr)
+
+
 class TokenMonitor:
     def __init__(self, w3, wallet_address, chain_id, registry=None,
                  watch_list=None):
@@ -56,25 +65,25 @@ class TokenMonitor:
             watch_list: Optional list of token addresses to actively poll
         """
         self.w3 = w3
-        self.wallet = Web3.to_checksum_address(wallet_address)
+        self.wallet = _checksum(wallet_address)
         self.chain_id = chain_id
         self.chain_key = str(chain_id)
         self.registry = registry or TokenRegistry()
         self.watch_list = set()
         if watch_list:
             for addr in watch_list:
-                self.watch_list.add(Web3.to_checksum_address(addr))
+                self.watch_list.add(_checksum(addr))
 
         # Track known balances: {address: balance_raw}
         self._known_balances = {}
 
     def add_watch(self, token_address):
         """Add a token address to the watch list."""
-        self.watch_list.add(Web3.to_checksum_address(token_address))
+        self.watch_list.add(_checksum(token_address))
 
     def remove_watch(self, token_address):
         """Remove a token address from the watch list."""
-        self.watch_list.discard(Web3.to_checksum_address(token_address))
+        self.watch_list.discard(_checksum(token_address))
 
     def scan(self):
         """
@@ -88,7 +97,7 @@ class TokenMonitor:
         db_tokens = self.registry.get_all_tokens(chain=self.chain_key)
         all_addresses = set(self.watch_list)
         for t in db_tokens:
-            all_addresses.add(Web3.to_checksum_address(t['address']))
+            all_addresses.add(_checksum(t['address']))
 
         for token_addr in all_addresses:
             try:
@@ -149,7 +158,7 @@ class TokenMonitor:
     def get_balance(self, token_address):
         """Get current balance of a specific token."""
         try:
-            addr = Web3.to_checksum_address(token_address)
+            addr = _checksum(token_address)
             contract = self.w3.eth.contract(address=addr, abi=ERC20_ABI)
             decimals = contract.functions.decimals().call()
             balance = contract.functions.balanceOf(self.wallet).call()
@@ -162,7 +171,7 @@ class TokenMonitor:
         balances = {}
         db_tokens = self.registry.get_all_tokens(chain=self.chain_key)
         for t in db_tokens:
-            addr = Web3.to_checksum_address(t['address'])
+            addr = _checksum(t['address'])
             human, raw, decimals = self.get_balance(addr)
             if human > 0:
                 balances[addr.lower()] = {
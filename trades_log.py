@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+TRADES LOG — Helpers for the shared TRADES_FILE (one JSON trade per line).
+Used by every process that reads the trade history, so whichever starts
+first converts the pre-JSONL file.
+"""
+
+import json
+import os
+
+from config.trading_config import LEGACY_TRADES_FILE, TRADES_FILE
+
+
+def migrate_legacy_trades():
+    """Convert a LEGACY_TRADES_FILE JSON array into TRADES_FILE lines, once.
+    The old file is renamed aside before it is read, so when two processes
+    start together only one of them converts it. Legacy trades predate
+    anything in TRADES_FILE, so they go first."""
+    claimed = f"{LEGACY_TRADES_FILE}.migrated"
+    try:
+        os.rename(LEGACY_TRADES_FILE, claimed)
+    except FileNotFoundError:
+        return
+    try:
+        with open(claimed) as f:
+            trades = json.load(f)
+    except ValueError:
+        return
+    if not isinstance(trades, list) or not trades:
+        return
+
+    lines = "".join(json.dumps(t) + "\n" for t in trades)
+    try:
+        with open(TRADES_FILE) as f:
+            lines += f.read()
+    except FileNotFoundError:
+        pass
+    tmp = f"{TRADES_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(lines)
+    os.replace(tmp, TRADES_FILE)
+    print(f"  Migrated {len(trades)} trades from {LEGACY_TRADES_FILE} to {TRADES_FILE}")
+
+
+def read_trades():
+    """All trades in TRADES_FILE, oldest first. Blank lines and a torn
+    trailing line (a write still in progress) are skipped."""
+    trades = []
+    try:
+        with open(TRADES_FILE) as f:
+            for line in f:
+                try:
+                    trades.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return trades
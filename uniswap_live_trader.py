@@ -18,6 +18,8 @@ from dotenv import load_dotenv
 from eth_account import Account
 from web3 import Web3
 
+from trades_log import migrate_legacy_trades, read_trades
+
 load_dotenv(Path("/home/sauly/hummingbot/.env.local"))
 load_dotenv(Path("/home/sauly/hummingbot/mcp/.env"))
 
@@ -398,8 +400,8 @@ class UniswapLiveTrader:
         # Restore open positions from trade history
         open_positions = []
         try:
-            with open("/tmp/bot_trades.json") as f:
-                trades = json.load(f)
+            migrate_legacy_trades()
+            trades = read_trades()
             buys = [t for t in trades if t['type'] == 'BUY']
             sells = [t for t in trades if t['type'] == 'SELL']
             unmatched = len(buys) - len(sells)